@@ -0,0 +1,119 @@
+"""Measure the memory taken by each comment and thumbnail object parsed from the comment
+and result pages recorded in the cassettes, compared with the same attributes stored in an
+instance dict, and the memory taken by each row of a ThumbnailTable holding the thumbnails.
+
+python -m benchmarks.boxes --copies 20
+"""
+
+import argparse
+import copy
+import gc
+import sys
+import tracemalloc
+
+from moddb.boxes import (
+    _COMMENTS_STRAINER,
+    _RESULTS_STRAINER,
+    ThumbnailTable,
+    _parse_comments,
+    _parse_results,
+)
+from moddb.utils import soup
+
+from .cassettes import load_pages
+
+
+class Plain:
+    """An object storing its attributes in an instance dict"""
+
+
+def attributes(obj):
+    """Get the attributes of a slotted object"""
+    slots = [name for cls in type(obj).__mro__ for name in cls.__dict__.get("__slots__", ())]
+    return {name: getattr(obj, name) for name in slots if hasattr(obj, name)}
+
+
+def flatten(comments):
+    for comment in comments:
+        yield comment
+        yield from flatten(comment.children)
+
+
+def collect():
+    """Get the objects of the biggest comment and result lists in the cassettes"""
+    comments, thumbnails = [], []
+    for url, html in load_pages().items():
+        results = _parse_results(soup(html, parse_only=_RESULTS_STRAINER))[0]
+        if len(results) > len(thumbnails):
+            thumbnails = results
+
+        try:
+            results = _parse_comments(soup(html, parse_only=_COMMENTS_STRAINER), url)[0]
+        except Exception:
+            continue
+
+        if len(results) > len(comments):
+            comments = results
+
+    comments = list(flatten(comments))
+    return {
+        "Comment": comments,
+        "CommentAuthor": [comment.author for comment in comments if comment.author],
+        "Thumbnail": thumbnails,
+    }
+
+
+def allocated(build, objects, copies):
+    """Get the average size in bytes allocated to build each copy of an object, the
+    attribute values themselves are shared."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = [build(obj) for _ in range(copies) for obj in objects]
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return size / len(kept)
+
+
+def table_allocated(thumbnails, copies):
+    """Get the average size in bytes allocated for each row of a table holding copies of
+    the thumbnails, the strings are shared with the thumbnails."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    table = ThumbnailTable(thumbnail for _ in range(copies) for thumbnail in thumbnails)
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return size / len(table)
+
+
+def plain(obj):
+    new = Plain()
+    new.__dict__.update(attributes(obj))
+    return new
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--copies", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'class':<16}{'objects':>8}{'dict (B)':>10}{'slots (B)':>11}")
+    for name, objects in collect().items():
+        objects = [obj for obj in objects if type(obj).__name__ == name]
+        slots = allocated(copy.copy, objects, args.copies)
+        dict_ = allocated(plain, objects, args.copies)
+        print(f"{name:<16}{len(objects):>8}{dict_:>10.0f}{slots:>11.0f}")
+
+    thumbnails = collect()["Thumbnail"]
+    for thumbnail in thumbnails:
+        for name in ("name", "summary"):
+            value = getattr(thumbnail, name)
+            setattr(thumbnail, name, None if value is None else sys.intern(str(value)))
+
+    row = table_allocated(thumbnails, args.copies)
+    print(f"{'ThumbnailTable':<16}{len(thumbnails):>8}{'':>10}{row:>11.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""Helpers to get the html recorded in the test cassettes. Reading them needs pyyaml, which is
+installed with the dev requirements or the ``replay`` extra."""
+
+import glob
+import os
+
+import yaml
+
+CASSETTES = os.path.join(os.path.dirname(__file__), os.pardir, "tests", "cassettes")
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def load_pages(*directories):
+    """Get the body of every successful GET returning html in the cassettes of the
+    given test directories, e.g. ``test_mod``, keyed by url. Every directory is used
+    if none are given."""
+    pattern = os.path.join(CASSETTES, "{}", "*.yaml")
+    paths = []
+    for directory in directories or ["*"]:
+        paths.extend(sorted(glob.glob(pattern.format(directory))))
+
+    pages = {}
+    for path in paths:
+        with open(path) as f:
+            cassette = yaml.load(f, Loader=Loader)
+
+        for interaction in cassette.get("interactions", []):
+            request, response = interaction["request"], interaction["response"]
+            if request["method"] != "GET" or response["status"]["code"] != 200:
+                continue
+
+            body = response["body"].get("string", "")
+            if isinstance(body, bytes):
+                body = body.decode("utf-8", "replace")
+
+            if "<html" in body[:2000].lower():
+                pages.setdefault(request["uri"], body)
+
+    return pages
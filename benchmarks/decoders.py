@@ -0,0 +1,84 @@
+"""Time the decoders on every date and view count found in the pages recorded in the cassettes,
+against the implementations they replaced which tried several ``strptime`` formats and compiled
+their pattern on every call.
+
+python -m benchmarks.decoders --rounds 5
+"""
+
+import argparse
+import datetime
+import re
+import time
+
+from moddb.decoders import _parse_date, parse_date, parse_views
+
+from .cassettes import load_pages
+
+DATE = re.compile(r'datetime="([0-9]{4}-[0-9]{2}[^"]*)"')
+VIEWS = re.compile(r">([0-9,]+ \([0-9,]+ today\))<")
+
+
+def previous_get_date(d):
+    try:
+        return datetime.datetime.strptime(d[:-3] + d[-2:], "%Y-%m-%dT%H:%M:%S%z")
+    except ValueError:
+        pass
+
+    try:
+        return datetime.datetime.strptime(d, "%Y-%m-%d")
+    except ValueError:
+        pass
+
+    return datetime.datetime.strptime(d, "%Y-%m")
+
+
+def previous_get_views(string):
+    matches = re.search(r"^([0-9,]*) \(([0-9,]*) today\)$", string)
+    views = int(matches.group(1).replace(",", ""))
+    today = int(matches.group(2).replace(",", ""))
+
+    return views, today
+
+
+def samples(pattern):
+    """Get every match of the pattern in the cassettes, in order of appearance and with
+    repeats, as they would be met while parsing."""
+    return [match for html in load_pages().values() for match in pattern.findall(html)]
+
+
+def bench(func, strings, rounds, clear=None):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        if clear is not None:
+            clear()
+
+        for string in strings:
+            func(string)
+
+    return (time.perf_counter() - start) / (len(strings) * rounds) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    dates = samples(DATE)
+    views = samples(VIEWS)
+    for date in dates:
+        assert previous_get_date(date) == parse_date(date), date
+
+    for string in views:
+        assert previous_get_views(string) == parse_views(string), string
+
+    print(f"{len(dates)} dates, {len(set(dates))} unique")
+    print(f"previous dates {bench(previous_get_date, dates, args.rounds):.2f}us")
+    print(f"uncached dates {bench(_parse_date.__wrapped__, dates, args.rounds):.2f}us")
+    print(f"cached dates   {bench(parse_date, dates, args.rounds, _parse_date.cache_clear):.2f}us")
+    print(f"{len(views)} view counts")
+    print(f"previous views {bench(previous_get_views, views, args.rounds):.2f}us")
+    print(f"views          {bench(parse_views, views, args.rounds):.2f}us")
+
+
+if __name__ == "__main__":
+    main()
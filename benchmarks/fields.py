@@ -0,0 +1,43 @@
+"""Measure how long each section of the Mod, Game and Member pages recorded in the
+cassettes takes to parse, on top of the attributes that are always parsed.
+
+python -m benchmarks.fields --rounds 5
+"""
+
+import argparse
+import time
+
+from moddb.utils import soup
+
+from .parsers import MODELS, model_pages
+
+
+def bench(model, trees, rounds, fields):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for html in trees:
+            model(html, fields=fields)
+
+    return (time.perf_counter() - start) / (len(trees) * rounds) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    for name, pages in model_pages().items():
+        model = MODELS[name]
+        trees = [soup(html) for html in pages]
+        sections = sorted(model(trees[0], lazy=True)._pending)
+
+        base = bench(model, trees, args.rounds, ())
+        full = bench(model, trees, args.rounds, None)
+        print(f"{name} ({len(trees)} pages): no sections {base:.2f}ms, all sections {full:.2f}ms")
+        for section in sections:
+            cost = bench(model, trees, args.rounds, {section}) - base
+            print(f"    {section:<14}{cost:>8.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
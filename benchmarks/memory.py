@@ -0,0 +1,50 @@
+"""Measure the memory kept alive by the Mod, Game and Member models built from the pages
+recorded in the cassettes, with and without releasing their html.
+
+python -m benchmarks.memory --copies 5
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from moddb.utils import soup
+
+from .parsers import MODELS, model_pages
+
+
+def retained(model, pages, copies, lean):
+    """Get the average size in KiB of the memory still allocated for each model once
+    it is built."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+
+    models = []
+    for _ in range(copies):
+        for html in pages:
+            models.append(model(soup(html)))
+            if lean:
+                models[-1].release()
+
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return size / len(models) / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--copies", type=int, default=5)
+    args = parser.parse_args()
+
+    pages = model_pages()
+    print(f"{'model':<10}{'pages':>6}{'default (KiB)':>16}{'lean (KiB)':>14}")
+    for name, model in MODELS.items():
+        default = retained(model, pages[name], args.copies, False)
+        lean = retained(model, pages[name], args.copies, True)
+        print(f"{name:<10}{len(pages[name]):>6}{default:>16.1f}{lean:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
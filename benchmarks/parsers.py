@@ -0,0 +1,87 @@
+"""Compare the bs4 tree builders on the Mod, Game and Member pages recorded in the cassettes.
+
+python -m benchmarks.parsers --rounds 5
+"""
+
+import argparse
+import time
+
+import bs4
+
+import moddb
+from moddb.utils import get_page_type, soup
+
+from .cassettes import load_pages
+
+MODELS = {"mod": moddb.Mod, "game": moddb.Game, "member": moddb.Member}
+PARSERS = ["html.parser", "lxml", "html5lib"]
+
+
+def model_pages():
+    pages = {name: [] for name in MODELS}
+    for url, html in load_pages("test_mod", "test_game", "test_member").items():
+        path = url.split("?")[0]
+        if path.count("/") != 4:
+            continue
+
+        page_type = get_page_type(path).name
+        if page_type not in pages:
+            continue
+
+        try:
+            MODELS[page_type](soup(html))
+        except Exception:
+            continue
+
+        pages[page_type].append(html)
+
+    return pages
+
+
+def bench(parser, model, pages, rounds):
+    """Get the average time in ms it takes to build the tree of a page and to build
+    the model from that tree."""
+    tree = build = 0
+    for _ in range(rounds):
+        for html in pages:
+            start = time.perf_counter()
+            html = soup(html, parser=parser)
+            middle = time.perf_counter()
+            model(html)
+            end = time.perf_counter()
+
+            tree += middle - start
+            build += end - middle
+
+    count = len(pages) * rounds
+    return tree / count * 1000, build / count * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    pages = model_pages()
+    available = []
+    for name in PARSERS:
+        try:
+            bs4.BeautifulSoup("", name)
+            available.append(name)
+        except bs4.FeatureNotFound:
+            print(f"{name} is not installed, skipping")
+
+    print(
+        f"{'model':<10}{'parser':<14}{'pages':>6}{'tree (ms)':>12}{'model (ms)':>12}{'total (ms)':>12}"
+    )
+    for name, model in MODELS.items():
+        for parser in available:
+            tree, build = bench(parser, model, pages[name], args.rounds)
+            print(
+                f"{name:<10}{parser:<14}{len(pages[name]):>6}"
+                f"{tree:>12.2f}{build:>12.2f}{tree + build:>12.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Measure the overhead of acquiring a ratelimit that never has to wait.
+
+python -m benchmarks.ratelimits --calls 20000
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+from moddb.utils import Ratelimit, SharedTokenBucket, TokenBucket
+
+
+def bench(limiter, calls):
+    timings = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        limiter.call()
+        timings.append(time.perf_counter() - start)
+
+    timings.sort()
+    return {
+        "mean": statistics.fmean(timings) * 1e6,
+        "p50": timings[len(timings) // 2] * 1e6,
+        "p99": timings[int(len(timings) * 0.99)] * 1e6,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=20000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "ratelimits.sqlite")
+        limiters = {
+            "Ratelimit": Ratelimit(10**9, 1),
+            "TokenBucket": TokenBucket(10**9, 1),
+            "SharedTokenBucket": SharedTokenBucket(10**9, 1, path=path),
+        }
+
+        print(f"{'limiter':<20}{'mean (us)':>12}{'p50 (us)':>12}{'p99 (us)':>12}")
+        for name, limiter in limiters.items():
+            result = bench(limiter, args.calls)
+            print(f"{name:<20}{result['mean']:>12.2f}{result['p50']:>12.2f}{result['p99']:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
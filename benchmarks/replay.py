@@ -0,0 +1,168 @@
+"""Measure the throughput of the whole request, ratelimit and parsing pipeline with the
+responses recorded in the cassettes served by a CassetteAdapter mounted on moddb.SESSION.
+
+python -m benchmarks.replay --latency 0.05 0.2 --error-rate 0.01 --rate 20
+
+Three scenarios are run: parse_page on every recorded model page, get_all_results on a
+recorded list whose pages are all served from its first page, and File.save on every
+recorded file with a generated download of --download-size bytes.
+"""
+
+import argparse
+import io
+import re
+import time
+
+import requests
+
+import moddb
+import moddb.utils
+from moddb.cache import normalize_url
+from moddb.errors import ModdbException
+from moddb.replay import CassetteAdapter
+from moddb.utils import TokenBucket, get_page_type, join
+
+from .cassettes import CASSETTES
+
+LIST_STATS = re.compile(rb"\(([0-9,]+) - ([0-9,]+) of ([0-9,]+)\)")
+MODELS = ("mod", "game", "engine", "member", "file", "media", "article", "platform")
+
+
+def recorded_urls(adapter):
+    return [url for method, url in adapter._recordings if method == "GET"]
+
+
+def run(func, items):
+    """Call func on every item, get the number of calls that worked and how long it took."""
+    done = 0
+    start = time.perf_counter()
+    for item in items:
+        try:
+            func(item)
+            done += 1
+        except (
+            ModdbException,
+            requests.RequestException,
+            KeyError,
+            AttributeError,
+            TypeError,
+        ) as e:
+            moddb.LOGGER.info("Failed on %s: %s", item, e)
+
+    return done, time.perf_counter() - start
+
+
+def report(name, count, done, elapsed, unit="pages"):
+    print(f"{name:<18}{done:>5}/{count:<5}{elapsed:>8.2f}s{done / elapsed:>10.1f} {unit}/s")
+
+
+def model_urls(adapter):
+    urls = []
+    for url in recorded_urls(adapter):
+        if "?" in url or url.count("/") < 4 or "/page/" in url:
+            continue
+
+        try:
+            if get_page_type(url).name in MODELS:
+                urls.append(url)
+        except (KeyError, IndexError):
+            continue
+
+    return urls
+
+
+def as_page(content, page, per_page, total):
+    """Change the heading of the first page of a list so that it reads as another page."""
+    start = (page - 1) * per_page + 1
+    end = min(page * per_page, total)
+    return LIST_STATS.sub(f"({start} - {end} of {total:,})".encode(), content, count=1)
+
+
+def list_url(adapter, max_pages):
+    """Find the first page of a recorded list of a few pages and serve it for each page of
+    the list that was not recorded."""
+    for url in recorded_urls(adapter):
+        base, _, query = url.partition("?")
+        if not base.endswith("/page/1"):
+            continue
+
+        try:
+            results = moddb.parse_results(url)
+        except (ModdbException, requests.RequestException):
+            continue
+
+        if 1 < results.total_pages <= max_pages and len(results):
+            first = adapter._recordings[("GET", url)][0]
+            for page in range(2, results.total_pages + 1):
+                page_url = f"{base[: -len('1')]}{page}?{query}"
+                if ("GET", normalize_url(page_url)) not in adapter._recordings:
+                    content = as_page(first.content, page, len(results), results.total_results)
+                    adapter.add("GET", page_url, content, headers=first.headers)
+
+            return url, results.total_pages
+
+    return None, 0
+
+
+def prepare_downloads(adapter, files, size):
+    """Serve a download page and a generated file of the given size for each file."""
+    payload = b"\0" * size
+    for file in files:
+        mirror = f"/downloads/mirror/{file.id}/1"
+        adapter.add(
+            "GET",
+            f"{moddb.BASE_URL}/downloads/start/{file.id}",
+            f'<html><body><a href="{mirror}">download {file.filename}</a></body></html>',
+            headers={"Content-Type": "text/html; charset=utf-8"},
+        )
+        adapter.add("GET", join(mirror), payload)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--cassettes", nargs="+", default=[CASSETTES])
+    parser.add_argument("--latency", type=float, nargs="+", default=[0])
+    parser.add_argument("--error-rate", type=float, default=0)
+    parser.add_argument("--rate", type=float, default=1000, help="requests per second allowed")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--max-pages", type=int, default=20)
+    parser.add_argument("--download-size", type=int, default=10_000_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    latency = args.latency[0] if len(args.latency) == 1 else tuple(args.latency)
+    adapter = CassetteAdapter.from_cassettes(*args.cassettes, seed=args.seed)
+    adapter.mount()
+    print(f"{len(adapter)} recorded responses")
+
+    moddb.utils.GLOBAL_THROTLE = TokenBucket(args.rate, 1, burst=args.rate, sleep=60)
+    moddb.utils.GLOBAL_LIMITER = TokenBucket(args.rate, 1, burst=args.rate, sleep=60)
+
+    url, pages = list_url(adapter, args.max_pages)
+    adapter.latency, adapter.error_rate = latency, args.error_rate
+
+    urls = model_urls(adapter)
+    done, elapsed = run(moddb.parse_page, urls)
+    report("parse_page", len(urls), done, elapsed)
+
+    if url is not None:
+        results = moddb.parse_results(url)
+        for concurrency in sorted({1, args.concurrency}):
+            done, elapsed = run(
+                lambda results: results.get_all_results(concurrency=concurrency), [results]
+            )
+            report(f"get_all_results/{concurrency}", pages, done * pages, elapsed)
+
+    adapter.latency, adapter.error_rate = 0, 0
+    files = [moddb.parse_page(url) for url in urls if get_page_type(url).name == "file"]
+    prepare_downloads(adapter, files, args.download_size)
+    adapter.latency, adapter.error_rate = latency, args.error_rate
+
+    done, elapsed = run(lambda file: file.save(io.BytesIO()), files)
+    report("File.save", len(files), done, elapsed, "files")
+    print(f"{done * args.download_size / elapsed / 1024 ** 2:.1f} MiB/s downloaded")
+    print(adapter)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Time get_page_type on every link found in the pages recorded in the cassettes, against the
+implementation it replaced which compiled its pattern and built its mapping on every call. The
+previous implementation failed on some links, such as audio pages, those are only timed with
+the router.
+
+python -m benchmarks.router --rounds 5
+"""
+
+import argparse
+import re
+import time
+
+from moddb.enums import ThumbnailType
+from moddb.router import get_page_type
+from moddb.utils import LOGGER, join
+
+from .cassettes import load_pages
+
+LINK = re.compile(r'href="(/[a-z]+/[^"#?]+|https://www\.moddb\.com/[a-z]+/[^"#?]+)"')
+
+
+def previous_get_page_type(url):
+    regex = r"\/((?!page|pages\b)\b\w+)\/"
+    type_mapping = {
+        "new": "article",
+        "feature": "article",
+        "tutorial": "article",
+        "download": "file",
+        "image": "media",
+        "audio": " media",
+        "video": "media",
+    }
+
+    matches = re.findall(regex, url)
+    match = matches[-1][0:-1] if matches[0].endswith("s") else matches[0]
+
+    try:
+        page_type = ThumbnailType[match]
+    except KeyError:
+        page_type = ThumbnailType[type_mapping[match]]
+
+    LOGGER.info("%s is type %s", url, page_type)
+    return page_type
+
+
+def links():
+    """Get every link of the cassettes that points to a page with a type, in order of
+    appearance and with repeats, as they would be met while parsing."""
+    urls = []
+    for html in load_pages().values():
+        for url in LINK.findall(html):
+            url = join(url)
+            try:
+                get_page_type.__wrapped__(url)
+            except (KeyError, IndexError):
+                continue
+
+            urls.append(url)
+
+    return urls
+
+
+def previous_links(urls):
+    """Get the links the previous implementation could classify, checking that it agrees
+    with the router on them."""
+    supported = []
+    for url in urls:
+        try:
+            page_type = previous_get_page_type(url)
+        except (KeyError, IndexError):
+            continue
+
+        assert page_type is get_page_type(url), url
+        supported.append(url)
+
+    return supported
+
+
+def bench(func, urls, rounds, clear=None):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        if clear is not None:
+            clear()
+
+        for url in urls:
+            func(url)
+
+    return (time.perf_counter() - start) / (len(urls) * rounds) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    urls = links()
+    supported = previous_links(urls)
+
+    print(f"{len(urls)} links, {len(set(urls))} unique")
+    print(f"{len(urls) - len(supported)} links the previous implementation failed on")
+    print(f"previous       {bench(previous_get_page_type, supported, args.rounds):.2f}us")
+    cold = bench(get_page_type.__wrapped__, urls, args.rounds)
+    print(f"uncached       {cold:.2f}us")
+    print(
+        f"cached         {bench(get_page_type, urls, args.rounds, get_page_type.cache_clear):.2f}us"
+    )
+    print(get_page_type.cache_info())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+"""Time the parsing of every model and list recorded in the cassettes, from the html to the
+built object, and compare the results to a saved baseline.
+
+python -m benchmarks.suite --rounds 5 --save baseline.json
+python -m benchmarks.suite --rounds 5 --compare baseline.json --threshold 0.1
+python -m benchmarks.suite --profile --budget 0.2 --dump slow
+
+Reading the cassettes takes longer than running the suite, ``--pages`` keeps the html they
+contain in a json file the first time it is used and reads it from there afterwards.
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+import bs4
+
+import moddb
+from moddb.boxes import _COMMENTS_STRAINER, _RESULTS_STRAINER, _parse_comments, _parse_results
+from moddb.utils import PARSER, get_page_type, soup
+
+from .cassettes import load_pages
+
+#: Version of the json written by --save
+FORMAT = 1
+
+MODELS = {
+    "mod": moddb.Mod,
+    "game": moddb.Game,
+    "engine": moddb.Engine,
+    "member": moddb.Member,
+    "file": moddb.File,
+    "media": moddb.Media,
+    "article": moddb.Article,
+    "platform": moddb.Platform,
+}
+
+
+def model(cls):
+    return lambda html, url: cls(soup(html))
+
+
+def results(html, url):
+    return _parse_results(soup(html, parse_only=_RESULTS_STRAINER))
+
+
+def comments(html, url):
+    return _parse_comments(soup(html, parse_only=_COMMENTS_STRAINER), url)
+
+
+TARGETS = {name: model(cls) for name, cls in MODELS.items()}
+TARGETS["_parse_results"] = results
+TARGETS["_parse_comments"] = comments
+
+
+def read_pages(path=None):
+    """Get the html of the cassettes keyed by url, from the json file at path if it exists.
+    The file is created if it does not."""
+    if path is not None and os.path.exists(path):
+        with open(path) as f:
+            return json.load(f)
+
+    pages = load_pages()
+    if path is not None:
+        with open(path, "w") as f:
+            json.dump(pages, f)
+
+    return pages
+
+
+def target_pages(pages):
+    """Sort the pages by the targets that can parse them. Pages a target fails on are left
+    out, as are lists and comments that come back empty."""
+    found = {name: [] for name in TARGETS}
+    for url, html in pages.items():
+        path = url.split("?")[0]
+        try:
+            page_type = get_page_type(path).name
+        except (KeyError, IndexError):
+            page_type = None
+
+        for name, func in TARGETS.items():
+            if name in MODELS and name != page_type:
+                continue
+
+            try:
+                parsed = func(html, path)
+            except Exception:
+                continue
+
+            if name in MODELS or len(parsed[0]) > 0:
+                found[name].append((path, html))
+
+    return found
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def bench(func, pages, rounds):
+    """Time each parse of the pages and measure the peak memory of parsing a single page."""
+    samples = []
+    for _ in range(rounds):
+        for url, html in pages:
+            start = time.perf_counter()
+            func(html, url)
+            samples.append(time.perf_counter() - start)
+
+    peak = 0
+    tracemalloc.start()
+    for url, html in pages:
+        gc.collect()
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        func(html, url)
+        peak = max(peak, tracemalloc.get_traced_memory()[1] - before)
+    tracemalloc.stop()
+
+    size = sum(len(html) for _, html in pages) * rounds
+    total = sum(samples)
+    return {
+        "pages": len(pages),
+        "pages_per_second": len(samples) / total,
+        "mib_per_second": size / total / 1024**2,
+        "p50_ms": percentile(samples, 0.5) * 1000,
+        "p99_ms": percentile(samples, 0.99) * 1000,
+        "peak_kib": peak / 1024,
+    }
+
+
+def environment():
+    return {
+        "python": platform.python_version(),
+        "bs4": bs4.__version__,
+        "parser": PARSER,
+        "platform": platform.platform(),
+    }
+
+
+def compare(results, baseline, threshold):
+    """Print the change of each metric against the baseline and get the targets whose p50
+    or p99 went up by more than the threshold."""
+    regressions = []
+    print(f"\n{'target':<18}{'p50':>10}{'p99':>10}{'peak':>10}{'pages/s':>10}")
+    for name, result in results.items():
+        previous = baseline["results"].get(name)
+        if previous is None:
+            print(f"{name:<18}{'new':>10}")
+            continue
+
+        ratios = {
+            key: result[key] / previous[key] - 1 if previous[key] else 0.0
+            for key in ("p50_ms", "p99_ms", "peak_kib", "pages_per_second")
+        }
+        print(
+            f"{name:<18}{ratios['p50_ms']:>+10.1%}{ratios['p99_ms']:>+10.1%}"
+            f"{ratios['peak_kib']:>+10.1%}{ratios['pages_per_second']:>+10.1%}"
+        )
+        if ratios["p50_ms"] > threshold or ratios["p99_ms"] > threshold:
+            regressions.append(name)
+
+    if baseline.get("environment") != environment():
+        print(
+            "\nthe baseline was recorded in a different environment:", baseline.get("environment")
+        )
+
+    return regressions
+
+
+def profile(pages, names, budget, dump):
+    """Parse every model page once and report the cost of each of their sections."""
+    with moddb.ParseProfiler(budget, dump=dump) as profiler:
+        for name in names:
+            for url, html in pages.get(name, []) if name in MODELS else []:
+                TARGETS[name](html, url)
+
+    print(profiler.format())
+    for slow in profiler.slow:
+        print(f"\n{slow['model']} {slow['duration'] * 1000:.1f}ms {slow['path'] or ''}")
+        for section, duration in sorted(slow["sections"].items(), key=lambda x: -x[1]):
+            print(f"    {section:<14}{duration * 1000:>8.2f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--pages", help="json file keeping the html of the cassettes")
+    parser.add_argument("--only", nargs="+", choices=list(TARGETS), help="targets to run")
+    parser.add_argument("--save", help="write the results to this json file")
+    parser.add_argument("--compare", help="compare the results to this json file")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="slowdown of p50 or p99 over which a target is reported as a regression",
+    )
+    parser.add_argument(
+        "--profile", action="store_true", help="report the time spent in each section of the models"
+    )
+    parser.add_argument("--budget", type=float, help="seconds over which a model is reported")
+    parser.add_argument("--dump", help="directory the html of the models over budget goes to")
+    args = parser.parse_args()
+
+    pages = target_pages(read_pages(args.pages))
+    if args.profile:
+        profile(pages, args.only or list(MODELS), args.budget, args.dump)
+        return
+
+    results = {}
+    print(
+        f"{'target':<18}{'pages':>6}{'pages/s':>10}{'MiB/s':>8}{'p50 (ms)':>10}"
+        f"{'p99 (ms)':>10}{'peak (KiB)':>12}"
+    )
+    for name in args.only or TARGETS:
+        if not pages[name]:
+            print(f"{name:<18}{0:>6}")
+            continue
+
+        result = results[name] = bench(TARGETS[name], pages[name], args.rounds)
+        print(
+            f"{name:<18}{result['pages']:>6}{result['pages_per_second']:>10.1f}"
+            f"{result['mib_per_second']:>8.2f}{result['p50_ms']:>10.2f}"
+            f"{result['p99_ms']:>10.2f}{result['peak_kib']:>12.0f}"
+        )
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(
+                {"format": FORMAT, "environment": environment(), "results": results}, f, indent=4
+            )
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print("\nregressions:", ", ".join(regressions))
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
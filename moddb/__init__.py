@@ -2,15 +2,21 @@ from curl_adapter import CurlCffiAdapter
 import requests
 
 from .base import front_page, login, logout, parse_page, parse_results, rss, search, search_tags
+from .cache import ModelCache, ResponseCache
 from .client import Client, TwoFactorAuthClient, Thread
 from .enums import *
+from .metrics import MetricsRegistry
 from .pages import *
+from .profiler import ParseProfiler
 from .utils import BASE_URL, LOGGER, Object, get_page, request, soup
 
 SESSION = requests.Session()
 SESSION.mount("http://", CurlCffiAdapter())
 SESSION.mount("https://", CurlCffiAdapter())
 
+RESPONSE_CACHE = None
+MODEL_CACHE = None
+
 __version__ = "0.14.0"
 
 __all__ = [
@@ -25,6 +31,10 @@ __all__ = [
     "Client",
     "TwoFactorAuthClient",
     "Thread",
+    "ModelCache",
+    "ResponseCache",
+    "MetricsRegistry",
+    "ParseProfiler",
     "BASE_URL",
     "LOGGER",
     "Object",
@@ -0,0 +1,17 @@
+from .base import get_all_results, parse_page, parse_results, parse_thumbnail, search, to_page
+from .utils import close, get_page, get_session, request
+
+SESSION = None
+
+__all__ = [
+    "parse_page",
+    "parse_results",
+    "parse_thumbnail",
+    "search",
+    "to_page",
+    "get_all_results",
+    "close",
+    "get_page",
+    "get_session",
+    "request",
+]
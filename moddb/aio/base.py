@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any, Collection, Tuple
+
+import requests
+
+from ..base import _model_from_page, _results_from_response, _search_request, _search_results
+from ..boxes import _RESULTS_STRAINER
+from ..cache import (
+    _build_model,
+    _cache_model,
+    _cached_model,
+    _conditional_request,
+    _revalidated_model,
+)
+from .utils import get_page, request
+
+if TYPE_CHECKING:
+    from ..boxes import ModDBList, ResultList, Thumbnail
+    from ..enums import SearchCategory
+
+
+__all__ = [
+    "search",
+    "parse_page",
+    "parse_results",
+    "to_page",
+    "get_all_results",
+    "parse_thumbnail",
+]
+
+
+async def search(
+    search_category: SearchCategory,
+    *,
+    query: str = None,
+    sort: Tuple[str, str] = None,
+    page: int = 1,
+    **filters,
+) -> ResultList:
+    """Awaitable version of :func:`moddb.search`, takes the same parameters.
+
+    Returns
+    --------
+    ResultList
+        The search object containing the current query settings, pagination metadata and
+        helper methods to navigate the list of results.
+    """
+    url, params = _search_request(search_category, query=query, sort=sort, page=page, **filters)
+    html = await get_page(url, params=params, parse_only=_RESULTS_STRAINER)
+
+    return _search_results(search_category, html, params)
+
+
+async def parse_page(url: str, *, fields: Collection[str] = None, lean: bool = False) -> Any:
+    """Awaitable version of :func:`moddb.parse_page`.
+
+    Parameters
+    ------------
+    url : str
+        The url to parse
+    fields : Optional[Collection[str]]
+        The only sections of the page to parse right away
+    lean : Optional[bool]
+        Release the html of the page once the model is built
+
+    Returns
+    --------
+    Model
+        The parsed page as the instance of the model the page represents
+    """
+    model = _cached_model(url)
+    if model is not None:
+        return model
+
+    start = time.perf_counter()
+    resp = await request(_conditional_request(url))
+    model = _revalidated_model(url, resp)
+    if model is not None:
+        return model
+
+    model = _build_model(
+        lambda html: _model_from_page(url, html, fields), resp, lean, url=url, start=start
+    )
+    return _cache_model(url, model, resp)
+
+
+async def parse_results(url: str, *, params: dict = {}) -> ResultList:
+    """Awaitable version of :func:`moddb.parse_results`.
+
+    Parameters
+    -----------
+    url : str
+        The url of the result list to parse
+
+    Returns
+    --------
+    ResultList
+        The list of thumbnails
+    """
+    resp = await request(requests.Request("GET", url, params=params))
+    return _results_from_response(resp)
+
+
+async def to_page(results: ModDBList, page: int) -> ModDBList:
+    """Awaitable version of :meth:`ModDBList.to_page`, works for any list type the library returns.
+
+    Parameters
+    -----------
+    results : ModDBList
+        The list to get another page of
+    page : int
+        A page number within the range 1 - max_page inclusive
+
+    Returns
+    --------
+    ModDBList
+        A new list of the same type as the one given containing the desired page
+
+    Raises
+    -------
+    ValueError
+        This page does not exist
+    """
+    results._check_page(page)
+
+    url, params = results._page_request(page=page)
+    html = await get_page(url, params=params, parse_only=results._strainer)
+
+    return results._from_html(html, params)
+
+
+async def get_all_results(results: ModDBList, *, concurrency: int = 5) -> ModDBList:
+    """Awaitable version of :meth:`ModDBList.get_all_results`. Once the first page has been
+    fetched the remaining pages are requested concurrently and the results put back in page order.
+
+    Parameters
+    -----------
+    results : ModDBList
+        The list to get all the results of
+    concurrency : Optional[int]
+        The maximum number of pages to request at the same time. Defaults to 5
+
+    Returns
+    --------
+    ModDBList
+        A list of the same type as the one given containing all the results
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch(page):
+        async with semaphore:
+            return await to_page(first, page)
+
+    first = await to_page(results, 1)
+    pages = await asyncio.gather(*(fetch(page) for page in range(2, first.total_pages + 1)))
+
+    everything = list(first)
+    for page in pages:
+        everything.extend(page)
+
+    last = pages[-1] if pages else first
+    return last._merge_results(everything)
+
+
+async def parse_thumbnail(
+    thumbnail: Thumbnail, *, fields: Collection[str] = None, lean: bool = False
+) -> Any:
+    """Awaitable version of :meth:`Thumbnail.parse`.
+
+    Parameters
+    -----------
+    thumbnail : Thumbnail
+        The thumbnail to parse
+    fields : Optional[Collection[str]]
+        The only sections of the page to parse right away
+    lean : Optional[bool]
+        Release the html of the page once the model is built
+
+    Returns
+    --------
+    Any
+        The model that was parsed
+    """
+    model = _cached_model(thumbnail.url)
+    if model is not None:
+        return model
+
+    start = time.perf_counter()
+    resp = await request(_conditional_request(thumbnail.url))
+    model = _revalidated_model(thumbnail.url, resp)
+    if model is not None:
+        return model
+
+    model = _build_model(
+        thumbnail._model_builder(fields), resp, lean, url=thumbnail.url, start=start
+    )
+    return _cache_model(thumbnail.url, model, resp)
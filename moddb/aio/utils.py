@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+from typing import TYPE_CHECKING, Optional
+
+import requests
+from curl_cffi.requests import AsyncSession
+
+from ..hooks import emit, has_hooks
+from ..utils import _emit_request, prepare_request, ratelimit, raise_for_status, soup
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup, SoupStrainer
+    from curl_cffi.requests import Response
+
+
+def get_session() -> AsyncSession:
+    """Get the async session used by the library, creating it on first use. The session
+    is created lazily so that it is bound to the event loop it is first used in.
+
+    Returns
+    --------
+    curl_cffi.requests.AsyncSession
+        The session all async requests go through
+    """
+    module = sys.modules["moddb.aio"]
+    if module.SESSION is None:
+        module.SESSION = AsyncSession(impersonate="chrome")
+
+    return module.SESSION
+
+
+async def close():
+    """Close the async session, a new one will be created the next time a request is made."""
+    module = sys.modules["moddb.aio"]
+    if module.SESSION is not None:
+        await module.SESSION.close()
+        module.SESSION = None
+
+
+def _to_response(resp: Response, prepped: requests.PreparedRequest) -> requests.Response:
+    """Convert a curl_cffi response to a requests one so that the rest of the library
+    can handle it like any other response."""
+    response = requests.Response()
+    response.status_code = resp.status_code
+    response.headers.update(resp.headers)
+    response.url = str(resp.url)
+    response.encoding = resp.encoding
+    response.reason = resp.reason
+    response.request = prepped
+    response._content = resp.content
+
+    return response
+
+
+@ratelimit("GLOBAL_THROTLE", "GLOBAL_LIMITER")
+async def _send(prepped: requests.PreparedRequest) -> requests.Response:
+    timed = has_hooks("request")
+    start = time.perf_counter()
+    try:
+        resp = await get_session().request(
+            prepped.method, prepped.url, headers=dict(prepped.headers), data=prepped.body
+        )
+    except Exception as e:
+        if timed:
+            _emit_request(prepped, "library", start, error=e)
+        raise
+
+    response = _to_response(resp, prepped)
+    if timed:
+        _emit_request(prepped, "library", start, response)
+
+    raise_for_status(response)
+    return response
+
+
+async def request(req: requests.Request) -> requests.Response:
+    """Awaitable version of :func:`moddb.utils.request`. Cookies are taken from ``moddb.SESSION`` so
+    logging in with :func:`moddb.login` also applies to async requests, likewise ``moddb.RESPONSE_CACHE``
+    is shared with the sync functions.
+
+    Parameters
+    -----------
+    req : requests.Request
+        The request to perform
+
+    Returns
+    -------
+    requests.Response
+        The returned response object
+    """
+    prepped = prepare_request(req, sys.modules["moddb"].SESSION)
+
+    cache = sys.modules["moddb"].RESPONSE_CACHE
+    if cache is None or prepped.method != "GET":
+        return await _send(prepped)
+
+    # the cache reads and writes a sqlite database, which would block the event loop
+    response = await asyncio.to_thread(cache._lookup, prepped)
+    emit("cache", url=prepped.url, hit=response is not None)
+    if response is not None:
+        return response
+
+    return await asyncio.to_thread(cache._store, prepped, await _send(prepped))
+
+
+async def get_page(
+    url: str, *, params: dict = {}, json: bool = False, parse_only: Optional[SoupStrainer] = None
+) -> BeautifulSoup:
+    """Awaitable version of :func:`moddb.utils.get_page`.
+
+    Parameters
+    -----------
+    url : str
+        The url to get
+    params : dict
+        A dictionnary of filters and sorting key-value pairs.
+    json : Optional[bool]
+        Whether the expected response is json, in which case it will not be soup'd
+    parse_only : Optional[bs4.SoupStrainer]
+        Only build the tree for the parts of the page matching this strainer
+
+    Returns
+    -------
+    bs4.BeautifulSoup
+        The parsed html
+    """
+    start = time.perf_counter()
+    resp = await request(requests.Request("GET", url, params=params))
+    if json:
+        return resp.json()
+
+    html = soup(resp.text, parse_only=parse_only)
+    if has_hooks("page"):
+        emit("page", url=url, duration=time.perf_counter() - start)
+
+    return html
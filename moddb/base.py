@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import sys
-from typing import TYPE_CHECKING, Any, Tuple, Union
+from typing import TYPE_CHECKING, Any, Collection, Tuple, Union
 
 import requests
+from bs4 import BeautifulSoup
 
-from .boxes import PartialTag, ResultList, Tag, _parse_results
+from .boxes import _RESULTS_STRAINER, PartialTag, ResultList, Tag, _parse_results
+from .cache import _parse_model
 from .pages import FrontPage, Member
 from .utils import BASE_URL, generate_login_cookies, get_page, get_page_type, request, soup
 
@@ -53,6 +55,21 @@ def search(
         The search object containing the current query settings (so at to be able to redo the search easily),
         pagination metadata and helper methods to navigate the list of results.
     """
+    url, params = _search_request(search_category, query=query, sort=sort, page=page, **filters)
+    html = get_page(url, params=params, parse_only=_RESULTS_STRAINER)
+
+    return _search_results(search_category, html, params)
+
+
+def _search_request(
+    search_category: SearchCategory,
+    *,
+    query: str = None,
+    sort: Tuple[str, str] = None,
+    page: int = 1,
+    **filters,
+) -> Tuple[str, dict]:
+    """Build the url and the query parameters of a search"""
     sort_ready = f"{sort[0]}-{sort[1]}" if sort else None
 
     game = filters.get("game", None)
@@ -70,11 +87,13 @@ def search(
         **filter_parsed,
     }
 
-    html = get_page(
-        url,
-        params=params,
-    )
+    return url, params
 
+
+def _search_results(
+    search_category: SearchCategory, html: BeautifulSoup, params: dict
+) -> ResultList:
+    """Wrap the results of a search page in a ResultList"""
     results, current_page, total_pages, total_results = _parse_results(html)
 
     return ResultList(
@@ -87,26 +106,41 @@ def search(
     )
 
 
-def parse_page(url: str) -> Any:
+def parse_page(url: str, *, fields: Collection[str] = None, lean: bool = False) -> Any:
     """Parse a url and return the appropriate object.
 
     Parameters
     ------------
     url : str
         The url to parse
+    fields : Optional[Collection[str]]
+        The only sections of the page to parse right away, the others are parsed the first
+        time they are accessed. Only supported by the models that have sections: Mod, Game,
+        Engine, Member, File, Addon and Media.
+    lean : Optional[bool]
+        Release the html of the page once the model is built to keep less memory around,
+        see :meth:`moddb.pages.base.BaseMetaClass.release`.
 
     Returns
     --------
     Model
         The parsed page as the instance of the model the page represents, can be anything like
-        Mod or Game
+        Mod or Game. If ``moddb.MODEL_CACHE`` is set and the url has been parsed before
+        the cached model is returned, expired models are revalidated with a conditional
+        request.
     """
+    return _parse_model(url, lambda html: _model_from_page(url, html, fields), lean=lean)
 
-    html = get_page(url)
+
+def _model_from_page(url: str, html: BeautifulSoup, fields: Collection[str] = None) -> Any:
+    """Build the model matching the page type of the url"""
     page_type = get_page_type(url)
 
-    model = getattr(sys.modules["moddb"], page_type.name.title())(html)
-    return model
+    model_class = getattr(sys.modules["moddb"], page_type.name.title())
+    if fields is None:
+        return model_class(html)
+
+    return model_class(html, fields=fields)
 
 
 def parse_results(url: str, *, params: dict = {}) -> ResultList:
@@ -127,7 +161,13 @@ def parse_results(url: str, *, params: dict = {}) -> ResultList:
     """
 
     resp = request(requests.Request("GET", url, params=params))
-    html = soup(resp.text)
+    return _results_from_response(resp)
+
+
+def _results_from_response(resp: requests.Response) -> ResultList:
+    """Parse a response containing a list of results, the url and filters of the
+    list are recovered from the final url of the response."""
+    html = soup(resp.text, parse_only=_RESULTS_STRAINER)
 
     results, current_page, total_pages, total_results = _parse_results(html)
 
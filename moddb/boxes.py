@@ -1,15 +1,34 @@
 from __future__ import annotations
 
+import array
 import collections
+import concurrent.futures
 import datetime
+import functools
 import logging
+import math
 import re
 import sys
-from typing import TYPE_CHECKING, Any, Generic, List, Tuple, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Set,
+    Tuple,
+    TypeVar,
+)
 
 from typing_extensions import Self
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
+from .cache import _parse_model
+from .decoders import parse_abbreviated, parse_count, parse_date, parse_rank, parse_views
 from .enums import (
     AddonCategory,
     ArticleCategory,
@@ -31,17 +50,14 @@ from .utils import (
     BASE_URL,
     LOGGER,
     generate_hash,
-    get,
-    get_date,
     get_list_stats,
     get_page,
     get_page_type,
+    get_search_category,
     get_siteareaid,
-    get_views,
     join,
     normalize,
     time_mapping,
-    unroll_number,
 )
 
 if TYPE_CHECKING:
@@ -111,18 +127,17 @@ class Statistics:
             ),
         )
         self.__dict__.update(
-            {stat.string.lower(): int(normalize(stat.parent.a.string)) for stat in misc}
+            {stat.string.lower(): parse_count(stat.parent.a.string) for stat in misc}
         )
 
         visits = normalize(html.find("h5", string="Visits").parent.a.string)
-        self.visits, self.today = get_views(visits)
+        self.visits, self.today = parse_views(visits)
 
-        rank = normalize(html.find("h5", string="Rank").parent.a.string).split("of")
-        self.rank = int(rank[0].replace(",", ""))
-        self.total = int(rank[1].replace(",", ""))
+        rank = normalize(html.find("h5", string="Rank").parent.a.string)
+        self.rank, self.total = parse_rank(rank)
 
         try:
-            self.updated = get_date(html.find("time", itemprop="dateModified")["datetime"])
+            self.updated = parse_date(html.find("time", itemprop="dateModified")["datetime"])
         except TypeError:
             self.updated = None
 
@@ -198,10 +213,7 @@ class Profile:
         except TypeError:
             url = join(html.find("a", string=self.name)["href"])
 
-        regex = r"\/([a-z]+)\/"
-        matches = re.findall(regex, url)
-        matches.reverse()
-        page_type = SearchCategory[matches[0] if matches[0].endswith("s") else matches[0] + "s"]
+        page_type = get_search_category(url)
 
         self.category = page_type
         profile_raw = html.find("span", string="Profile").parent.parent.parent.find(
@@ -286,7 +298,7 @@ class Profile:
 
             try:
                 d = profile_raw.find("h5", string="Release date").parent.span.time
-                self.release = get_date(d["datetime"])
+                self.release = parse_date(d["datetime"])
             except KeyError:
                 LOGGER.info(
                     "%s %s has not been released",
@@ -369,7 +381,7 @@ class Profile:
 
         if page_type in [SearchCategory.games, SearchCategory.mods]:
             try:
-                self.download_count = unroll_number(
+                self.download_count = parse_abbreviated(
                     html.find("a", class_="downloadautotoggle").span.string
                 )
             except AttributeError:
@@ -454,6 +466,8 @@ class Thumbnail:
 
     """
 
+    __slots__ = ("url", "name", "image", "summary", "date", "type")
+
     def __init__(self, **attrs):
         self.url: str = join(attrs.get("url"))
         self.name: str | None = attrs.get("name", None)
@@ -465,17 +479,42 @@ class Thumbnail:
     def __repr__(self):
         return f"<Thumbnail name={self.name} type={self.type.name}>"
 
-    def parse(self) -> Any:
+    def parse(self, *, fields: Collection[str] = None, lean: bool = False) -> Any:
         """Uses the Thumbnail's mandatory attributes to get the full html of the
         model and parse them with the appropriate object.
 
+        Parameters
+        -----------
+        fields : Optional[Collection[str]]
+            The only sections of the page to parse right away, see :func:`moddb.parse_page`
+        lean : Optional[bool]
+            Release the html of the page once the model is built, see :func:`moddb.parse_page`
+
         Returns
         --------
         Any
             The model that was parsed, can be any model from the list of the ThumbnailType
-            enum.
+            enum. If ``moddb.MODEL_CACHE`` is set and the url has been parsed before the
+            cached model is returned.
         """
-        return getattr(sys.modules["moddb"], self.type.name.title())(get_page(self.url))
+        return _parse_model(self.url, self._model_builder(fields), lean=lean)
+
+    def _model_class(self) -> type:
+        """The model class this thumbnail parses into"""
+        return getattr(sys.modules["moddb"], self.type.name.title())
+
+    def _model_builder(self, fields: Collection[str] = None) -> Callable[[BeautifulSoup], Any]:
+        """The function building the model from the html of the page"""
+        if fields is None:
+            return self._model_class()
+
+        return functools.partial(self._model_class(), fields=fields)
+
+
+#: The part of list pages read by _parse_results and parse_reviews
+_RESULTS_STRAINER = SoupStrainer("div", class_="normalbox browsebox")
+#: The part of pages read by _parse_comments, the url of the page has to be passed separately
+_COMMENTS_STRAINER = SoupStrainer("div", id="comments")
 
 
 def _parse_results(html):
@@ -501,7 +540,7 @@ def _parse_results(html):
                     image=obj.a.img["src"],
                     type=get_page_type(join(obj.a["href"])),
                     summary=summary.string if summary else None,
-                    date=get_date(date["datetime"]) if date and date.string != "TBD" else None,
+                    date=parse_date(date["datetime"]) if date and date.string != "TBD" else None,
                 )
             )
     except (TypeError, KeyError):
@@ -519,7 +558,7 @@ def _parse_results(html):
                     image=None,
                     type=get_page_type(join(url["href"])),
                     summary=content.text,
-                    date=get_date(date["datetime"]) if date and date.string != "TBD" else None,
+                    date=parse_date(date["datetime"]) if date and date.string != "TBD" else None,
                 )
             )
 
@@ -530,7 +569,7 @@ def _parse_results(html):
     return results, current_page, total_page, total_results
 
 
-def _parse_comments(html):
+def _parse_comments(html, url=None):
     comments = []
     comment_box = html.find("div", id="comments")
     if comment_box is None:
@@ -538,10 +577,11 @@ def _parse_comments(html):
 
     current_page, total_page, total_results = get_list_stats(comment_box)
 
-    try:
-        url = html.find("meta", property="og:url")["content"]
-    except TypeError:
-        url = join(html.find("a", itemprop="mainEntityOfPage")["href"])
+    if url is None:
+        try:
+            url = html.find("meta", property="og:url")["content"]
+        except TypeError:
+            url = join(html.find("a", itemprop="mainEntityOfPage")["href"])
 
     comments_raw = comment_box.find("div", class_=["tablecomments"]).find_all(
         "div", class_="row", recursive=False
@@ -585,6 +625,8 @@ class CommentAuthor(Thumbnail):
         Number of comments the user has posted
     """
 
+    __slots__ = ("comment_count",)
+
     def __init__(self, **attrs):
         super().__init__(**attrs)
 
@@ -644,6 +686,28 @@ class Comment:
         contain the page number.
     """
 
+    __slots__ = (
+        "id",
+        "author",
+        "date",
+        "position",
+        "children",
+        "content",
+        "embeds",
+        "karma",
+        "upvote",
+        "downvote",
+        "approved",
+        "developer",
+        "staff",
+        "subscriber",
+        "guest",
+        "location",
+        "_fetch_time",
+        "_hash",
+        "_url",
+    )
+
     def __init__(self, html: BeautifulSoup):
         author = html.find("a", class_="avatar")
         self.id = int(html["id"])
@@ -661,7 +725,7 @@ class Comment:
             type=ThumbnailType.member,
             comment_count=comment_count,
         )
-        self.date = get_date(html.find("time")["datetime"])
+        self.date = parse_date(html.find("time")["datetime"])
         actions = html.find("span", class_="actions")
         self._fetch_time = datetime.datetime.utcnow()
 
@@ -753,6 +817,25 @@ class MissingComment:
     and the comment position, which will have the children of the comment that was deleted attached to it.
     """
 
+    __slots__ = (
+        "id",
+        "author",
+        "date",
+        "position",
+        "children",
+        "content",
+        "embeds",
+        "karma",
+        "upvote",
+        "downvote",
+        "approved",
+        "developer",
+        "staff",
+        "subscriber",
+        "guest",
+        "location",
+    )
+
     def __init__(self, position):
         self.id = None
         self.author = None
@@ -831,7 +914,7 @@ class MemberProfile:
         self.online = bool(profile_raw.find("h5", string="Status"))
         last_online = profile_raw.find("h5", string="Last Online")
         self.last_online = (
-            get_date(last_online.parent.span.time["datetime"]) if last_online else None
+            parse_date(last_online.parent.span.time["datetime"]) if last_online else None
         )
 
         try:
@@ -917,22 +1000,18 @@ class MemberStatistics:
             string=("Watchers", "Activity Points", "Comments", "Tags", "Site visits"),
         )
         self.__dict__.update(
-            {
-                stat.string.lower().replace(" ", "_"): int(normalize(get(stat.parent)))
-                for stat in misc
-            }
+            {stat.string.lower().replace(" ", "_"): parse_count(get(stat.parent)) for stat in misc}
         )
 
         visits = normalize(html.find("h5", string="Visitors").parent.a.string)
-        self.visits, self.today = get_views(visits)
+        self.visits, self.today = parse_views(visits)
 
         time, mapping = html.find("h5", string="Time Online").parent.span.string.strip().split(" ")
         self.time = time_mapping[mapping.replace("s", "")] * int(time)
 
         try:
-            rank = normalize(html.find("h5", string="Rank").parent.span.string).split("of")
-            self.rank = int(rank[0].replace(",", ""))
-            self.total = int(rank[1].replace(",", ""))
+            rank = normalize(html.find("h5", string="Rank").parent.span.string)
+            self.rank, self.total = parse_rank(rank)
         except AttributeError:
             self.rank = 0
             self.total = 0
@@ -969,7 +1048,7 @@ class PlatformStatistics:
         html_headings = html.find_all("h5", string=headings)
         self.__dict__.update(
             {
-                headings[html_headings.index(x)].lower(): int(normalize(x.parent.span.a.string))
+                headings[html_headings.index(x)].lower(): parse_count(x.parent.span.a.string)
                 for x in html_headings
             }
         )
@@ -1009,7 +1088,7 @@ class PartialArticle:
 
         self.name = meta_raw.h4.a.string
         self.url = join(meta_raw.h4.a["href"])
-        self.date = get_date(meta_raw.find("time")["datetime"])
+        self.date = parse_date(meta_raw.find("time")["datetime"])
         try:
             self.type = ArticleCategory[
                 meta_raw.find("span", class_="subheading").text.strip().split(" ")[0].lower()
@@ -1053,6 +1132,8 @@ class Option:
         The percent of all votes that have been cast on this option
     """
 
+    __slots__ = ("id", "text", "votes", "percent")
+
     def __init__(self, **kwargs):
         self.id = kwargs.get("id", None)
         self.text = kwargs.get("text")
@@ -1064,6 +1145,7 @@ class Option:
 
 
 T = TypeVar("T")
+_MISSING = object()
 
 
 class ModDBList(collections.abc.MutableSequence[T], Generic[T]):
@@ -1086,15 +1168,24 @@ class ModDBList(collections.abc.MutableSequence[T], Generic[T]):
         self.total_pages = kwargs.pop("total_pages")
         self.current_page = kwargs.pop("current_page")
         self.total_results = kwargs.pop("total_results")
+        self._indexes: Dict[str, Dict[Any, T]] = {}
+
+    #: Attributes that can be looked up through a hash index instead of a scan of the results
+    _indexed = ("url", "name", "id")
+
+    #: Strainer passed to get_page when fetching other pages of the list, None parses the whole page
+    _strainer: SoupStrainer = None
 
     def _parse_method(self, html: BeautifulSoup):
         raise NotImplementedError
 
-    def _do_request(self, **kwargs):
+    def _page_request(self, **kwargs) -> Tuple[str, dict]:
         page = kwargs.pop("page", self.current_page)
         params = {**self._params, **kwargs}
 
-        html = get_page(f"{self._url}/page/{page}", params=params)
+        return f"{self._url}/page/{page}", params
+
+    def _from_html(self, html: BeautifulSoup, params: dict) -> Self:
         results, current_page, total_pages, total_results = self._parse_method(html)
 
         return self.__class__(
@@ -1106,6 +1197,16 @@ class ModDBList(collections.abc.MutableSequence[T], Generic[T]):
             total_results=total_results,
         )
 
+    def _do_request(self, **kwargs) -> Self:
+        url, params = self._page_request(**kwargs)
+        html = get_page(url, params=params, parse_only=self._strainer)
+
+        return self._from_html(html, params)
+
+    def _check_page(self, page: int):
+        if page < 1 or page > self.total_pages:
+            raise ValueError(f"Please pick a page between 1 and {self.total_pages}")
+
     def next_page(self) -> Self:
         """Returns the next page of results as either a CommentList if you are retriving comments or
         as a ResultList if it's literally anything else.
@@ -1163,41 +1264,114 @@ class ModDBList(collections.abc.MutableSequence[T], Generic[T]):
         ValueError
             This page does not exist
         """
-        if page < 1 or page > self.total_pages:
-            raise ValueError(f"Please pick a page between 1 and {self.total_pages}")
+        self._check_page(page)
 
         return self._do_request(page=page)
 
-    def get_all_results(self) -> Self:
+    def get_all_results(self, *, concurrency: int = 1) -> Self:
         """An expensive methods that iterates over every page of the result query and returns all
         the results. This may return more results than you expected if new page have fit the criteria
         while iterating.
 
+        Parameters
+        -----------
+        concurrency : Optional[int]
+            The number of pages to fetch at the same time. Once the first page is fetched the
+            remaining pages are requested by a pool of threads of that size and the results put
+            back in page order. Requests still go through the library's ratelimits. Defaults to 1,
+            which fetches the pages one after the other.
+
         Returns
         --------
         Union[CommentList[Any], ResultList[Any]]
             The list of things you were searching for
         """
-        search = self.to_page(1)
-        results = list(search)
+        results = []
+        for search in self._all_pages(concurrency):
+            results.extend(search)
 
-        while True:
-            try:
-                search = search.next_page()
-            except ValueError:
-                break
-            else:
-                results.extend(search)
-                LOGGER.info("Parsed page %s/%s", search.current_page, search.total_pages)
+        return search._merge_results(results)
+
+    def _all_pages(self, concurrency: int = 1) -> Iterator[Self]:
+        """Yield every page of results in order, starting from the first one"""
+        search = self.to_page(1)
+        yield search
 
+        if concurrency > 1:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
+                for search in executor.map(search.to_page, range(2, search.total_pages + 1)):
+                    LOGGER.info("Parsed page %s/%s", search.current_page, search.total_pages)
+                    yield search
+        else:
+            while True:
+                try:
+                    search = search.next_page()
+                except ValueError:
+                    break
+                else:
+                    LOGGER.info("Parsed page %s/%s", search.current_page, search.total_pages)
+                    yield search
+
+    def _merge_results(self, results: List[T]) -> Self:
         def key(element):
             if isinstance(element, Comment):
                 return element.id
             else:
                 return element.name
 
-        search._results = list({key(e): e for e in results}.values())
-        return search
+        self._results = list({key(e): e for e in results}.values())
+        self._indexes.clear()
+        return self
+
+    def _index(self, attr: str) -> Dict[Any, T] | None:
+        """Get the index mapping each value of the attribute to the first result that has it,
+        the index is built the first time it is needed and dropped when the list changes.
+        Returns None if the attribute is not indexed."""
+        if attr not in self._indexed:
+            return None
+
+        try:
+            return self._indexes[attr]
+        except KeyError:
+            pass
+
+        index = {}
+        for element in self._results:
+            index.setdefault(getattr(element, attr, _MISSING), element)
+
+        index.pop(_MISSING, None)
+        self._indexes[attr] = index
+        return index
+
+    def by_url(self, url: str) -> T | None:
+        """Get the result with this url, without going through every result.
+
+        Parameters
+        -----------
+        url : str
+            The url of the result, can be relative to the ModDB domain
+
+        Returns
+        --------
+        Optional[Any]
+            The first result with that url, None if there is none
+        """
+        return self._index("url").get(join(url))
+
+    def by_id(self, id: int) -> T | None:
+        """Get the result with this id, without going through every result.
+
+        Parameters
+        -----------
+        id : int
+            The id of the result
+
+        Returns
+        --------
+        Optional[Any]
+            The first result with that id, None if there is none
+        """
+        return self._index("id").get(id)
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} pages={self.current_page}/{self.total_pages}, results={self._results}>"
@@ -1207,15 +1381,18 @@ class ModDBList(collections.abc.MutableSequence[T], Generic[T]):
 
     def __delitem__(self, index: int):
         self._results.__delitem__(index)
+        self._indexes.clear()
 
     def __len__(self) -> int:
         return self._results.__len__()
 
     def __setitem__(self, key: int, value: T):
         self._results.__setitem__(key, value)
+        self._indexes.clear()
 
     def insert(self, index: int, value: T):
         self._results.insert(index, value)
+        self._indexes.clear()
 
 
 class ResultList(ModDBList[Thumbnail]):
@@ -1236,6 +1413,8 @@ class ResultList(ModDBList[Thumbnail]):
         The total amount of results available
     """
 
+    _strainer = _RESULTS_STRAINER
+
     def _parse_method(self, html: BeautifulSoup):
         return _parse_results(html)
 
@@ -1254,8 +1433,278 @@ class ResultList(ModDBList[Thumbnail]):
         """
         return self._do_request(sort=f"{new_sort[0]}-{new_sort[1]}")
 
+    def get_table(self, *, concurrency: int = 1) -> ThumbnailTable:
+        """Same as :meth:`get_all_results` but the results are stored in a
+        :class:`ThumbnailTable` as each page is parsed, which takes a lot less memory when
+        there are hundreds of thousands of them. Results found on several pages are only kept
+        once, based on their url.
+
+        Parameters
+        -----------
+        concurrency : Optional[int]
+            The number of pages to fetch at the same time, see :meth:`get_all_results`
+
+        Returns
+        --------
+        ThumbnailTable
+            The table of all the results
+        """
+        table = ThumbnailTable()
+        urls = set()
+        for search in self._all_pages(concurrency):
+            for thumbnail in search:
+                if thumbnail.url not in urls:
+                    urls.add(thumbnail.url)
+                    table.append(thumbnail)
+
+        return table
+
     def __contains__(self, element: Thumbnail) -> bool:
-        return get(self._results, name=element.name) is not None
+        return element.name in self._index("name")
+
+
+class ThumbnailTable(collections.abc.Sequence):
+    """A column oriented list of thumbnails meant for very large sets of results. The
+    attributes of the thumbnails are kept in one list or array per attribute and the
+    strings are interned, :class:`Thumbnail` objects are only created when they are
+    accessed. Filtering and sorting work on the columns and return new tables.
+
+    Parameters
+    -----------
+    thumbnails : Optional[Iterable[Thumbnail]]
+        The thumbnails to fill the table with
+
+    Attributes
+    -----------
+    urls : List[str]
+        The url of each thumbnail
+    names : List[str]
+        The name of each thumbnail
+    images : List[str]
+        The image of each thumbnail, can contain None
+    summaries : List[str]
+        The summary of each thumbnail, can contain None
+    """
+
+    def __init__(self, thumbnails: Iterable[Thumbnail] = ()):
+        self.urls: List[str] = []
+        self.names: List[str] = []
+        self.images: List[str | None] = []
+        self.summaries: List[str | None] = []
+        # the urls again, for membership checks that do not scan the column
+        self._url_index: Set[str] = set()
+        # seconds since the epoch, NaN when there is no date
+        self._timestamps = array.array("d")
+        # utc offset in minutes, _NAIVE for dates without timezone
+        self._offsets = array.array("h")
+        # ThumbnailType values, _NO_TYPE when there is no type
+        self._types = array.array("B")
+
+        self.extend(thumbnails)
+
+    def append(self, thumbnail: Thumbnail):
+        """Add a thumbnail at the end of the table
+
+        Parameters
+        -----------
+        thumbnail : Thumbnail
+            The thumbnail to add
+        """
+        url = _intern(thumbnail.url)
+        self.urls.append(url)
+        self._url_index.add(url)
+        self.names.append(_intern(thumbnail.name))
+        self.images.append(_intern(thumbnail.image))
+        self.summaries.append(_intern(thumbnail.summary))
+
+        date = thumbnail.date
+        if date is None:
+            self._timestamps.append(math.nan)
+            self._offsets.append(_NAIVE)
+        elif date.tzinfo is None:
+            self._timestamps.append((date - _EPOCH).total_seconds())
+            self._offsets.append(_NAIVE)
+        else:
+            self._timestamps.append(date.timestamp())
+            self._offsets.append(int(date.utcoffset().total_seconds() // 60))
+
+        self._types.append(_NO_TYPE if thumbnail.type is None else thumbnail.type.value)
+
+    def extend(self, thumbnails: Iterable[Thumbnail]):
+        """Add several thumbnails at the end of the table
+
+        Parameters
+        -----------
+        thumbnails : Iterable[Thumbnail]
+            The thumbnails to add
+        """
+        for thumbnail in thumbnails:
+            self.append(thumbnail)
+
+    def _date(self, index: int) -> datetime.datetime | None:
+        timestamp = self._timestamps[index]
+        if math.isnan(timestamp):
+            return None
+
+        offset = self._offsets[index]
+        if offset == _NAIVE:
+            return _EPOCH + datetime.timedelta(seconds=timestamp)
+
+        tz = datetime.timezone(datetime.timedelta(minutes=offset))
+        return datetime.datetime.fromtimestamp(timestamp, tz)
+
+    def _type(self, index: int) -> ThumbnailType | None:
+        code = self._types[index]
+        return None if code == _NO_TYPE else ThumbnailType(code)
+
+    def column(self, name: str) -> List[Any]:
+        """Get the values of one attribute for every thumbnail of the table
+
+        Parameters
+        -----------
+        name : str
+            One of ``url``, ``name``, ``image``, ``summary``, ``date`` or ``type``
+
+        Returns
+        --------
+        List[Any]
+            The values, in the order of the table
+        """
+        columns = {
+            "url": self.urls,
+            "name": self.names,
+            "image": self.images,
+            "summary": self.summaries,
+        }
+        if name in columns:
+            return list(columns[name])
+        if name == "date":
+            return [self._date(index) for index in range(len(self))]
+        if name == "type":
+            return [self._type(index) for index in range(len(self))]
+
+        raise ValueError(f"Unknown column {name}")
+
+    def take(self, indices: Iterable[int]) -> ThumbnailTable:
+        """Get a new table containing the thumbnails at the given positions, in that order
+
+        Parameters
+        -----------
+        indices : Iterable[int]
+            The positions of the thumbnails to keep
+
+        Returns
+        --------
+        ThumbnailTable
+            The new table
+        """
+        indices = list(indices)
+        table = self.__class__()
+        table.urls = [self.urls[index] for index in indices]
+        table._url_index = set(table.urls)
+        table.names = [self.names[index] for index in indices]
+        table.images = [self.images[index] for index in indices]
+        table.summaries = [self.summaries[index] for index in indices]
+        table._timestamps = array.array("d", (self._timestamps[index] for index in indices))
+        table._offsets = array.array("h", (self._offsets[index] for index in indices))
+        table._types = array.array("B", (self._types[index] for index in indices))
+        return table
+
+    def filter(self, column: str, predicate: Callable[[Any], bool]) -> ThumbnailTable:
+        """Get a new table with the thumbnails for which the predicate returns True when
+        called with the value of their column, without creating the thumbnails.
+
+        Parameters
+        -----------
+        column : str
+            The attribute to check, see :meth:`column`
+        predicate : Callable[[Any], bool]
+            Called with each value of the column
+
+        Returns
+        --------
+        ThumbnailTable
+            The new table
+        """
+        return self.take(
+            index for index, value in enumerate(self.column(column)) if predicate(value)
+        )
+
+    def of_type(self, *types: ThumbnailType) -> ThumbnailTable:
+        """Get a new table with the thumbnails of the given types
+
+        Parameters
+        -----------
+        types : ThumbnailType
+            The types of thumbnails to keep
+
+        Returns
+        --------
+        ThumbnailTable
+            The new table
+        """
+        codes = {thumbnail_type.value for thumbnail_type in types}
+        return self.take(index for index, code in enumerate(self._types) if code in codes)
+
+    def sort(self, column: str = "name", *, reverse: bool = False) -> ThumbnailTable:
+        """Get a new table sorted by the values of a column, thumbnails without a value for it
+        are put last. Dates with and without timezone are compared as if the latter were in
+        UTC.
+
+        Parameters
+        -----------
+        column : str
+            The attribute to sort by, see :meth:`column`
+        reverse : Optional[bool]
+            Sort in descending order
+
+        Returns
+        --------
+        ThumbnailTable
+            The new table
+        """
+        if column == "date":
+            values = [None if math.isnan(value) else value for value in self._timestamps]
+        elif column == "type":
+            values = [None if code == _NO_TYPE else code for code in self._types]
+        else:
+            values = self.column(column)
+
+        present = [index for index, value in enumerate(values) if value is not None]
+        missing = [index for index, value in enumerate(values) if value is None]
+        present.sort(key=values.__getitem__, reverse=reverse)
+        return self.take(present + missing)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.take(range(len(self))[index])
+
+        return Thumbnail(
+            url=self.urls[index],
+            name=self.names[index],
+            image=self.images[index],
+            summary=self.summaries[index],
+            date=self._date(index),
+            type=self._type(index),
+        )
+
+    def __len__(self) -> int:
+        return len(self.urls)
+
+    def __contains__(self, element: Thumbnail) -> bool:
+        return element.url in self._url_index
+
+    def __repr__(self) -> str:
+        return f"<ThumbnailTable results={len(self)}>"
+
+
+_EPOCH = datetime.datetime(1970, 1, 1)
+_NAIVE = -(2**15)
+_NO_TYPE = 255
+
+
+def _intern(value):
+    return None if value is None else sys.intern(str(value))
 
 
 class CommentList(ModDBList[Comment]):
@@ -1272,11 +1721,13 @@ class CommentList(ModDBList[Comment]):
         The total amount of results available
     """
 
+    _strainer = _COMMENTS_STRAINER
+
     def _parse_method(self, html: BeautifulSoup):
-        return _parse_comments(html)
+        return _parse_comments(html, self._url)
 
     def __contains__(self, element: Comment) -> bool:
-        return get(self._results, name=element.name) is not None
+        return element.id in self._index("id")
 
     def flatten(self) -> List[Comment]:
         """Returns a 'flattened' list of comments where children of comments are added right
@@ -1331,6 +1782,8 @@ class Mirror:
         E.g. 35.5 -> 35.5%. Lower is better for speed.
     """
 
+    __slots__ = ("name", "index", "city", "country", "served", "capacity", "_url")
+
     def __init__(self, **kwargs):
         self.name = kwargs.get("name")
         self.index = kwargs.get("index")
@@ -1376,6 +1829,20 @@ class Tag:
         Url to the tag
     """
 
+    __slots__ = (
+        "id",
+        "name_id",
+        "name",
+        "date",
+        "official",
+        "sitearea",
+        "siteareaid",
+        "positive",
+        "negative",
+        "rank",
+        "url",
+    )
+
     def __init__(self, **kwargs):
         self.id = int(kwargs.pop("id"))
         self.date = datetime.datetime.fromtimestamp(int(kwargs.pop("date")))
@@ -0,0 +1,563 @@
+import collections
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from bs4 import BeautifulSoup
+
+from .enums import ThumbnailType
+from .hooks import emit, has_hooks
+from .utils import LOGGER, get_page_type, request, soup
+
+
+def normalize_url(url: str) -> str:
+    """Normalize a url so that equivalent urls share a cache entry. The scheme and
+    host are lowercased, the trailing slash and fragment are dropped and the
+    query parameters are sorted.
+
+    Parameters
+    -----------
+    url : str
+        The url to normalize
+
+    Returns
+    --------
+    str
+        The normalized url
+    """
+    parts = urlsplit(url)
+    path = parts.path.rstrip("/") or "/"
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, query, ""))
+
+
+def conditional_headers(headers: Mapping[str, str]) -> Dict[str, str]:
+    """Build the headers of a conditional request from the validators of a response,
+    the ``ETag`` becomes ``If-None-Match`` and ``Last-Modified`` becomes ``If-Modified-Since``.
+
+    Parameters
+    -----------
+    headers : Mapping[str, str]
+        The headers of the response
+
+    Returns
+    --------
+    Dict[str, str]
+        The conditional headers, empty if the response had no validators
+    """
+    headers = requests.structures.CaseInsensitiveDict(headers)
+    mapping = {"ETag": "If-None-Match", "Last-Modified": "If-Modified-Since"}
+    return {cond: headers[name] for name, cond in mapping.items() if name in headers}
+
+
+class ResponseCache:
+    """An opt-in on-disk cache of successful GET responses. Set an instance as
+    ``moddb.RESPONSE_CACHE`` to have :func:`moddb.request` and :func:`moddb.get_page`
+    serve repeated requests from disk instead of from ModDB. Cache hits do not count
+    against the ratelimits.
+
+    Responses are keyed on the normalized url and parameters only, cookies are not
+    part of the key so pages that differ when logged in will be shared between the
+    logged in and logged out state.
+
+    Expired responses are kept until they are evicted, if they had an ``ETag`` or a
+    ``Last-Modified`` header the next request for them is made conditional and the
+    stored body is reused if ModDB answers with 304 Not Modified.
+
+    Parameters
+    -----------
+    path : Optional[str]
+        Path to the sqlite database, defaults to a file in the temporary directory.
+    ttl : float
+        The default amount of seconds a response is kept for
+    ttls : Optional[Dict[ThumbnailType, float]]
+        Per page type overrides of ``ttl``, the page type is guessed from the url.
+    max_size : int
+        The maximum total size of the cached bodies in bytes, the least recently used
+        responses are evicted past this.
+
+    Attributes
+    -----------
+    hits : int
+        The number of requests served from the cache
+    misses : int
+        The number of requests that had to go to ModDB
+    revalidations : int
+        The number of expired responses reused after a 304 Not Modified
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        *,
+        ttl: float = 3600,
+        ttls: Optional[Dict[ThumbnailType, float]] = None,
+        max_size: int = 256 * 1024 * 1024,
+    ):
+        self.path = path or os.path.join(tempfile.gettempdir(), "moddb-responses.sqlite")
+        self.ttl = ttl
+        self.ttls = ttls or {}
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, url TEXT, status INTEGER, "
+            "headers TEXT, content BLOB, encoding TEXT, expires REAL, accessed REAL, size INTEGER)"
+        )
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} path={self.path} hits={self.hits} misses={self.misses}>"
+
+    def ttl_for(self, url: str) -> float:
+        """Get the amount of seconds a response for this url should be kept for.
+
+        Parameters
+        -----------
+        url : str
+            The url of the response
+
+        Returns
+        --------
+        float
+            The ttl in seconds
+        """
+        try:
+            page_type = get_page_type(urlsplit(url).path + "/")
+        except (IndexError, KeyError):
+            return self.ttl
+
+        return self.ttls.get(page_type, self.ttl)
+
+    def get(self, url: str) -> Optional[requests.Response]:
+        """Get the cached response for a url if there is one that has not expired.
+        Updates the hit and miss counters.
+
+        Parameters
+        -----------
+        url : str
+            The full url of the request, including the query string
+
+        Returns
+        --------
+        Optional[requests.Response]
+            The cached response or None
+        """
+        key = normalize_url(url)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, status, headers, content, encoding FROM responses "
+                "WHERE key = ? AND expires > ?",
+                (key, now),
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._conn.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+
+        LOGGER.debug("Cache hit for %s", url)
+        return self._load(row)
+
+    def _load(self, row: tuple) -> requests.Response:
+        response = requests.Response()
+        response.url, response.status_code, headers, response._content, response.encoding = row
+        response.headers.update(json.loads(headers))
+        response.reason = "OK"
+        return response
+
+    def validators(self, url: str) -> Dict[str, str]:
+        """Get the conditional headers to revalidate the stored response for a url with.
+
+        Parameters
+        -----------
+        url : str
+            The full url of the request, including the query string
+
+        Returns
+        --------
+        Dict[str, str]
+            The conditional headers, empty if there is no stored response or it had
+            no validators.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT headers FROM responses WHERE key = ?", (normalize_url(url),)
+            ).fetchone()
+
+        return {} if row is None else conditional_headers(json.loads(row[0]))
+
+    def refresh(self, url: str) -> Optional[requests.Response]:
+        """Mark the stored response for a url as fresh again, this is done when ModDB
+        answers a conditional request with 304 Not Modified.
+
+        Parameters
+        -----------
+        url : str
+            The full url of the request, including the query string
+
+        Returns
+        --------
+        Optional[requests.Response]
+            The stored response or None if it has been evicted since
+        """
+        key = normalize_url(url)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, status, headers, content, encoding FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            self.revalidations += 1
+            self._conn.execute(
+                "UPDATE responses SET expires = ?, accessed = ? WHERE key = ?",
+                (now + self.ttl_for(url), now, key),
+            )
+
+        LOGGER.debug("Revalidated %s", url)
+        return self._load(row)
+
+    def _lookup(self, prepped: requests.PreparedRequest) -> Optional[requests.Response]:
+        """Get the fresh response for a request or add the validators of the stale one to it"""
+        resp = self.get(prepped.url)
+        if resp is not None:
+            resp.request = prepped
+            return resp
+
+        prepped.headers.update(self.validators(prepped.url))
+        return None
+
+    def _store(
+        self, prepped: requests.PreparedRequest, resp: requests.Response
+    ) -> requests.Response:
+        """Store the response to a request, or swap a 304 for the stored response"""
+        if resp.status_code == 304:
+            cached = self.refresh(prepped.url)
+            if cached is not None:
+                cached.request = prepped
+                return cached
+        elif resp.status_code == 200:
+            self.set(prepped.url, resp)
+
+        return resp
+
+    def set(self, url: str, response: requests.Response):
+        """Store a response in the cache and evict the least recently used entries if the
+        cache is now over ``max_size``.
+
+        Parameters
+        -----------
+        url : str
+            The full url of the request, including the query string
+        response : requests.Response
+            The response to store
+        """
+        now = time.time()
+        content = response.content
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    normalize_url(url),
+                    response.url,
+                    response.status_code,
+                    json.dumps(dict(response.headers)),
+                    content,
+                    response.encoding,
+                    now + self.ttl_for(url),
+                    now,
+                    len(content),
+                ),
+            )
+            self._evict()
+
+    def _evict(self):
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_size:
+            return
+
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY accessed"
+        ).fetchall():
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            if total <= self.max_size:
+                break
+
+    def clear(self):
+        """Remove every response from the cache and reset the counters."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self.hits = 0
+            self.misses = 0
+            self.revalidations = 0
+
+    def stats(self) -> dict:
+        """Get statistics about the cache.
+
+        Returns
+        --------
+        dict
+            The ``hits``, ``misses``, ``revalidations``, ``entries`` and total ``size`` in bytes
+        """
+        with self._lock:
+            entries, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+            "entries": entries,
+            "size": size,
+        }
+
+    def close(self):
+        """Close the connection to the database."""
+        with self._lock:
+            self._conn.close()
+
+
+class ModelCache:
+    """An opt-in in memory cache of parsed models. Set an instance as ``moddb.MODEL_CACHE``
+    to have :func:`moddb.parse_page` and :meth:`moddb.boxes.Thumbnail.parse` return the
+    model built the last time the same url was parsed instead of fetching and parsing
+    it again. The same object is returned each time so any changes made to it will be
+    visible to everyone getting it from the cache.
+
+    Models parsed from a response with an ``ETag`` or a ``Last-Modified`` header are kept
+    after they expire, the page is then refetched with a conditional request and the
+    same model is returned if ModDB answers with 304 Not Modified.
+
+    Parameters
+    -----------
+    capacity : int
+        The maximum number of models kept, the least recently used model is dropped
+        past this.
+    ttl : Optional[float]
+        The amount of seconds a model is kept for, None to keep them until they are
+        evicted.
+
+    Attributes
+    -----------
+    hits : int
+        The number of models served from the cache
+    misses : int
+        The number of models that had to be fetched and parsed
+    evictions : int
+        The number of models dropped to stay under capacity
+    revalidations : int
+        The number of expired models reused after a 304 Not Modified
+    """
+
+    def __init__(self, capacity: int = 1024, *, ttl: Optional[float] = None):
+        self.capacity = capacity
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.revalidations = 0
+
+        self._lock = threading.Lock()
+        self._models = collections.OrderedDict()
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} size={len(self)} capacity={self.capacity}>"
+
+    def __len__(self):
+        return len(self._models)
+
+    def get(self, url: str) -> Optional[Any]:
+        """Get the model parsed from a url if it is cached and has not expired. Updates
+        the hit and miss counters.
+
+        Parameters
+        -----------
+        url : str
+            The url of the page
+
+        Returns
+        --------
+        Optional[Any]
+            The model or None
+        """
+        key = normalize_url(url)
+        with self._lock:
+            entry = self._models.get(key)
+            if entry is not None and entry[0] is not None and entry[0] <= time.monotonic():
+                if not entry[2]:
+                    del self._models[key]
+
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._models.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, url: str, model: Any, validators: Optional[Dict[str, str]] = None):
+        """Store a model in the cache.
+
+        Parameters
+        -----------
+        url : str
+            The url the model was parsed from
+        model : Any
+            The model
+        validators : Optional[Dict[str, str]]
+            The conditional headers to revalidate the model with once it expires, see
+            :func:`conditional_headers`
+        """
+        expires = None if self.ttl is None else time.monotonic() + self.ttl
+        key = normalize_url(url)
+        with self._lock:
+            self._models[key] = (expires, model, validators or {})
+            self._models.move_to_end(key)
+            while len(self._models) > self.capacity:
+                self._models.popitem(last=False)
+                self.evictions += 1
+
+    def _stale(self, url: str) -> Optional[Tuple[Any, Dict[str, str]]]:
+        """Get an expired model that can be revalidated and its validators"""
+        with self._lock:
+            entry = self._models.get(normalize_url(url))
+
+        if entry is None or not entry[2]:
+            return None
+
+        return entry[1], entry[2]
+
+    def remove(self, url: str):
+        """Remove the model parsed from a url from the cache if there is one.
+
+        Parameters
+        -----------
+        url : str
+            The url of the page
+        """
+        with self._lock:
+            self._models.pop(normalize_url(url), None)
+
+    def clear(self):
+        """Remove every model from the cache and reset the counters."""
+        with self._lock:
+            self._models.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.revalidations = 0
+
+    def stats(self) -> dict:
+        """Get statistics about the cache.
+
+        Returns
+        --------
+        dict
+            The ``hits``, ``misses``, ``evictions``, ``revalidations``, current ``size``
+            and ``capacity``
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "revalidations": self.revalidations,
+            "size": len(self),
+            "capacity": self.capacity,
+        }
+
+
+def _cached_model(url: str) -> Optional[Any]:
+    cache = sys.modules["moddb"].MODEL_CACHE
+    return None if cache is None else cache.get(url)
+
+
+def _conditional_request(url: str) -> requests.Request:
+    """Build the request for a page, conditional if there is an expired model for it"""
+    cache = sys.modules["moddb"].MODEL_CACHE
+    entry = None if cache is None else cache._stale(url)
+    headers = {} if entry is None else dict(entry[1])
+
+    return requests.Request("GET", url, headers=headers)
+
+
+def _revalidated_model(url: str, resp: requests.Response) -> Optional[Any]:
+    """Get the expired model for a page if the response shows it has not changed"""
+    cache = sys.modules["moddb"].MODEL_CACHE
+    entry = None if cache is None else cache._stale(url)
+    if entry is None:
+        return None
+
+    model, validators = entry
+    if resp.status_code != 304 and conditional_headers(resp.headers) != validators:
+        return None
+
+    LOGGER.debug("Reusing model for %s", url)
+    cache.revalidations += 1
+    cache.set(url, model, validators)
+    return model
+
+
+def _cache_model(url: str, model: Any, resp: Optional[requests.Response] = None) -> Any:
+    cache = sys.modules["moddb"].MODEL_CACHE
+    if cache is not None:
+        cache.set(url, model, None if resp is None else conditional_headers(resp.headers))
+
+    return model
+
+
+def _build_model(
+    build: Callable[[BeautifulSoup], Any],
+    resp: requests.Response,
+    lean: bool = False,
+    *,
+    url: str,
+    start: float,
+) -> Any:
+    """Build a model from the page in the response, releasing its html right away if lean. Emits
+    the ``page`` event of the url, timed from the ``time.perf_counter`` the request started at."""
+    html = soup(resp.text)
+    if has_hooks("page"):
+        emit("page", url=url, duration=time.perf_counter() - start)
+
+    model = build(html)
+    if lean:
+        model.release()
+
+    return model
+
+
+def _parse_model(url: str, build: Callable[[BeautifulSoup], Any], *, lean: bool = False) -> Any:
+    """Get the page at url and build a model from it, going through ``moddb.MODEL_CACHE``"""
+    model = _cached_model(url)
+    if model is not None:
+        return model
+
+    start = time.perf_counter()
+    resp = request(_conditional_request(url))
+    model = _revalidated_model(url, resp)
+    if model is not None:
+        return model
+
+    return _cache_model(url, _build_model(build, resp, lean, url=url, start=start), resp)
@@ -12,21 +12,19 @@ from requests import utils
 
 from .base import parse_page
 from .boxes import ResultList, Thumbnail, _parse_results
+from .decoders import parse_date
 from .enums import Status, ThumbnailType
 from .errors import ModdbException
 from .pages import Member
 from .utils import (
     BASE_URL,
-    COMMENT_LIMITER,
-    GLOBAL_LIMITER,
-    GLOBAL_THROTLE,
     LOGGER,
+    _timed_send,
     concat_docs,
     create_login_payload,
     generate_hash,
     generate_login_cookies,
     get,
-    get_date,
     get_page_type,
     get_sitearea,
     get_siteareaid,
@@ -60,12 +58,14 @@ class Message:
         The html text of the message
     """
 
+    __slots__ = ("id", "member", "timestamp", "text")
+
     def __init__(self, html: BeautifulSoup):
         member = html.find("a", class_="avatar")
 
         self.id = int(html["id"])
         self.member = Thumbnail(url=member["href"], type=ThumbnailType.member, name=member["title"])
-        self.timestamp = get_date(html.find("time")["datetime"])
+        self.timestamp = parse_date(html.find("time")["datetime"])
         self.text = html.find("div", class_="comment").text
 
     def __repr__(self):
@@ -150,6 +150,8 @@ class ThreadThumbnail:
         the last message without having to parse the thread.
     """
 
+    __slots__ = ("name", "id", "url", "last_messager", "timestamp", "content")
+
     def __init__(self, **kwargs):
         self.name = kwargs.get("name")
         self.url = join(kwargs.get("url"))
@@ -318,7 +320,7 @@ class Client:
         sys.modules["moddb"].SESSION = self._fake_session
         delattr(self, "_fake_session")
 
-    @ratelimit(GLOBAL_THROTLE, GLOBAL_LIMITER)
+    @ratelimit("GLOBAL_THROTLE", "GLOBAL_LIMITER")
     def _request(self, method, url, **kwargs):
         """Making sure we do our request with the cookies from this client rather than the cookies
         of the library."""
@@ -334,7 +336,12 @@ class Client:
         prepped = self._session.prepare_request(req)
         LOGGER.info("Request: %s", prepped.url)
 
-        r = self._session.send(prepped, allow_redirects=kwargs.pop("allow_redirects", True))
+        r = _timed_send(
+            self._session,
+            prepped,
+            "client",
+            allow_redirects=kwargs.pop("allow_redirects", True),
+        )
         raise_for_status(r)
 
         return r
@@ -384,7 +391,7 @@ class Client:
                         Thumbnail(name=x.string, url=x["href"], type=get_page_type(x["href"]))
                         for x in updates_raw
                     ],
-                    date=get_date(update.find("time")["datetime"]),
+                    date=parse_date(update.find("time")["datetime"]),
                 )
             )
 
@@ -447,7 +454,7 @@ class Client:
                     client=self,
                     accept=accept,
                     decline=decline,
-                    date=get_date(request.find("time")["datetime"]),
+                    date=parse_date(request.find("time")["datetime"]),
                 )
             )
 
@@ -697,7 +704,7 @@ class Client:
 
         return "friend request has been sent" in r.json()["text"]
 
-    @ratelimit(COMMENT_LIMITER)
+    @ratelimit("COMMENT_LIMITER")
     def add_comment(self, page: Any, text: str, *, comment: Comment = None) -> Any:
         """Add a comment to a page.
 
@@ -996,7 +1003,7 @@ class Client:
                     last_messager=Thumbnail(
                         type=ThumbnailType.member, name=member.string, url=member["href"]
                     ),
-                    timestamp=get_date(thread.find("time")["datetime"]),
+                    timestamp=parse_date(thread.find("time")["datetime"]),
                     content=thread.find("div", class_="content").find("p").string,
                 )
             )
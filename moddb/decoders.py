@@ -0,0 +1,155 @@
+"""Parsers for the dates and numbers found all over ModDB pages. The patterns are compiled once
+and dates are parsed with ``fromisoformat`` instead of trying several ``strptime`` formats, the
+same dates come up again and again on comment pages so they are also cached."""
+
+import datetime
+import functools
+import re
+from typing import Optional, Tuple
+
+#: Total and daily count, e.g. "1,234 (5 today)"
+_VIEWS = re.compile(r"^([0-9,]*) \(([0-9,]*) today\)$")
+#: Position in a result list, e.g. "Mods (31 - 60 of 1,234)"
+_LIST_STATS = re.compile(r".*\(([0-9,]*) - ([0-9,]*) of ([0-9,]*)\)")
+#: Rank against the other pages of the same type, e.g. "12 of 1,234"
+_RANK = re.compile(r"([0-9,]+)\s*of\s*([0-9,]+)")
+#: Multipliers of abbreviated numbers, e.g. "1.2k"
+_ABBREVIATIONS = {"k": 1_000, "m": 1_000_000}
+
+
+def parse_int(string: str) -> int:
+    """Parse an integer that can contain thousands separators, e.g. "1,234"
+
+    Parameters
+    -----------
+    string : str
+        The number
+
+    Returns
+    --------
+    int
+        The parsed number
+    """
+    return int(string.replace(",", ""))
+
+
+def parse_count(string: str) -> int:
+    """Parse a stat such as "1,234 members", the words around the number are dropped
+
+    Parameters
+    -----------
+    string : str
+        The stat
+
+    Returns
+    --------
+    int
+        The parsed number
+    """
+    return int(string.replace(",", "").replace("members", "").replace("member", ""))
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_date(string: str) -> datetime.datetime:
+    try:
+        return datetime.datetime.fromisoformat(string)
+    except ValueError:
+        pass
+
+    try:
+        return datetime.datetime.strptime(string, "%Y-%m-%d")
+    except ValueError:
+        return datetime.datetime.strptime(string, "%Y-%m")
+
+
+def parse_date(string: str) -> datetime.datetime:
+    """Parse a ModDB date, which can go from a full timestamp with a timezone, e.g.
+    "2020-01-02T10:00:00+01:00", down to a year and a month, e.g. "2020-01".
+
+    Parameters
+    -----------
+    string : str
+        The date
+
+    Returns
+    --------
+    datetime.datetime
+        The parsed date, with a timezone only if the string had one
+    """
+    # bs4 strings keep their whole tree alive, they should not end up in the cache
+    return _parse_date(str(string))
+
+
+def parse_views(string: str) -> Tuple[int, int]:
+    """Parse a total and daily count, e.g. "1,234 (5 today)"
+
+    Parameters
+    -----------
+    string : str
+        The counts
+
+    Returns
+    --------
+    Tuple[int, int]
+        The total and the daily count
+    """
+    match = _VIEWS.match(string)
+    return parse_int(match.group(1)), parse_int(match.group(2))
+
+
+def parse_rank(string: str) -> Tuple[int, int]:
+    """Parse a rank, e.g. "12 of 1,234"
+
+    Parameters
+    -----------
+    string : str
+        The rank
+
+    Returns
+    --------
+    Tuple[int, int]
+        The rank and the total number of ranked pages
+    """
+    match = _RANK.search(string)
+    return parse_int(match.group(1)), parse_int(match.group(2))
+
+
+def parse_abbreviated(string: str) -> int:
+    """Parse a number that can be abbreviated, e.g. "1.2k" or "3m"
+
+    Parameters
+    -----------
+    string : str
+        The number
+
+    Returns
+    --------
+    int
+        The parsed number
+    """
+    identifier = string[-1].lower()
+    if identifier.isdigit():
+        return int(string)
+
+    return int(float(string[:-1]) * _ABBREVIATIONS[identifier])
+
+
+def parse_list_stats(string: str) -> Optional[Tuple[int, int]]:
+    """Parse the position of a page in a list of results, e.g. "Mods (31 - 60 of 1,234)"
+
+    Parameters
+    -----------
+    string : str
+        The heading of the list
+
+    Returns
+    --------
+    Optional[Tuple[int, int]]
+        The index of the last result on the page and the total number of results, None if
+        the list fits in a single page
+    """
+    match = _LIST_STATS.match(string)
+    if not match:
+        return None
+
+    return parse_int(match.group(2)), parse_int(match.group(3))
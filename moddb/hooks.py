@@ -0,0 +1,157 @@
+"""Instrumentation hooks. Functions registered with :func:`add_hook` are called with keyword
+arguments describing what the library just did, e.g. how long a request took. Nothing is
+timed when no hook is registered for an event.
+
+Events and their arguments:
+
+- ``request``: a request was sent. ``method``, ``url``, ``status`` (None if no response was
+  received), ``size`` of the body in bytes, ``duration`` in seconds, ``source`` (``"library"``
+  or ``"client"``) and the ``error`` raised while sending it, if any.
+- ``cache``: a GET request was looked up in ``moddb.RESPONSE_CACHE``. ``url`` and ``hit``.
+- ``soup``: a page was parsed into a tree. ``size`` of the html, ``parser`` and ``duration``.
+- ``page``: a page was requested and parsed into a tree, by :func:`moddb.utils.get_page` or
+  to build a model with :func:`moddb.parse_page`. ``url`` and ``duration`` from the request to
+  the tree.
+- ``model``: a page model was built. ``model`` class, the ``instance`` built, ``duration`` and
+  the ``error`` raised by its constructor, if any.
+- ``section``: a section of a model, such as its ``profile`` or ``comments``, was parsed.
+  ``model`` class, the ``instance`` it belongs to, ``name`` of the section, ``duration``, the
+  ``error`` raised while parsing it, if any, the ``html`` it was parsed from and whether it was
+  parsed while the model was built (``initial``) rather than the first time it was accessed.
+- ``ratelimit``: a call had to wait for a ratelimit. ``limiter`` and ``wait`` in seconds.
+- ``ratelimited``: a call was refused by a ratelimit. ``limiter`` and ``remaining`` seconds.
+"""
+
+import functools
+import logging
+import threading
+import time
+from typing import Callable, Dict, List
+
+LOGGER = logging.getLogger("moddb")
+
+EVENTS = (
+    "request",
+    "cache",
+    "soup",
+    "page",
+    "model",
+    "section",
+    "ratelimit",
+    "ratelimited",
+)
+
+_HOOKS: Dict[str, List[Callable[..., None]]] = {event: [] for event in EVENTS}
+_LOCK = threading.Lock()
+_CONSTRUCTING = threading.local()
+
+
+def _check(event: str):
+    if event not in _HOOKS:
+        raise ValueError(f"Unknown event {event}, expected one of {EVENTS}")
+
+
+def add_hook(event: str, func: Callable[..., None]):
+    """Call a function every time an event happens. Hooks are called synchronously from the
+    thread the event happened in, they should be quick and thread safe. Errors raised by a hook
+    are logged and ignored.
+
+    Parameters
+    -----------
+    event : str
+        The event to listen to, one of ``EVENTS``
+    func : Callable[..., None]
+        The function, called with the arguments of the event as keyword arguments
+
+    Raises
+    -------
+    ValueError
+        The event does not exist
+    """
+    _check(event)
+    with _LOCK:
+        # replaced rather than appended to so that emit never iterates over a changing list
+        _HOOKS[event] = [*_HOOKS[event], func]
+
+
+def remove_hook(event: str, func: Callable[..., None]):
+    """Stop calling a function for an event, does nothing if it was not registered.
+
+    Parameters
+    -----------
+    event : str
+        The event the function was registered for
+    func : Callable[..., None]
+        The function to remove
+    """
+    _check(event)
+    with _LOCK:
+        _HOOKS[event] = [hook for hook in _HOOKS[event] if hook != func]
+
+
+def has_hooks(event: str) -> bool:
+    """Whether anything listens to an event, used to skip measuring it otherwise.
+
+    Parameters
+    -----------
+    event : str
+        The event
+
+    Returns
+    --------
+    bool
+        True if at least one hook is registered for the event
+    """
+    return bool(_HOOKS[event])
+
+
+def emit(event: str, **data):
+    """Call the hooks of an event.
+
+    Parameters
+    -----------
+    event : str
+        The event
+    data
+        The arguments of the event
+    """
+    for hook in _HOOKS[event]:
+        try:
+            hook(**data)
+        except Exception:
+            LOGGER.exception("Hook %s failed on %s event", hook, event)
+
+
+def timed_init(init: Callable[..., None]) -> Callable[..., None]:
+    """Wrap the constructor of a model to emit a ``model`` event once it is built. Only the
+    outermost constructor emits the event when constructors call each other through
+    ``super``."""
+
+    @functools.wraps(init)
+    def wrapper(self, *args, **kwargs):
+        if not _HOOKS["model"]:
+            return init(self, *args, **kwargs)
+
+        active = _CONSTRUCTING.__dict__.setdefault("ids", set())
+        if id(self) in active:
+            return init(self, *args, **kwargs)
+
+        active.add(id(self))
+        error = None
+        start = time.perf_counter()
+        try:
+            return init(self, *args, **kwargs)
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            active.discard(id(self))
+            emit(
+                "model",
+                model=type(self),
+                instance=self,
+                duration=time.perf_counter() - start,
+                error=error,
+            )
+
+    return wrapper
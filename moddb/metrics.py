@@ -0,0 +1,371 @@
+import bisect
+import sys
+import threading
+from typing import Dict, Iterator, Optional, Sequence, Tuple
+
+from .hooks import add_hook, remove_hook
+from .router import get_page_type
+
+#: Upper bounds of the buckets of duration histograms, in seconds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 300)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def page_type_label(url: str) -> str:
+    """Get the name of the type of page a url points to, ``other`` if it has none.
+
+    Parameters
+    -----------
+    url : str
+        The url
+
+    Returns
+    --------
+    str
+        The name of the ThumbnailType of the url, e.g. ``mod``
+    """
+    try:
+        return get_page_type(url.split("?")[0]).name
+    except (KeyError, IndexError):
+        return "other"
+
+
+def limiter_label(limiter) -> str:
+    """Get the name of the global ratelimit a ratelimit is, e.g. ``GLOBAL_LIMITER``, or the
+    name of its class if it is not a global one.
+
+    Returns
+    --------
+    str
+        The name of the ratelimit
+    """
+    utils = sys.modules["moddb.utils"]
+    for name in ("GLOBAL_LIMITER", "GLOBAL_THROTLE", "COMMENT_LIMITER", "LOGIN_LIMITER"):
+        if getattr(utils, name, None) is limiter:
+            return name
+
+    return type(limiter).__name__
+
+
+class Histogram:
+    """A histogram of observed values, counted in cumulative buckets.
+
+    Parameters
+    -----------
+    buckets : Sequence[float]
+        The sorted upper bounds of the buckets, values over the last bound are only counted
+        in the total
+
+    Attributes
+    -----------
+    count : int
+        The number of observed values
+    sum : float
+        The sum of the observed values
+    """
+
+    __slots__ = ("buckets", "counts", "count", "sum")
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * len(self.buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def __repr__(self):
+        return f"<Histogram count={self.count} sum={self.sum:.3f}>"
+
+    def observe(self, value: float):
+        """Add a value to the histogram.
+
+        Parameters
+        -----------
+        value : float
+            The value
+        """
+        index = bisect.bisect_left(self.buckets, value)
+        if index < len(self.counts):
+            self.counts[index] += 1
+
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> Iterator[Tuple[float, int]]:
+        """Get the number of values less than or equal to each bucket bound.
+
+        Returns
+        --------
+        Iterator[Tuple[float, int]]
+            Pairs of bucket bound and count
+        """
+        total = 0
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            yield bound, total
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate a quantile of the observed values by interpolating inside the bucket
+        it falls in.
+
+        Parameters
+        -----------
+        q : float
+            The quantile, between 0 and 1
+
+        Returns
+        --------
+        Optional[float]
+            The estimate, None if nothing was observed. Quantiles past the last bucket are
+            reported as its bound.
+        """
+        if not self.count:
+            return None
+
+        rank = q * self.count
+        lower = previous = 0
+        for bound, total in self.cumulative():
+            if total >= rank:
+                inside = total - previous
+                return lower + (bound - lower) * ((rank - previous) / inside if inside else 0)
+
+            lower, previous = bound, total
+
+        return self.buckets[-1]
+
+    @property
+    def mean(self) -> Optional[float]:
+        """The mean of the observed values, None if nothing was observed."""
+        return self.sum / self.count if self.count else None
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "mean": self.mean,
+            "p50": self.quantile(0.5),
+            "p99": self.quantile(0.99),
+            "buckets": dict(self.cumulative()),
+        }
+
+
+class MetricsRegistry:
+    """An in process aggregator of the events of :mod:`moddb.hooks`. Once installed it keeps
+    counters and histograms of requests, cache lookups, parsing, model construction and
+    ratelimits, each with labels such as the type of page requested.
+
+    .. code-block:: python3
+
+        metrics = moddb.MetricsRegistry()
+        metrics.install()
+        moddb.parse_page("https://www.moddb.com/mods/edain-mod")
+        metrics.histogram("request_duration_seconds", type="mod", method="GET", source="library")
+
+    Counters:
+
+    - ``requests_total``: ``type``, ``method``, ``status`` and ``source``
+    - ``request_errors_total``: ``type`` and ``error``
+    - ``response_bytes_total``: ``type``
+    - ``cache_lookups_total``: ``result`` (``hit`` or ``miss``)
+    - ``soup_bytes_total``: ``parser``
+    - ``model_errors_total``: ``model``
+    - ``ratelimited_total``: ``limiter``
+
+    Histograms:
+
+    - ``request_duration_seconds``: ``type``, ``method`` and ``source``
+    - ``page_duration_seconds``: ``type``
+    - ``soup_duration_seconds``: ``parser``
+    - ``model_duration_seconds``: ``model``
+    - ``section_duration_seconds``: ``model`` and ``section``
+    - ``ratelimit_wait_seconds``: ``limiter``
+
+    Parameters
+    -----------
+    buckets : Sequence[float]
+        The bucket bounds of the histograms, in seconds
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._counters: Dict[Tuple[str, Labels], float] = {}
+        self._histograms: Dict[Tuple[str, Labels], Histogram] = {}
+        self._lock = threading.Lock()
+        self._hooks = {
+            "request": self._on_request,
+            "cache": self._on_cache,
+            "soup": self._on_soup,
+            "page": self._on_page,
+            "model": self._on_model,
+            "section": self._on_section,
+            "ratelimit": self._on_ratelimit,
+            "ratelimited": self._on_ratelimited,
+        }
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__} counters={len(self._counters)} "
+            f"histograms={len(self._histograms)}>"
+        )
+
+    def __enter__(self):
+        self.install()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.uninstall()
+
+    def install(self):
+        """Start recording the events of the library."""
+        for event, hook in self._hooks.items():
+            add_hook(event, hook)
+
+    def uninstall(self):
+        """Stop recording the events of the library, the recorded metrics are kept."""
+        for event, hook in self._hooks.items():
+            remove_hook(event, hook)
+
+    def inc(self, name: str, value: float = 1, **labels: str):
+        """Increment a counter.
+
+        Parameters
+        -----------
+        name : str
+            The name of the counter
+        value : float
+            The amount to add
+        labels : str
+            The labels of the counter
+        """
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels: str):
+        """Add a value to a histogram.
+
+        Parameters
+        -----------
+        name : str
+            The name of the histogram
+        value : float
+            The value
+        labels : str
+            The labels of the histogram
+        """
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram(self.buckets)
+
+            histogram.observe(value)
+
+    def counter(self, name: str, **labels: str) -> float:
+        """Get the value of a counter, 0 if it was never incremented.
+
+        Parameters
+        -----------
+        name : str
+            The name of the counter
+        labels : str
+            The labels of the counter
+
+        Returns
+        --------
+        float
+            The value of the counter
+        """
+        return self._counters.get((name, tuple(sorted(labels.items()))), 0)
+
+    def histogram(self, name: str, **labels: str) -> Optional[Histogram]:
+        """Get a histogram.
+
+        Parameters
+        -----------
+        name : str
+            The name of the histogram
+        labels : str
+            The labels of the histogram
+
+        Returns
+        --------
+        Optional[Histogram]
+            The histogram, None if nothing was observed for it
+        """
+        return self._histograms.get((name, tuple(sorted(labels.items()))))
+
+    def counters(self) -> Dict[Tuple[str, Labels], float]:
+        """Get a copy of every counter, keyed by name and sorted label pairs."""
+        with self._lock:
+            return dict(self._counters)
+
+    def histograms(self) -> Dict[Tuple[str, Labels], Histogram]:
+        """Get every histogram, keyed by name and sorted label pairs."""
+        with self._lock:
+            return dict(self._histograms)
+
+    def snapshot(self) -> dict:
+        """Get every metric as plain data, e.g. to dump it as json.
+
+        Returns
+        --------
+        dict
+            ``counters`` and ``histograms``, each a list of dicts with the ``name``, the
+            ``labels`` and the value of the metric
+        """
+        return {
+            "counters": [
+                {"name": name, "labels": dict(labels), "value": value}
+                for (name, labels), value in sorted(self.counters().items())
+            ],
+            "histograms": [
+                {"name": name, "labels": dict(labels), **histogram.to_dict()}
+                for (name, labels), histogram in sorted(self.histograms().items())
+            ],
+        }
+
+    def reset(self):
+        """Clear every metric."""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def _on_request(self, *, method, url, status, size, duration, source, error):
+        page_type = page_type_label(url)
+        if error is not None:
+            self.inc("request_errors_total", type=page_type, error=type(error).__name__)
+        else:
+            self.inc(
+                "requests_total", type=page_type, method=method, status=str(status), source=source
+            )
+            self.inc("response_bytes_total", size, type=page_type)
+
+        self.observe(
+            "request_duration_seconds", duration, type=page_type, method=method, source=source
+        )
+
+    def _on_cache(self, *, url, hit):
+        self.inc("cache_lookups_total", result="hit" if hit else "miss")
+
+    def _on_soup(self, *, size, parser, duration):
+        self.inc("soup_bytes_total", size, parser=parser)
+        self.observe("soup_duration_seconds", duration, parser=parser)
+
+    def _on_page(self, *, url, duration):
+        self.observe("page_duration_seconds", duration, type=page_type_label(url))
+
+    def _on_model(self, *, model, instance, duration, error):
+        if error is not None:
+            self.inc("model_errors_total", model=model.__name__)
+
+        self.observe("model_duration_seconds", duration, model=model.__name__)
+
+    def _on_section(self, *, model, instance, name, duration, error, html, initial):
+        self.observe("section_duration_seconds", duration, model=model.__name__, section=name)
+
+    def _on_ratelimit(self, *, limiter, wait):
+        self.observe("ratelimit_wait_seconds", wait, limiter=limiter_label(limiter))
+
+    def _on_ratelimited(self, *, limiter, remaining):
+        self.inc("ratelimited_total", limiter=limiter_label(limiter))
@@ -3,8 +3,9 @@ import logging
 import bs4
 
 from ..boxes import PartialTag, Profile, Thumbnail
+from ..decoders import parse_date, parse_views
 from ..enums import ArticleCategory, Difficulty, ThumbnailType, TutorialCategory
-from ..utils import LOGGER, concat_docs, get_date, get_views, join
+from ..utils import LOGGER, concat_docs, join
 from .base import BaseMetaClass
 
 
@@ -116,13 +117,13 @@ class Article(BaseMetaClass):
             )
 
         views_raw = raw.find("h5", string="Views").parent.span.a.string
-        self.views, self.today = get_views(views_raw)
+        self.views, self.today = parse_views(views_raw)
 
         self.intro = html.find("p", itemprop="description").string
         author = html.find("span", itemprop="author").span.a
         self.author = Thumbnail(name=author.string, url=author["href"], type=ThumbnailType.member)
 
-        self.date = get_date(html.find("time", itemprop="datePublished")["datetime"])
+        self.date = parse_date(html.find("time", itemprop="datePublished")["datetime"])
         self.html = str(html.find("div", itemprop="articleBody"))
         self.plaintext = html.find("div", itemprop="articleBody").text
 
@@ -171,7 +172,7 @@ class Blog(BaseMetaClass):
         author = heading.find("span", class_="subheading").a
         self.author = Thumbnail(url=author["href"], name=author.string, type=ThumbnailType.member)
 
-        self.date = get_date(heading.find("span", class_="date").time["datetime"])
+        self.date = parse_date(heading.find("span", class_="date").time["datetime"])
 
         title = heading.div.h4.a
         self.name = title.string
@@ -1,6 +1,9 @@
+import functools
 import logging
 import re
-from typing import List
+import threading
+import time
+from typing import Collection, List
 
 from bs4 import BeautifulSoup
 
@@ -13,13 +16,122 @@ from ..boxes import (
     Statistics,
     Style,
     Thumbnail,
+    _COMMENTS_STRAINER,
+    _RESULTS_STRAINER,
     _parse_comments,
     _parse_results,
 )
 from ..enums import SearchCategory, ThumbnailType
-from ..utils import LOGGER, get_page, get_page_type, join
+from ..hooks import emit, has_hooks, timed_init
+from ..utils import LOGGER, _drop_source, decompose, get_page, get_page_type, get_source, join
 from .mixins import GetTagsMixin, GetWatchersMixin, RSSFeedMixin, SharedMethodsMixin
 
+_MEDIA = re.compile(r'new Array\(0, "(\S*)", "(\S*)"')
+_MEDIA_NAME = re.compile(r"\/([a-z0-9-]*)#imagebox")
+_MENTIONS_ID = re.compile(
+    r"https:\/\/www\.moddb\.com\/html\/scripts\/autocomplete\.php\?a=mentions&p=home&l=6&u=(\d*)"
+)
+
+
+_BUILDING = threading.local()
+
+
+def _constructor(init):
+    """Wrap the constructor of a model to time it and to forget the text of its page once it is
+    built, the model keeps the tree if it needs the page later. Models built while another one
+    is, e.g. in one of its sections, can share its tree so the texts are only forgotten once
+    the first model is done."""
+    timed = timed_init(init)
+
+    @functools.wraps(init)
+    def wrapper(self, *args, **kwargs):
+        if type(self).__init__ is not wrapper:
+            # called through super by the constructor of a subclass
+            return timed(self, *args, **kwargs)
+
+        trees = _BUILDING.__dict__.setdefault("trees", [])
+        outermost = not trees
+        trees.append(args[0] if args else kwargs.get("html"))
+        try:
+            return timed(self, *args, **kwargs)
+        finally:
+            if outermost:
+                for tree in trees:
+                    _drop_source(tree)
+
+                trees.clear()
+
+    return wrapper
+
+
+class section:
+    """Decorator turning a method that parses part of a model's page into an attribute. The
+    method takes the html of the page and returns the value of the attribute. Models
+    parse their sections when they are created, unless they are lazy or the section was not
+    picked with ``fields``, in which case it is parsed from the retained html the first time it
+    is accessed. Once the html has been released the page is fetched again instead."""
+
+    def __init__(self, func):
+        self.func = func
+        self.name = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+
+        if self.name not in instance.__dict__.get("_pending", ()):
+            raise AttributeError(
+                f"'{type(instance).__name__}' object has no attribute '{self.name}'"
+            )
+
+        if instance._html is None:
+            instance._refetch_sections()
+            return instance.__dict__[self.name]
+
+        value = self.parse(instance, instance._html, initial=False)
+        instance.__dict__[self.name] = value
+        instance._pending.discard(self.name)
+        return value
+
+    def parse(self, instance, html: BeautifulSoup, *, initial: bool = True):
+        """Parse the section of a model from the html of its page, emitting a ``section``
+        event if anything listens to it.
+
+        Parameters
+        -----------
+        instance : BaseMetaClass
+            The model the section belongs to
+        html : BeautifulSoup
+            The page of the model
+        initial : Optional[bool]
+            Whether the section is parsed while the model is built rather than on first access
+        """
+        if not has_hooks("section"):
+            return self.func(instance, html)
+
+        error = None
+        start = time.perf_counter()
+        try:
+            return self.func(instance, html)
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            emit(
+                "section",
+                model=type(instance),
+                instance=instance,
+                name=self.name,
+                duration=time.perf_counter() - start,
+                error=error,
+                html=html,
+                initial=initial,
+            )
+
 
 class BaseMetaClass:
     """An abstract class that implements the attributes present on nearly every page. In addition, it implements
@@ -29,6 +141,12 @@ class BaseMetaClass:
     -----------
     html : BeautifulSoup
         The html containing the comments
+    lazy : Optional[bool]
+        Parse the sections of the page, such as the comments, the first time they are
+        accessed instead of right away.
+    fields : Optional[Collection[str]]
+        The only sections of the page to parse right away, the others are parsed the first
+        time they are accessed.
 
     Attributes
     -----------
@@ -45,7 +163,22 @@ class BaseMetaClass:
         URL to report the page
     """
 
-    def __init__(self, html: BeautifulSoup):
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "__init__" in cls.__dict__:
+            cls.__init__ = _constructor(cls.__dict__["__init__"])
+
+    @_constructor
+    def __init__(self, html: BeautifulSoup, *, lazy: bool = False, fields: Collection[str] = None):
+        if fields is not None:
+            unknown = [x for x in fields if not isinstance(getattr(type(self), x, None), section)]
+            if unknown:
+                raise ValueError(f"{self.__class__.__name__} has no sections named {unknown}")
+
+        self._lazy = lazy
+        self._fields = fields
+        self._pending = set()
+
         if not getattr(self, "name", None):
             try:
                 self.name = html.find("a", itemprop="mainEntityOfPage").string
@@ -59,10 +192,7 @@ class BaseMetaClass:
                 ),
                 lambda: int(html.find("input", attrs={"name": "siteareaid"})["value"]),
                 lambda: int(html.find("meta", property="og:image")["content"].split("/")[-2]),
-                lambda: re.findall(
-                    r"https:\/\/www\.moddb\.com\/html\/scripts\/autocomplete\.php\?a=mentions&p=home&l=6&u=(\d*)",
-                    str(html),
-                )[0],
+                lambda: int(_MENTIONS_ID.search(get_source(html))[1]),
             ]
         ):
             try:
@@ -93,27 +223,67 @@ class BaseMetaClass:
                 exc_info=LOGGER.level >= logging.DEBUG,
             )
 
-        self.comments = self._get_comments(html)
-
         self._html = html
+        self._parse_sections(html, "comments")
 
     def __repr__(self):
         return f"<{self.__class__.__name__} name={self.name}>"
 
-    def _get_comments(self, html: BeautifulSoup) -> CommentList:
+    def release(self):
+        """Free the html tree the model was parsed from, the tree is decomposed so that the
+        strings kept by the model no longer hold on to it. Sections that have not been parsed
+        yet are parsed from a new copy of the page the first time one of them is accessed.
+        """
+        html, self._html = getattr(self, "_html", None), None
+        if html is not None:
+            decompose(html)
+
+    def _refetch_sections(self):
+        """Fetch the page again to parse all the pending sections once the html has been released"""
+        html = get_page(self.url)
+        for name in list(self._pending):
+            setattr(self, name, getattr(type(self), name).parse(self, html, initial=False))
+
+        self._pending.clear()
+        decompose(html)
+
+    def _parse_sections(self, html: BeautifulSoup, *names: str):
+        """Parse the given sections of the page, or mark them to be parsed on first access
+        if the model is lazy or they were not picked.
+
+        Parameters
+        -----------
+        html : BeautifulSoup
+            The page of the model
+        names : str
+            The names of the sections
+        """
+        for name in names:
+            if self._lazy or (self._fields is not None and name not in self._fields):
+                self._pending.add(name)
+            else:
+                setattr(self, name, getattr(type(self), name).parse(self, html))
+
+    @section
+    def comments(self, html: BeautifulSoup) -> CommentList:
+        return self._get_comments(html)
+
+    def _get_comments(self, html: BeautifulSoup, url: str = None) -> CommentList:
         """Extracts the comments from an html page and adds them to a CommentList.
 
         Parameters
         -----------
         html : BeautifulSoup
             The html containing the comments
+        url : Optional[str]
+            The url of the page, taken from the html if not given
 
         Returns
         --------
         CommentList
             The list of parsed comments
         """
-        results, current_page, total_pages, total_results = _parse_comments(html)
+        results, current_page, total_pages, total_results = _parse_comments(html, url)
 
         return CommentList(
             results=results,
@@ -141,7 +311,7 @@ class BaseMetaClass:
         ResultList[Thumbnail]
             The list of objects present on the page as a list of thumbnails.
         """
-        html = get_page(url, params=params)
+        html = get_page(url, params=params, parse_only=_RESULTS_STRAINER)
         results, current_page, total_pages, total_results = _parse_results(html)
 
         return ResultList(
@@ -153,30 +323,26 @@ class BaseMetaClass:
             total_results=total_results,
         )
 
-    def _get_media(self, index: int, *, html) -> List[Thumbnail]:
-        """Hidden method used to parse media content from the page. Since the only difference is that pages
-        with videos have one extra script that tells the window not do any sort of video playing assistance.
-        Also used to cached all media on a page.
+    def _get_media(self, html: BeautifulSoup) -> List[Thumbnail]:
+        """Hidden method used to parse media content from the page, taken from the script that
+        caches every media of the page.
 
         Parameters
         ----------
-        index : int
-            The index of the script containing the cached objects. 1 if it's only images, 2 if videos are
-            also included
+        html : BeautifulSoup
+            The page
 
         Returns
         --------
         List[Thumbnail]
             List of media like thumbnails that can be parsed individually. Can be a very long list.
         """
-        script = html.find_all("script", string=True)[index]
-        regex = r'new Array\(0, "(\S*)", "(\S*)"'
-        matches = re.findall(regex, script.text)
-
-        name_finder = r"\/([a-z0-9-]*)#imagebox"
+        # the cache is the only script of the page building these arrays, the position of the
+        # script among the others changes from page to page
+        matches = _MEDIA.findall(get_source(html))
         return [
             Thumbnail(
-                name=re.search(name_finder, match[0])[1],
+                name=_MEDIA_NAME.search(match[0])[1],
                 url=match[0],
                 type=ThumbnailType.media,
                 image=match[1],
@@ -202,7 +368,8 @@ class BaseMetaClass:
             A list-like object containing the comments and additional methods
         """
         params = {"deleted": "t" if show_deleted else None}
-        return self._get_comments(get_page(f"{self.url}/page/{index}", params=params))
+        html = get_page(f"{self.url}/page/{index}", params=params, parse_only=_COMMENTS_STRAINER)
+        return self._get_comments(html, self.url)
 
 
 class PageMetaClass(
@@ -218,6 +385,12 @@ class PageMetaClass(
 
     page_type : ThumbnailType
         The type of pages, this is passed down be the base class to help with the parsing of
+    lazy : Optional[bool]
+        Parse the sections of the page (profile, stats, style, suggestions, files, articles, article,
+        tags, imagebox, medias, description, plaintext and comments) the first time they are accessed
+        instead of right away. Useful when only a few of them are needed.
+    fields : Optional[Collection[str]]
+        The only sections of the page to parse right away, e.g. ``{"stats", "profile"}``
 
     Attributes
     -----------
@@ -261,29 +434,25 @@ class PageMetaClass(
         Plaintext version of the full description
     """
 
-    def __init__(self, html: BeautifulSoup, page_type: SearchCategory):
-        super().__init__(html)
+    def __init__(
+        self,
+        html: BeautifulSoup,
+        page_type: SearchCategory,
+        *,
+        lazy: bool = False,
+        fields: Collection[str] = None,
+    ):
+        super().__init__(html, lazy=lazy, fields=fields)
         self._type = page_type
 
         # boxes
         if page_type != SearchCategory.members:
-            self.profile = Profile(html)
-
-            try:
-                self.stats = Statistics(html)
-            except AttributeError:
-                LOGGER.info(
-                    "Entity '%s' has no stats (idk why, ask moddb)",
-                    self.name,
-                    exc_info=LOGGER.level >= logging.DEBUG,
-                )
-                self.stats = None
-
+            self._parse_sections(html, "profile", "stats")
             if page_type != SearchCategory.engines:
-                self.style = Style(html)
+                self._parse_sections(html, "style")
 
             # thumbnails
-            self.suggestions = self._get_suggestions(html)
+            self._parse_sections(html, "suggestions")
 
             # misc
             try:
@@ -291,25 +460,93 @@ class PageMetaClass(
             except TypeError:
                 self.embed = str(html.find_all("textarea")[1].a)
 
+        if page_type != SearchCategory.engines:
+            self._parse_sections(html, "files")
+
+        self._parse_sections(html, "articles", "article", "tags", "imagebox")
+
         try:
-            self.files = self._get_files(html)
+            self.rating = float(
+                html.find("div", class_="score").find("meta", itemprop="ratingValue")["content"]
+            )
         except AttributeError:
+            self.rating = 0.0
             LOGGER.info(
-                "'%s' '%s' has no files",
+                "'%s' '%s' is not rated",
                 self.__class__.__name__,
                 self.name,
                 exc_info=LOGGER.level >= logging.DEBUG,
             )
-            self.files = []
 
-        articles_raw = None
         try:
-            raw = html.find("span", string="Articles") or html.find(
-                "span", string="Related Articles"
+            self._review_hash = html.find("form", class_="ratingform").find(
+                "input", {"name": "hash"}
+            )["value"]
+        except AttributeError:
+            self._review_hash = None
+
+        self._parse_sections(html, "medias")
+
+        try:
+            self.summary = html.find("meta", itemprop="description")["content"]
+        except TypeError:
+            self.summary = None
+            LOGGER.info(
+                "'%s' '%s' has no summary",
+                self.__class__.__name__,
+                self.name,
+                exc_info=LOGGER.level >= logging.DEBUG,
             )
-            articles_raw = raw.parent.parent.parent.find("div", class_="table")
-            thumbnails = articles_raw.find_all("div", class_="row rowcontent clear")
-            self.articles = [
+
+        self._parse_sections(html, "description", "plaintext")
+
+    @section
+    def profile(self, html: BeautifulSoup) -> Profile:
+        return Profile(html)
+
+    @section
+    def stats(self, html: BeautifulSoup) -> Statistics:
+        try:
+            return Statistics(html)
+        except AttributeError:
+            LOGGER.info(
+                "Entity '%s' has no stats (idk why, ask moddb)",
+                self.name,
+                exc_info=LOGGER.level >= logging.DEBUG,
+            )
+            return None
+
+    @section
+    def style(self, html: BeautifulSoup) -> Style:
+        return Style(html)
+
+    @section
+    def suggestions(self, html: BeautifulSoup) -> List[Thumbnail]:
+        return self._get_suggestions(html)
+
+    @section
+    def files(self, html: BeautifulSoup) -> List[Thumbnail]:
+        try:
+            return self._get_files(html)
+        except AttributeError:
+            LOGGER.info(
+                "'%s' '%s' has no files",
+                self.__class__.__name__,
+                self.name,
+                exc_info=LOGGER.level >= logging.DEBUG,
+            )
+            return []
+
+    def _get_articles_box(self, html: BeautifulSoup):
+        """The box of articles on the front page, raises AttributeError if there is none"""
+        raw = html.find("span", string="Articles") or html.find("span", string="Related Articles")
+        return raw.parent.parent.parent.find("div", class_="table")
+
+    @section
+    def articles(self, html: BeautifulSoup) -> List[Thumbnail]:
+        try:
+            thumbnails = self._get_articles_box(html).find_all("div", class_="row rowcontent clear")
+            return [
                 Thumbnail(
                     name=x.a["title"],
                     url=x.a["href"],
@@ -327,40 +564,49 @@ class PageMetaClass(
                 self.name,
                 exc_info=LOGGER.level >= logging.DEBUG,
             )
-            self.articles = []
+            return []
+
+    @section
+    def article(self, html: BeautifulSoup) -> PartialArticle:
+        try:
+            articles_raw = self._get_articles_box(html)
+        except AttributeError:
+            articles_raw = None
 
-        # main page article
         if articles_raw:
-            self.article = PartialArticle(articles_raw)
+            return PartialArticle(articles_raw)
         else:
-            self.article = None
             LOGGER.info(
                 "'%s' '%s' has no front page article",
                 self.__class__.__name__,
                 self.name,
                 exc_info=LOGGER.level >= logging.DEBUG,
             )
+            return None
 
+    @section
+    def tags(self, html: BeautifulSoup) -> List[PartialTag]:
         try:
             raw_tags = html.find("form", attrs={"name": "tagsform"}).find_all("a")
-            self.tags = [
+            return [
                 PartialTag(x.string, join(x["href"]), x["href"].split("/")[-1])
                 for x in raw_tags
                 if x.string is not None
             ]
         except AttributeError:
-            self.tags = []
             LOGGER.info(
                 "'%s' '%s' has no tags",
                 self.__class__.__name__,
                 self.name,
                 exc_info=LOGGER.level >= logging.DEBUG,
             )
+            return []
 
-        # imagebox
+    @section
+    def imagebox(self, html: BeautifulSoup) -> List[Thumbnail]:
         try:
             imagebox = html.find("ul", id="imagebox").find_all("li")[1:-2]
-            self.imagebox = [
+            return [
                 Thumbnail(
                     name=x.a["title"],
                     url=x.a["href"],
@@ -377,55 +623,30 @@ class PageMetaClass(
                 self.name,
                 exc_info=LOGGER.level >= logging.DEBUG,
             )
-            self.imagebox = []
-
-        try:
-            self.rating = float(
-                html.find("div", class_="score").find("meta", itemprop="ratingValue")["content"]
-            )
-        except AttributeError:
-            self.rating = 0.0
-            LOGGER.info(
-                "'%s' '%s' is not rated",
-                self.__class__.__name__,
-                self.name,
-                exc_info=LOGGER.level >= logging.DEBUG,
-            )
-
-        try:
-            self._review_hash = html.find("form", class_="ratingform").find(
-                "input", {"name": "hash"}
-            )["value"]
-        except AttributeError:
-            self._review_hash = None
+            return []
 
-        self.medias = self._get_media(2, html=html)
+    @section
+    def medias(self, html: BeautifulSoup) -> List[Thumbnail]:
+        return self._get_media(html)
 
-        try:
-            self.summary = html.find("meta", itemprop="description")["content"]
-        except TypeError:
-            self.summary = None
+    @section
+    def description(self, html: BeautifulSoup) -> str:
+        description = html.find("div", id="profiledescription")
+        if description is None:
             LOGGER.info(
-                "'%s' '%s' has no summary",
+                "'%s' '%s' has no extended description",
                 self.__class__.__name__,
                 self.name,
                 exc_info=LOGGER.level >= logging.DEBUG,
             )
+            return None
 
-        self.description = str(html.find("div", id="profiledescription"))
+        return str(description)
 
-        try:
-            self.description = str(html.find("div", id="profiledescription"))
-            self.plaintext = html.find("div", id="profiledescription").text
-        except AttributeError:
-            LOGGER.info(
-                "'%s' '%s' has no extended description",
-                self.__class__.__name__,
-                self.name,
-                exc_info=LOGGER.level >= logging.DEBUG,
-            )
-            self.description = None
-            self.plaintext = None
+    @section
+    def plaintext(self, html: BeautifulSoup) -> str:
+        description = html.find("div", id="profiledescription")
+        return None if description is None else description.text
 
     def _get_suggestions(self, html: BeautifulSoup) -> List[Thumbnail]:
         """Hidden method used to get the list of suggestions on the page. As with most things, this list of suggestions
@@ -679,7 +900,7 @@ class HardwareSoftwareMetaClass(
                 "Hardware '%s' has no tags", self.name, exc_info=LOGGER.level >= logging.DEBUG
             )
 
-        self.medias = self._get_media(1, html=html)
+        self.medias = self._get_media(html)
 
         try:
             t = ThumbnailType[self.__class__.__name__.lower()]
@@ -1,10 +1,12 @@
 import logging
+from typing import Collection, List
 
 import bs4
 
+from ..boxes import Thumbnail
 from ..enums import SearchCategory
 from ..utils import LOGGER, concat_docs
-from .base import PageMetaClass
+from .base import PageMetaClass, section
 from .mixins import GetGamesMixin
 
 
@@ -16,6 +18,10 @@ class Engine(PageMetaClass, GetGamesMixin):
     -----------
     html : bs4.BeautifulSoup
         The html to parse. Allows for finer control.
+    lazy : Optional[bool]
+        Parse the sections of the page the first time they are accessed, see :class:`.PageMetaClass`
+    fields : Optional[Collection[str]]
+        The only sections of the page to parse right away, see :class:`.PageMetaClass`
 
     Filtering
     -----------
@@ -42,14 +48,18 @@ class Engine(PageMetaClass, GetGamesMixin):
         A list of games suggested on the engine main page.
     """
 
-    def __init__(self, html: bs4.BeautifulSoup):
-        super().__init__(html, SearchCategory.engines)
-        delattr(self, "files")
+    def __init__(
+        self, html: bs4.BeautifulSoup, *, lazy: bool = False, fields: Collection[str] = None
+    ):
+        super().__init__(html, SearchCategory.engines, lazy=lazy, fields=fields)
+        self._parse_sections(html, "games")
 
+    @section
+    def games(self, html: bs4.BeautifulSoup) -> List[Thumbnail]:
         try:
-            self.games = self._get_games(html)
+            return self._get_games(html)
         except AttributeError:
             LOGGER.info(
                 "Engine '%s' has no games", self.name, exc_info=LOGGER.level >= logging.DEBUG
             )
-            self.games = []
+            return []
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, List, Tuple
+from typing import TYPE_CHECKING, Collection, List, Tuple
 
 from ..boxes import (
     MemberProfile,
@@ -11,12 +11,13 @@ from ..boxes import (
     ResultList,
     Statistics,
     Thumbnail,
+    _RESULTS_STRAINER,
     _parse_results,
 )
 from ..enums import GroupCategory, Membership, SearchCategory, ThumbnailType, TimeFrame
 from ..utils import LOGGER, concat_docs, get_page, join
 from .article import Blog
-from .base import BaseMetaClass, PageMetaClass
+from .base import BaseMetaClass, PageMetaClass, section
 from .mixins import GetAddonsMixin, GetEnginesMixin, GetGamesMixin, GetModsMixin, GetWaresMixin
 
 if TYPE_CHECKING:
@@ -169,7 +170,7 @@ class Group(PageMetaClass, GetAddonsMixin):
                 .parent.text
             )
 
-        self.medias = self._get_media(2, html=html)
+        self.medias = self._get_media(html)
 
     def _get_suggestions(self, html: bs4.BeautifulSoup) -> List[Thumbnail]:
         """Hidden method used to get the list of suggestions on the page. As with most things, this list of suggestions
@@ -298,6 +299,10 @@ class Member(PageMetaClass, GetGamesMixin, GetModsMixin, GetAddonsMixin):
     -----------
     html : bs4.BeautifulSoup
         The html to parse. Allows for finer control.
+    lazy : Optional[bool]
+        Parse the sections of the page the first time they are accessed, see :class:`.PageMetaClass`
+    fields : Optional[Collection[str]]
+        The only sections of the page to parse right away, see :class:`.PageMetaClass`
 
     Sorting
     --------
@@ -329,43 +334,55 @@ class Member(PageMetaClass, GetGamesMixin, GetModsMixin, GetAddonsMixin):
         page
     """
 
-    def __init__(self, html: bs4.BeautifulSoup):
-        super().__init__(html, SearchCategory.members)
+    def __init__(
+        self, html: bs4.BeautifulSoup, *, lazy: bool = False, fields: Collection[str] = None
+    ):
+        super().__init__(html, SearchCategory.members, lazy=lazy, fields=fields)
+        self._parse_sections(html, "profile", "stats", "groups", "blog", "blogs", "friends")
+
+    @section
+    def profile(self, html: bs4.BeautifulSoup) -> MemberProfile:
         try:
-            self.profile = MemberProfile(html)
+            return MemberProfile(html)
         except AttributeError:
             LOGGER.info(
                 "Member '%s' has no profile (private)",
                 self.name,
                 exc_info=LOGGER.level >= logging.DEBUG,
             )
-            self.profile = None
+            return None
 
+    @section
+    def stats(self, html: bs4.BeautifulSoup) -> MemberStatistics:
         try:
-            self.stats = MemberStatistics(html)
+            return MemberStatistics(html)
         except AttributeError:
             LOGGER.info(
                 "Member '%s' has no stats (private)",
                 self.name,
                 exc_info=LOGGER.level >= logging.DEBUG,
             )
-            self.stats = None
+            return None
 
+    @section
+    def description(self, html: bs4.BeautifulSoup) -> str:
         try:
-            self.description = html.find("div", id="profiledescription").p.string
+            return html.find("div", id="profiledescription").p.string
         except AttributeError:
             LOGGER.info(
                 "Member '%s' has no description", self.name, exc_info=LOGGER.level >= logging.DEBUG
             )
-            self.description = None
+            return None
 
+    @section
+    def groups(self, html: bs4.BeautifulSoup) -> List[Thumbnail]:
         try:
             groups_raw = (
                 html.find("span", string="Groups")
                 .parent.parent.parent.find("div", class_="table")
                 .find_all("div", recursive=False)[:-2]
             )
-            self.groups = [
+            return [
                 Thumbnail(name=div.a["title"], url=div.a["href"], type=ThumbnailType.group)
                 for div in groups_raw
             ]
@@ -375,46 +392,52 @@ class Member(PageMetaClass, GetGamesMixin, GetModsMixin, GetAddonsMixin):
                 self.name,
                 exc_info=LOGGER.level >= logging.DEBUG,
             )
-            self.groups = []
+            return []
 
+    @section
+    def blog(self, html: bs4.BeautifulSoup) -> Blog:
         try:
             blogs_raw = (
                 html.find("span", string="My Blogs")
                 .parent.parent.parent.find("div", class_="table")
                 .find_all("div", recursive=False)
             )
-            self.blog = Blog(heading=blogs_raw.pop(0), text=blogs_raw.pop(0))
+            return Blog(heading=blogs_raw.pop(0), text=blogs_raw.pop(0))
         except (TypeError, AttributeError):
-            self.blog = None
             LOGGER.info(
                 "Member '%s' has no front page blog",
                 self.name,
                 exc_info=LOGGER.level >= logging.DEBUG,
             )
+            return None
 
+    @section
+    def blogs(self, html: bs4.BeautifulSoup) -> List[Thumbnail]:
         try:
             blogs_raw = (
                 html.find("span", string="My Blogs")
                 .parent.parent.parent.find("div", class_="table")
                 .find_all("div", recursive=False)
             )
-            self.blogs = [
+            return [
                 Thumbnail(name=blog.a.string, url=blog.a["href"], type=ThumbnailType.blog)
                 for blog in blogs_raw[:-2]
             ]
         except (TypeError, AttributeError):
-            self.blogs = []
             LOGGER.info(
                 "Member '%s' has no blog suggestions",
                 self.name,
                 exc_info=LOGGER.level >= logging.DEBUG,
             )
+            return []
 
+    @section
+    def friends(self, html: bs4.BeautifulSoup) -> List[Thumbnail]:
         try:
             friends = html.find("div", class_="table tablerelated").find_all(
                 "div", recursive=False
             )[1:]
-            self.friends = [
+            return [
                 Thumbnail(
                     name=friend.a["title"],
                     url=friend.a["href"],
@@ -423,10 +446,10 @@ class Member(PageMetaClass, GetGamesMixin, GetModsMixin, GetAddonsMixin):
                 for friend in friends
             ]
         except AttributeError:
-            self.friends = []
             LOGGER.info(
                 "Member '%s' has no friends ;(", self.name, exc_info=LOGGER.level >= logging.DEBUG
             )
+            return []
 
     def __repr__(self):
         return f"<Member name={self.name} level={self.profile.level}>"
@@ -465,7 +488,7 @@ class Member(PageMetaClass, GetGamesMixin, GetModsMixin, GetAddonsMixin):
         }
 
         url = f"{self.url}/blogs"
-        html = get_page(f"{url}/page/{index}", params=params)
+        html = get_page(f"{url}/page/{index}", params=params, parse_only=_RESULTS_STRAINER)
         results, current_page, total_pages, total_results = _parse_results(html)
 
         return ResultList(
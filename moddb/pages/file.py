@@ -1,23 +1,22 @@
 import datetime
 import re
 import sys
-from typing import BinaryIO, List
+from typing import BinaryIO, Collection, List
 
 import bs4
 import requests
 
 from ..boxes import Mirror, Thumbnail
+from ..decoders import parse_date, parse_int, parse_views
 from ..enums import AddonCategory, FileCategory, MediaCategory, ThumbnailType
 from ..utils import (
     BASE_URL,
     concat_docs,
-    get_date,
     get_page,
-    get_views,
     join,
     prepare_request,
 )
-from .base import BaseMetaClass
+from .base import BaseMetaClass, section
 
 
 def parse_location(html) -> list[Thumbnail] | None:
@@ -47,6 +46,11 @@ class File(BaseMetaClass):
     -----------
     html : bs4.BeautifulSoup
         The html to parse. Allows for finer control.
+    lazy : Optional[bool]
+        Parse the sections of the page (author, date, button, widget, description, preview,
+        location and comments) the first time they are accessed instead of right away.
+    fields : Optional[Collection[str]]
+        The only sections of the page to parse right away.
 
     Filtering
     ----------
@@ -104,7 +108,9 @@ class File(BaseMetaClass):
         directly attached to this file.
     """
 
-    def __init__(self, html: bs4.BeautifulSoup):
+    def __init__(
+        self, html: bs4.BeautifulSoup, *, lazy: bool = False, fields: Collection[str] = None
+    ):
         if html.find("span", string="File Deleted", class_="heading"):
             raise ValueError("This file has been removed")
 
@@ -117,14 +123,14 @@ class File(BaseMetaClass):
             html.find("a", title="Report").parent.parent.find("span", class_="heading").string
         )
         self.filename = file["filename"]
-        super().__init__(html)
+        super().__init__(html, lazy=lazy, fields=fields)
 
         self.hash = file["md5 hash"]
         self.size = int(re.sub(r"[(),bytes]", "", file["size"].split(" ")[1]))
 
         downloads = html.find("h5", string="Downloads").parent.a.string
         self.today = int(re.sub(r"[(),today]", "", downloads.split(" ")[1]))
-        self.downloads = int(downloads.split(" ")[0].replace(",", ""))
+        self.downloads = parse_int(downloads.split(" ")[0])
 
         try:
             self.category = FileCategory(
@@ -135,20 +141,41 @@ class File(BaseMetaClass):
                 int(info.find("h5", string="Category").parent.a["href"].split("=")[-1])
             )
 
-        uploader = info.find("h5", string="Uploader").parent.a
-        self.author = Thumbnail(
-            url=uploader["href"], name=uploader.string, type=ThumbnailType.member
+        self._parse_sections(
+            html, "author", "date", "button", "widget", "description", "preview", "location"
         )
 
-        self.date = get_date(info.find("h5", string="Added").parent.span.time["datetime"])
-        self.button = info.find("h5", string="Embed Button").parent.span.input["value"]
-        self.widget = info.find("h5", string="Embed Widget").parent.span.input["value"]
+    @section
+    def author(self, html: bs4.BeautifulSoup) -> Thumbnail:
+        uploader = html.find("div", class_="table tablemenu").find("h5", string="Uploader").parent.a
+        return Thumbnail(url=uploader["href"], name=uploader.string, type=ThumbnailType.member)
 
-        self.description = html.find("p", id="downloadsummary").string
+    @section
+    def date(self, html: bs4.BeautifulSoup) -> datetime.datetime:
+        info = html.find("div", class_="table tablemenu")
+        return parse_date(info.find("h5", string="Added").parent.span.time["datetime"])
+
+    @section
+    def button(self, html: bs4.BeautifulSoup) -> str:
+        info = html.find("div", class_="table tablemenu")
+        return info.find("h5", string="Embed Button").parent.span.input["value"]
+
+    @section
+    def widget(self, html: bs4.BeautifulSoup) -> str:
+        info = html.find("div", class_="table tablemenu")
+        return info.find("h5", string="Embed Widget").parent.span.input["value"]
 
-        self.preview = html.find_all("img", src=True)[0]["src"]
+    @section
+    def description(self, html: bs4.BeautifulSoup) -> str:
+        return html.find("p", id="downloadsummary").string
 
-        self.location = parse_location(html)
+    @section
+    def preview(self, html: bs4.BeautifulSoup) -> str:
+        return html.find_all("img", src=True)[0]["src"]
+
+    @section
+    def location(self, html: bs4.BeautifulSoup) -> List[Thumbnail]:
+        return parse_location(html)
 
     def __repr__(self):
         return f"<{self.__class__.__name__} name={self.name} type={self.category.name}>"
@@ -211,7 +238,7 @@ class File(BaseMetaClass):
                     index=int(mirror_match.group(2)),
                     city=mirror_match.group(3),
                     country=mirror_match.group(4),
-                    served=int(stats_match.group(1).replace(",", "")),
+                    served=parse_int(stats_match.group(1)),
                     capacity=float(stats_match.group(2)),
                     url=mirror.div.p.a["href"],
                 )
@@ -270,6 +297,11 @@ class Media(BaseMetaClass):
     -----------
     html : bs4.BeautifulSoup
         The html to parse. Allows for finer control.
+    lazy : Optional[bool]
+        Parse the sections of the page (author, description and comments) the first time they
+        are accessed instead of right away.
+    fields : Optional[Collection[str]]
+        The only sections of the page to parse right away.
 
     Filtering
     -----------
@@ -312,22 +344,19 @@ class Media(BaseMetaClass):
         The description of the file as given by the file uploader.
     """
 
-    def __init__(self, html: bs4.BeautifulSoup):
+    def __init__(
+        self, html: bs4.BeautifulSoup, *, lazy: bool = False, fields: Collection[str] = None
+    ):
         try:
             self.name = html.find("meta", itemprop="name")["content"]
         except TypeError:
             self.name = html.find("img", id="mediaimage")["title"]
 
-        super().__init__(html)
+        super().__init__(html, lazy=lazy, fields=fields)
         medias = html.find_all("h5", string=("Date", "By", "Duration", "Size", "Views", "Filename"))
         raw_media = {media.string.lower(): media.parent for media in medias}
 
-        self.date = get_date(raw_media["date"].span.time["datetime"])
-
-        author = raw_media["by"].span.a
-        self.author = Thumbnail(
-            url=author["href"], name=author.string.strip(), type=ThumbnailType.member
-        )
+        self.date = parse_date(raw_media["date"].span.time["datetime"])
 
         if "duration" in raw_media:
             duration = raw_media["duration"].span.time.string.strip().split(":")
@@ -342,7 +371,7 @@ class Media(BaseMetaClass):
         if "size" in raw_media:
             self.size = tuple(raw_media["size"].span.string.strip().split("×"))
 
-        self.views, self.today = get_views(raw_media["views"].a.string)
+        self.views, self.today = parse_views(raw_media["views"].a.string)
         media_player = html.find("video", id="mediaplayer")
 
         if not media_player:
@@ -360,7 +389,16 @@ class Media(BaseMetaClass):
         else:
             self.filename = self.fileurl.split("/")[-1]
 
-        self.description = html.find("meta", {"name": "description"})["content"]
+        self._parse_sections(html, "author", "description")
+
+    @section
+    def author(self, html: bs4.BeautifulSoup) -> Thumbnail:
+        author = html.find_all("h5", string="By")[-1].parent.span.a
+        return Thumbnail(url=author["href"], name=author.string.strip(), type=ThumbnailType.member)
+
+    @section
+    def description(self, html: bs4.BeautifulSoup) -> str:
+        return html.find("meta", {"name": "description"})["content"]
 
     def __repr__(self):
         return f"<Media name={self.name} type={self.category.name}>"
@@ -4,6 +4,7 @@ import bs4
 
 from ..boxes import Thumbnail
 from ..enums import ThumbnailType
+from ..hooks import timed_init
 from ..utils import LOGGER, get_page, get_page_type, join
 from . import opinion
 
@@ -39,6 +40,7 @@ class FrontPage:
         The url to the poll on the front page
     """
 
+    @timed_init
     def __init__(self, html: bs4.BeautifulSoup):
         slider = html.find("div", class_="rotatorholder").find_all("div", class_="rotatorbox")
         self.slider = []
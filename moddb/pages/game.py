@@ -1,3 +1,5 @@
+from typing import Collection
+
 import bs4
 
 from ..enums import SearchCategory
@@ -14,6 +16,10 @@ class Game(PageMetaClass, GetModsMixin, GetAddonsMixin):
     -----------
     html : bs4.BeautifulSoup
         The html to parse. Allows for finer control.
+    lazy : Optional[bool]
+        Parse the sections of the page the first time they are accessed, see :class:`.PageMetaClass`
+    fields : Optional[Collection[str]]
+        The only sections of the page to parse right away, see :class:`.PageMetaClass`
 
 
     Filtering
@@ -42,5 +48,7 @@ class Game(PageMetaClass, GetModsMixin, GetAddonsMixin):
         * **dateup** - order by latest update, asc is most recent update first, desc is oldest update first
     """
 
-    def __init__(self, html: bs4.BeautifulSoup):
-        super().__init__(html, SearchCategory.games)
+    def __init__(
+        self, html: bs4.BeautifulSoup, *, lazy: bool = False, fields: Collection[str] = None
+    ):
+        super().__init__(html, SearchCategory.games, lazy=lazy, fields=fields)
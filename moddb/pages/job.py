@@ -6,7 +6,8 @@ import bs4
 
 from ..boxes import PartialTag, Thumbnail
 from ..enums import JobSkill, ThumbnailType
-from ..utils import LOGGER, join
+from ..hooks import timed_init
+from ..utils import LOGGER, decompose, join
 
 
 class Job:
@@ -57,6 +58,7 @@ class Job:
 
     """
 
+    @timed_init
     def __init__(self, html: bs4.BeautifulSoup):
         breadcrumb = json.loads(html.find("script", type="application/ld+json").string)[
             "itemListElement"
@@ -118,5 +120,12 @@ class Job:
 
         self._html = html
 
+    def release(self):
+        """Free the html tree the job was parsed from, the tree is decomposed so that the
+        strings kept by the job no longer hold on to it."""
+        html, self._html = getattr(self, "_html", None), None
+        if html is not None:
+            decompose(html)
+
     def __repr__(self):
         return f"<Job name={self.name}>"
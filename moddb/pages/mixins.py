@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, List, Tuple, Union
 
-from ..boxes import Tag
+from ..boxes import _RESULTS_STRAINER, Tag
 from ..utils import BASE_URL, get_page, get_sitearea
 
 if TYPE_CHECKING:
@@ -234,7 +234,7 @@ class SharedMethodsMixin:
 
         base_url = f"{self.url}/reviews"
         url = f"{base_url}/page/{index}"
-        html = get_page(url, params=params)
+        html = get_page(url, params=params, parse_only=_RESULTS_STRAINER)
         results, current_page, total_pages, total_results = parse_reviews(html)
 
         return ReviewList(
@@ -339,7 +339,7 @@ class SharedMethodsMixin:
             The list of image type thumbnails parsed from the page
         """
         html = get_page(f"{self.url}/images")
-        return self._get_media(1, html=html)
+        return self._get_media(html)
 
     def get_videos(self) -> List[Thumbnail]:
         """Get all the videos a page has uploaded. Literally all of them. As thumbnails. ModDB's imagebox
@@ -352,7 +352,7 @@ class SharedMethodsMixin:
             The list of video type thumbnails parsed from the page
         """
         html = get_page(f"{self.url}/videos")
-        return self._get_media(2, html=html)
+        return self._get_media(html)
 
     def get_tutorials(
         self,
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Collection
 
 from ..enums import SearchCategory
 from ..utils import concat_docs
@@ -19,6 +19,10 @@ class Mod(PageMetaClass, GetAddonsMixin):
     -----------
     html : bs4.BeautifulSoup
         The html to parse. Allows for finer control.
+    lazy : Optional[bool]
+        Parse the sections of the page the first time they are accessed, see :class:`.PageMetaClass`
+    fields : Optional[Collection[str]]
+        The only sections of the page to parse right away, see :class:`.PageMetaClass`
 
     Filtering
     ----------
@@ -49,5 +53,5 @@ class Mod(PageMetaClass, GetAddonsMixin):
 
     """
 
-    def __init__(self, html: BeautifulSoup):
-        super().__init__(html, SearchCategory.mods)
+    def __init__(self, html: BeautifulSoup, *, lazy: bool = False, fields: Collection[str] = None):
+        super().__init__(html, SearchCategory.mods, lazy=lazy, fields=fields)
@@ -3,9 +3,10 @@ from __future__ import annotations
 import re
 from typing import TYPE_CHECKING
 
-from ..boxes import ModDBList, Option, Thumbnail
+from ..boxes import _RESULTS_STRAINER, ModDBList, Option, Thumbnail
+from ..decoders import parse_date
 from ..enums import ThumbnailType
-from ..utils import concat_docs, get_date, get_list_stats, join
+from ..utils import concat_docs, get_list_stats, join
 from .base import BaseMetaClass
 
 if TYPE_CHECKING:
@@ -25,6 +26,8 @@ class ReviewList(ModDBList):
         The total amount of results available
     """
 
+    _strainer = _RESULTS_STRAINER
+
     def _parse_method(self, html: BeautifulSoup):
         return parse_reviews(html)
 
@@ -119,7 +122,7 @@ class Review:
             name=author.string.split(" ")[0],
             type=ThumbnailType.member,
         )
-        self.date = get_date(review.div.span.time["datetime"])
+        self.date = parse_date(review.div.span.time["datetime"])
 
         try:
             self.agree = join(review.find("a", title="Agree")["href"])
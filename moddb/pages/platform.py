@@ -4,8 +4,9 @@ import logging
 from typing import TYPE_CHECKING
 
 from ..boxes import PlatformStatistics, Thumbnail
+from ..decoders import parse_date
 from ..enums import ThumbnailType
-from ..utils import LOGGER, concat_docs, get_date, join
+from ..utils import LOGGER, concat_docs, join
 from .base import BaseMetaClass
 from .mixins import GetEnginesMixin, GetGamesMixin, GetModsMixin, GetWaresMixin
 
@@ -102,7 +103,7 @@ class Platform(
 
         self.homepage = html.find("h5", string="Homepage").parent.span.a["href"]
 
-        self.date = get_date(html.find("time", itemprop="releaseDate")["datetime"])
+        self.date = parse_date(html.find("time", itemprop="releaseDate")["datetime"])
 
         self.stats = PlatformStatistics(html)
 
@@ -0,0 +1,263 @@
+import itertools
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from .hooks import add_hook, remove_hook
+from .metrics import Histogram
+from .utils import LOGGER, get_source
+
+#: Upper bounds of the buckets of the section histograms, in seconds
+SECTION_BUCKETS = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+)
+
+#: Name of the field the time spent building a model outside of its sections is counted in
+OTHER = "(other)"
+
+
+class FieldProfile:
+    """The cost of parsing a field of a model over a run.
+
+    Attributes
+    -----------
+    histogram : Histogram
+        The durations, in seconds
+    max : float
+        The longest duration
+    errors : int
+        The number of times parsing the field raised
+    """
+
+    __slots__ = ("histogram", "max", "errors")
+
+    def __init__(self):
+        self.histogram = Histogram(SECTION_BUCKETS)
+        self.max = 0.0
+        self.errors = 0
+
+    def __repr__(self):
+        return f"<FieldProfile count={self.histogram.count} total={self.histogram.sum:.3f}>"
+
+    def add(self, duration: float, error: bool = False):
+        self.histogram.observe(duration)
+        self.max = max(self.max, duration)
+        self.errors += error
+
+
+class _Frame:
+    """The sections of a model parsed while it is being built"""
+
+    __slots__ = ("sections", "html", "failed")
+
+    def __init__(self):
+        self.sections: Dict[str, float] = {}
+        self.html = None
+        self.failed = False
+
+
+class ParseProfiler:
+    """Time every section of the models built while it is installed, e.g. the ``profile``,
+    ``stats`` or ``comments`` of a mod, and aggregate the cost of each field across the run.
+    The time spent building a model outside of its sections, such as getting its id or
+    rating, is counted as the ``(other)`` field.
+
+    .. code-block:: python3
+
+        with moddb.ParseProfiler(budget=0.5, dump="slow") as profiler:
+            for url in urls:
+                moddb.parse_page(url)
+
+        print(profiler.format())
+
+    Parameters
+    -----------
+    budget : Optional[float]
+        Time in seconds over which building a model is reported in ``slow``
+    dump : Optional[str]
+        Directory the html of the pages over the budget is written to, created if needed
+
+    Attributes
+    -----------
+    slow : List[dict]
+        The models that took longer than the budget to build, with their ``model``, total
+        ``duration``, the duration of each of their ``sections`` and the ``path`` their html
+        was dumped to, if it was.
+    """
+
+    def __init__(self, budget: float = None, *, dump: str = None):
+        self.budget = budget
+        self.dump = dump
+        self.slow: List[dict] = []
+        self._fields: Dict[Tuple[str, str], FieldProfile] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._dumped = itertools.count()
+        self._hooks = {"section": self._on_section, "model": self._on_model}
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} fields={len(self._fields)} slow={len(self.slow)}>"
+
+    def __enter__(self):
+        self.install()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.uninstall()
+
+    def install(self):
+        """Start timing the models built."""
+        for event, hook in self._hooks.items():
+            add_hook(event, hook)
+
+    def uninstall(self):
+        """Stop timing the models built, the recorded timings are kept."""
+        for event, hook in self._hooks.items():
+            remove_hook(event, hook)
+
+    def reset(self):
+        """Clear every timing and the slow pages."""
+        with self._lock:
+            self._fields.clear()
+            self.slow.clear()
+
+    def field(self, model: str, name: str) -> Optional[FieldProfile]:
+        """Get the profile of a field.
+
+        Parameters
+        -----------
+        model : str
+            The name of the model class, e.g. ``Mod``
+        name : str
+            The name of the section, or ``(other)``
+
+        Returns
+        --------
+        Optional[FieldProfile]
+            The profile, None if the field was never parsed
+        """
+        return self._fields.get((model, name))
+
+    def report(self) -> List[dict]:
+        """Get the cost of every field, most expensive first.
+
+        Returns
+        --------
+        List[dict]
+            The ``model``, ``field``, ``count``, ``total``, ``mean``, ``p50``, ``p99`` and
+            ``max`` durations in seconds and the number of ``errors`` of each field, along with
+            its ``share`` of the total time spent parsing its model.
+        """
+        with self._lock:
+            fields = dict(self._fields)
+
+        totals = {}
+        for (model, _), profile in fields.items():
+            totals[model] = totals.get(model, 0) + profile.histogram.sum
+
+        rows = [
+            {
+                "model": model,
+                "field": name,
+                "count": profile.histogram.count,
+                "total": profile.histogram.sum,
+                "mean": profile.histogram.mean,
+                # estimates interpolated inside a bucket can overshoot the longest duration
+                "p50": min(profile.histogram.quantile(0.5), profile.max),
+                "p99": min(profile.histogram.quantile(0.99), profile.max),
+                "max": profile.max,
+                "errors": profile.errors,
+                "share": profile.histogram.sum / totals[model] if totals[model] else 0.0,
+            }
+            for (model, name), profile in fields.items()
+        ]
+        return sorted(rows, key=lambda row: row["total"], reverse=True)
+
+    def format(self, limit: int = None) -> str:
+        """Get the report as a table.
+
+        Parameters
+        -----------
+        limit : Optional[int]
+            The number of fields to show, all of them by default
+
+        Returns
+        --------
+        str
+            The table, with the durations in milliseconds
+        """
+        lines = [
+            f"{'model':<12}{'field':<14}{'count':>7}{'total':>10}{'mean':>9}{'p99':>9}"
+            f"{'max':>9}{'share':>7}{'errors':>8}"
+        ]
+        for row in self.report()[:limit]:
+            lines.append(
+                f"{row['model']:<12}{row['field']:<14}{row['count']:>7}"
+                f"{row['total'] * 1000:>10.2f}{row['mean'] * 1000:>9.3f}"
+                f"{row['p99'] * 1000:>9.3f}{row['max'] * 1000:>9.3f}"
+                f"{row['share']:>7.1%}{row['errors']:>8}"
+            )
+
+        return "\n".join(lines)
+
+    def _add(self, model: str, name: str, duration: float, error: bool):
+        with self._lock:
+            profile = self._fields.get((model, name))
+            if profile is None:
+                profile = self._fields[(model, name)] = FieldProfile()
+
+            profile.add(duration, error)
+
+    def _frame(self, instance) -> _Frame:
+        # models can be built while another one is, e.g. in one of its sections, each of them
+        # gets its own frame
+        frames = self._local.__dict__.setdefault("frames", {})
+        frame = frames.get(id(instance))
+        if frame is None:
+            frame = frames[id(instance)] = _Frame()
+
+        return frame
+
+    def _on_section(self, *, model, instance, name, duration, error, html, initial):
+        self._add(model.__name__, name, duration, error is not None)
+        if initial:
+            frame = self._frame(instance)
+            frame.sections[name] = frame.sections.get(name, 0) + duration
+            frame.html = html
+            frame.failed = error is not None
+
+    def _on_model(self, *, model, instance, duration, error):
+        frame = self._local.__dict__.get("frames", {}).pop(id(instance), None) or _Frame()
+        sections, html = frame.sections, frame.html
+        # errors raised by a section were already counted against it
+        failed = error is not None and not frame.failed
+        self._add(model.__name__, OTHER, max(duration - sum(sections.values()), 0), failed)
+
+        if self.budget is None or duration <= self.budget:
+            return
+
+        path = None
+        if self.dump is not None and html is not None:
+            os.makedirs(self.dump, exist_ok=True)
+            path = os.path.join(self.dump, f"{model.__name__.lower()}-{next(self._dumped)}.html")
+
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(get_source(html))
+
+        LOGGER.info("Building %s took %.3fs, over the budget of %ss", model, duration, self.budget)
+        with self._lock:
+            self.slow.append(
+                {"model": model.__name__, "duration": duration, "sections": sections, "path": path}
+            )
@@ -0,0 +1,200 @@
+import http.server
+import math
+import os
+import sys
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .metrics import Labels, MetricsRegistry
+
+#: Prefix of the name of every exported metric
+PREFIX = "moddb_"
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_HELP = {
+    "requests_total": "Requests that got a response, by page type, method, status and source",
+    "request_errors_total": "Requests that failed without a response, by page type and error",
+    "response_bytes_total": "Bytes of response bodies, by page type",
+    "cache_lookups_total": "Lookups of GET requests in the response cache, by result",
+    "soup_bytes_total": "Bytes of html parsed, by parser",
+    "model_errors_total": "Models whose construction raised, by model",
+    "ratelimited_total": "Calls refused by a ratelimit, by ratelimit",
+    "request_duration_seconds": "Time to get a response, by page type, method and source",
+    "page_duration_seconds": "Time get_page took from the request to the tree, by page type",
+    "soup_duration_seconds": "Time to parse html into a tree, by parser",
+    "model_duration_seconds": "Time to build a model from a tree, by model",
+    "section_duration_seconds": "Time to parse a section of a model, by model and section",
+    "ratelimit_wait_seconds": "Time slept waiting for a ratelimit, by ratelimit",
+}
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(labels: Iterable[Tuple[str, str]]) -> str:
+    pairs = ",".join(f'{name}="{_escape(str(value))}"' for name, value in labels)
+    return f"{{{pairs}}}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _family(lines: List[str], name: str, kind: str, help: Optional[str]):
+    if help:
+        lines.append(f"# HELP {PREFIX}{name} {help}")
+
+    lines.append(f"# TYPE {PREFIX}{name} {kind}")
+
+
+def _group(metrics: Dict[Tuple[str, Labels], object]) -> Dict[str, List[Tuple[Labels, object]]]:
+    families = {}
+    for (name, labels), value in sorted(metrics.items()):
+        families.setdefault(name, []).append((labels, value))
+
+    return families
+
+
+def _cache_lines(lines: List[str]):
+    """Export the statistics of the response and model caches, if they are set"""
+    moddb = sys.modules["moddb"]
+    for prefix, cache, counters, gauges in (
+        (
+            "response_cache",
+            moddb.RESPONSE_CACHE,
+            ("hits", "misses", "revalidations"),
+            ("entries", "size"),
+        ),
+        (
+            "model_cache",
+            moddb.MODEL_CACHE,
+            ("hits", "misses", "evictions", "revalidations"),
+            ("size", "capacity"),
+        ),
+    ):
+        if cache is None:
+            continue
+
+        stats = cache.stats()
+        for key in counters:
+            _family(lines, f"{prefix}_{key}_total", "counter", None)
+            lines.append(f"{PREFIX}{prefix}_{key}_total {_number(stats[key])}")
+
+        for key in gauges:
+            _family(lines, f"{prefix}_{key}", "gauge", None)
+            lines.append(f"{PREFIX}{prefix}_{key} {_number(stats[key])}")
+
+        lookups = stats["hits"] + stats["misses"]
+        _family(lines, f"{prefix}_hit_ratio", "gauge", "Share of lookups served by the cache")
+        lines.append(
+            f"{PREFIX}{prefix}_hit_ratio {_number(stats['hits'] / lookups if lookups else 0.0)}"
+        )
+
+
+def render(registry: MetricsRegistry) -> str:
+    """Render the metrics of a registry, and the statistics of ``moddb.RESPONSE_CACHE`` and
+    ``moddb.MODEL_CACHE`` if they are set, in the Prometheus text format.
+
+    Parameters
+    -----------
+    registry : MetricsRegistry
+        The registry to export
+
+    Returns
+    --------
+    str
+        The metrics, one sample per line
+    """
+    lines = []
+    for name, samples in _group(registry.counters()).items():
+        _family(lines, name, "counter", _HELP.get(name))
+        for labels, value in samples:
+            lines.append(f"{PREFIX}{name}{_labels(labels)} {_number(value)}")
+
+    for name, samples in _group(registry.histograms()).items():
+        _family(lines, name, "histogram", _HELP.get(name))
+        for labels, histogram in samples:
+            for bound, count in histogram.cumulative():
+                le = _labels([*labels, ("le", _number(float(bound)))])
+                lines.append(f"{PREFIX}{name}_bucket{le} {count}")
+
+            lines.append(
+                f"{PREFIX}{name}_bucket{_labels([*labels, ('le', '+Inf')])} {histogram.count}"
+            )
+            lines.append(f"{PREFIX}{name}_sum{_labels(labels)} {_number(histogram.sum)}")
+            lines.append(f"{PREFIX}{name}_count{_labels(labels)} {histogram.count}")
+
+    registered = {name for name, _ in registry.counters()}
+    if "cache_lookups_total" in registered:
+        hits = registry.counter("cache_lookups_total", result="hit")
+        lookups = hits + registry.counter("cache_lookups_total", result="miss")
+        _family(lines, "cache_hit_ratio", "gauge", "Share of cache lookups that were hits")
+        lines.append(f"{PREFIX}cache_hit_ratio {_number(hits / lookups)}")
+
+    _cache_lines(lines)
+    return "\n".join(lines) + "\n"
+
+
+def write(registry: MetricsRegistry, path: str):
+    """Write the metrics to a file, e.g. for the textfile collector of the node exporter. The
+    file is replaced at once so that it is never read half written.
+
+    Parameters
+    -----------
+    registry : MetricsRegistry
+        The registry to export
+    path : str
+        The file to write
+    """
+    temporary = f"{path}.tmp"
+    with open(temporary, "w") as f:
+        f.write(render(registry))
+
+    os.replace(temporary, path)
+
+
+def start_http_server(
+    registry: MetricsRegistry, port: int = 9464, *, address: str = "127.0.0.1"
+) -> http.server.ThreadingHTTPServer:
+    """Serve the metrics on ``/metrics`` from a background thread.
+
+    Parameters
+    -----------
+    registry : MetricsRegistry
+        The registry to export
+    port : int
+        The port to listen on, 0 picks a free port
+    address : str
+        The address to listen on, only the local machine by default
+
+    Returns
+    --------
+    http.server.ThreadingHTTPServer
+        The server, call its ``shutdown`` method to stop it
+    """
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+
+            body = render(registry).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer((address, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="moddb-metrics", daemon=True).start()
+    return server
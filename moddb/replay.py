@@ -0,0 +1,301 @@
+import glob
+import io
+import itertools
+import os
+import random
+import sys
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from .cache import normalize_url
+from .utils import BASE_URL, LOGGER
+
+#: Headers describing the recorded bytes rather than the decoded body that is served
+_DROPPED_HEADERS = ("content-encoding", "content-length", "transfer-encoding")
+
+
+class _Recording:
+    __slots__ = ("status", "reason", "headers", "content")
+
+    def __init__(self, status: int, reason: str, headers: Dict[str, str], content: bytes):
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.content = content
+
+
+class CassetteAdapter(BaseAdapter):
+    """A transport adapter serving recorded responses instead of making requests, to run the
+    whole request, ratelimit and parsing pipeline of the library without network access.
+    Responses can be loaded from VCR cassettes, such as the ones in ``tests/cassettes``, or
+    from a directory of html files, and the adapter can add latency and fail some requests
+    to simulate the real website.
+
+    When the same request was recorded several times the recordings are served in turn.
+    Requests that were not recorded get a 404 response and are listed in ``misses``.
+
+    .. code-block:: python3
+
+        adapter = CassetteAdapter.from_cassettes("tests/cassettes", latency=(0.05, 0.2))
+        adapter.mount()  # on moddb.SESSION
+        adapter.mount(client._session)
+
+    Parameters
+    -----------
+    latency : Union[float, Tuple[float, float]]
+        Seconds every response is delayed by, or the bounds of a uniformly random delay
+    error_rate : float
+        The probability that a request fails, between 0 and 1
+    error_status : Optional[int]
+        The status code of failed requests. If None failed requests raise
+        ``requests.ConnectionError`` instead, as if the connection had dropped.
+    seed : Optional[int]
+        Seed of the random latency and errors, to replay the same run
+
+    Attributes
+    -----------
+    served : int
+        The number of recorded responses served
+    errors : int
+        The number of requests failed on purpose
+    misses : List[str]
+        The urls of the requests that had no recording
+    """
+
+    def __init__(
+        self,
+        *,
+        latency: Union[float, Tuple[float, float]] = 0,
+        error_rate: float = 0,
+        error_status: Optional[int] = 503,
+        seed: Optional[int] = None,
+    ):
+        super().__init__()
+        if not 0 <= error_rate <= 1:
+            raise ValueError("error_rate must be between 0 and 1")
+
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.served = 0
+        self.errors = 0
+        self.misses = []
+
+        self._recordings: Dict[Tuple[str, str], List[_Recording]] = {}
+        self._cycles: Dict[Tuple[str, str], itertools.cycle] = {}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__} recordings={len(self)} served={self.served} "
+            f"errors={self.errors} misses={len(self.misses)}>"
+        )
+
+    def __len__(self):
+        return sum(len(recordings) for recordings in self._recordings.values())
+
+    @classmethod
+    def from_cassettes(cls, *paths: str, **kwargs) -> "CassetteAdapter":
+        """Load the responses recorded in VCR cassettes. Requires pyyaml, which can be installed
+        with the ``replay`` extra.
+
+        Parameters
+        -----------
+        paths : str
+            Cassette files, or directories searched recursively for ``.yaml`` cassettes
+        kwargs
+            The keyword arguments of the adapter
+
+        Returns
+        --------
+        CassetteAdapter
+            The adapter serving the recorded responses
+        """
+        import yaml
+
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        adapter = cls(**kwargs)
+        for path in _expand(paths, "*.yaml"):
+            with open(path) as f:
+                cassette = yaml.load(f, Loader=loader) or {}
+
+            for interaction in cassette.get("interactions", []):
+                request, response = interaction["request"], interaction["response"]
+                headers = {name: ", ".join(values) for name, values in response["headers"].items()}
+                body = response["body"].get("string", "")
+                adapter.add(
+                    request["method"],
+                    request["uri"],
+                    body,
+                    status=response["status"]["code"],
+                    reason=response["status"]["message"],
+                    headers=headers,
+                )
+
+        LOGGER.info("Loaded %s recorded responses", len(adapter))
+        return adapter
+
+    @classmethod
+    def from_directory(cls, path: str, *, base_url: str = BASE_URL, **kwargs) -> "CassetteAdapter":
+        """Load a directory of html files, each served as the page of the same path, e.g.
+        ``mods/edain-mod.html`` is served for ``https://www.moddb.com/mods/edain-mod`` and
+        ``mods/index.html`` for ``https://www.moddb.com/mods``.
+
+        Parameters
+        -----------
+        path : str
+            The directory of html files
+        base_url : str
+            The url the directory stands for, defaults to ModDB
+        kwargs
+            The keyword arguments of the adapter
+
+        Returns
+        --------
+        CassetteAdapter
+            The adapter serving the pages
+        """
+        adapter = cls(**kwargs)
+        for file in _expand([path], "*.html"):
+            page = os.path.relpath(file, path)[: -len(".html")].replace(os.sep, "/")
+            if page == "index" or page.endswith("/index"):
+                page = page[: -len("index")]
+
+            with open(file, "rb") as f:
+                adapter.add(
+                    "GET",
+                    f"{base_url.rstrip('/')}/{page}",
+                    f.read(),
+                    headers={"Content-Type": "text/html; charset=utf-8"},
+                )
+
+        return adapter
+
+    def add(
+        self,
+        method: str,
+        url: str,
+        body: Union[str, bytes],
+        *,
+        status: int = 200,
+        reason: str = "OK",
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        """Record a response, for example to serve a file to download that was not in the
+        cassettes.
+
+        Parameters
+        -----------
+        method : str
+            The method of the request, e.g. GET
+        url : str
+            The url of the request, with its parameters
+        body : Union[str, bytes]
+            The body of the response, strings are encoded to utf-8
+        status : int
+            The status code of the response
+        reason : str
+            The reason of the status code
+        headers : Optional[Dict[str, str]]
+            The headers of the response
+        """
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+
+        headers = {
+            name: value
+            for name, value in (headers or {}).items()
+            if name.lower() not in _DROPPED_HEADERS
+        }
+        key = (method.upper(), normalize_url(url))
+        with self._lock:
+            self._recordings.setdefault(key, []).append(_Recording(status, reason, headers, body))
+            self._cycles.pop(key, None)
+
+    def mount(self, *sessions: requests.Session):
+        """Mount the adapter for http and https urls.
+
+        Parameters
+        -----------
+        sessions : requests.Session
+            The sessions to mount the adapter on, defaults to ``moddb.SESSION``
+        """
+        for session in sessions or [sys.modules["moddb"].SESSION]:
+            session.mount("http://", self)
+            session.mount("https://", self)
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        latency = self.latency
+        with self._lock:
+            if isinstance(latency, tuple):
+                latency = self._random.uniform(*latency)
+
+            failed = self.error_rate and self._random.random() < self.error_rate
+            recording = None
+            if failed:
+                self.errors += 1
+            else:
+                recording = self._next(request.method, request.url)
+
+        if latency:
+            time.sleep(latency)
+
+        if failed and self.error_status is None:
+            raise requests.ConnectionError(f"Injected failure for {request.url}", request=request)
+
+        if failed:
+            recording = _Recording(self.error_status, "Injected Failure", {}, b"")
+        elif recording is None:
+            LOGGER.warning("No recording for %s %s", request.method, request.url)
+            recording = _Recording(404, "Not Recorded", {}, b"")
+
+        return self._build_response(request, recording)
+
+    def _next(self, method: str, url: str) -> Optional[_Recording]:
+        key = (method.upper(), normalize_url(url))
+        if key not in self._recordings:
+            self.misses.append(url)
+            return None
+
+        if key not in self._cycles:
+            self._cycles[key] = itertools.cycle(self._recordings[key])
+
+        self.served += 1
+        return next(self._cycles[key])
+
+    def _build_response(
+        self, request: requests.PreparedRequest, recording: _Recording
+    ) -> requests.Response:
+        response = requests.Response()
+        response.status_code = recording.status
+        response.reason = recording.reason
+        response.headers = CaseInsensitiveDict(recording.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.raw = io.BytesIO(recording.content)
+        response._content = recording.content
+        response._content_consumed = True
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+    def close(self):
+        pass
+
+
+def _expand(paths: Iterable[str], pattern: str) -> List[str]:
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(sorted(glob.glob(os.path.join(path, "**", pattern), recursive=True)))
+        else:
+            files.append(path)
+
+    return files
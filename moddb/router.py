@@ -0,0 +1,68 @@
+"""Classifies ModDB urls by the type of page they lead to. The patterns are compiled once and
+the results are kept in an LRU cache since the same urls, such as the ones of members, come up
+again and again while parsing."""
+
+import functools
+import re
+
+from .enums import SearchCategory, ThumbnailType
+
+#: The word segments of a path that are followed by another segment, minus the pagination
+_SEGMENTS = re.compile(r"\/((?!page|pages\b)\b\w+)\/")
+#: The lowercase segments of a url, used for the category of profiles
+_WORDS = re.compile(r"\/([a-z]+)\/")
+#: The url segments that are not named after the ThumbnailType of the page
+_ALIASES = {
+    "new": ThumbnailType.article,
+    "feature": ThumbnailType.article,
+    "tutorial": ThumbnailType.article,
+    "download": ThumbnailType.file,
+    "image": ThumbnailType.media,
+    "audio": ThumbnailType.media,
+    "video": ThumbnailType.media,
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def get_page_type(url: str) -> ThumbnailType:
+    """Get the page type based on a url.
+
+    Parameters
+    -----------
+    url : str
+        The url to get
+
+    Return
+    -------
+    ThumbnailType
+        The type of the page
+    """
+    matches = _SEGMENTS.findall(url)
+    if matches[0].endswith("s"):
+        match = matches[-1][0:-1] if matches[-1].endswith("s") else matches[-1]
+    else:
+        match = matches[0]
+
+    try:
+        return ThumbnailType[match]
+    except KeyError:
+        return _ALIASES[match]
+
+
+@functools.lru_cache(maxsize=1024)
+def get_search_category(url: str) -> SearchCategory:
+    """Get the search category of the page a url leads to, based on the last lowercase
+    segment of the url.
+
+    Parameters
+    -----------
+    url : str
+        The url to get
+
+    Return
+    -------
+    SearchCategory
+        The category of the page
+    """
+    match = _WORDS.findall(url)[-1]
+    return SearchCategory[match if match.endswith("s") else match + "s"]
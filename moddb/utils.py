@@ -1,14 +1,20 @@
+import asyncio
 import datetime
 import functools
 import inspect
 import logging
+import operator
+import os
 import random
-import re
+import sqlite3
 import ssl
 import sys
+import tempfile
+import threading
 import time
 import uuid
-from typing import Optional, Sequence, Tuple, TypeVar
+import weakref
+from typing import Dict, List, Optional, Sequence, Tuple, TypeVar, Union
 from urllib.parse import urljoin
 
 import bs4
@@ -16,11 +22,15 @@ import requests
 from bs4 import BeautifulSoup, Tag
 from requests import utils
 
-from .enums import MediaCategory, ThumbnailType
+from .decoders import parse_abbreviated, parse_date, parse_list_stats, parse_views
+from .enums import MediaCategory
 from .errors import AuthError, AwaitingAuthorisation, ModdbException, Ratelimited
+from .hooks import emit, has_hooks
+from .router import get_page_type, get_search_category  # noqa: F401
 
 LOGGER = logging.getLogger("moddb")
 BASE_URL = "https://www.moddb.com"
+PARSER = "html.parser"
 
 
 time_mapping = {
@@ -87,11 +97,100 @@ class SSLAdapter(requests.adapters.HTTPAdapter):
         return super().init_poolmanager(*args, **kwargs)
 
 
-class Ratelimit:
-    def __init__(self, rate: float, per: float, sleep: Optional[None] = None):
+class BaseRatelimit:
+    """The interface shared by all the ratelimits of the library. A ratelimit can
+    be passed to :func:`ratelimit` or replace any of the global ratelimits.
+
+    Parameters
+    -----------
+    rate : float
+        The number of calls allowed
+    per : float
+        The period in seconds over which `rate` calls are allowed
+    sleep : Optional[float]
+        The maximum amount of seconds to sleep for when ratelimited, if the wait is longer
+        than this or if this is None then :class:`.Ratelimited` is raised instead.
+    """
+
+    def __init__(self, rate: float, per: float, sleep: Optional[float] = None):
         self.rate = rate
         self.per = per
         self.sleep = sleep
+        self._lock = threading.Lock()
+
+    def reset(self):
+        raise NotImplementedError
+
+    def time_until_available(self) -> float:
+        """The number of seconds until the next call can be made without waiting.
+
+        Returns
+        --------
+        float
+            Seconds to wait, 0 if a call can be made right now
+        """
+        raise NotImplementedError
+
+    #: Whether reserving a call can block, such as waiting on a lock shared between processes,
+    #: in which case acquire reserves it from a worker thread
+    _blocking_reserve = False
+
+    def _reserve(self) -> float:
+        """Reserve a call and return how long the caller must wait before making it. Always
+        called with the lock held."""
+        raise NotImplementedError
+
+    def _locked_reserve(self) -> float:
+        try:
+            with self._lock:
+                return self._reserve()
+        except Ratelimited as e:
+            emit("ratelimited", limiter=self, remaining=e.remaining)
+            raise
+
+    def _check_wait(self, remaining: float):
+        if self.sleep is None or remaining > self.sleep:
+            raise Ratelimited(f"Ratelimited please try again in {remaining}", remaining)
+
+    def call(self):
+        """Register a call, sleeping if needed.
+
+        Raises
+        -------
+        Ratelimited
+            The call would have to wait longer than the allowed sleep
+        """
+        remaining = self._locked_reserve()
+        if remaining > 0:
+            LOGGER.info("Ratelimited! Sleeping for %s", remaining)
+            emit("ratelimit", limiter=self, wait=remaining)
+            time.sleep(remaining)
+
+    async def acquire(self):
+        """Awaitable version of :meth:`call`, waiting does not block the event loop.
+
+        Raises
+        -------
+        Ratelimited
+            The call would have to wait longer than the allowed sleep
+        """
+        if self._blocking_reserve:
+            remaining = await asyncio.to_thread(self._locked_reserve)
+        else:
+            remaining = self._locked_reserve()
+
+        if remaining > 0:
+            LOGGER.info("Ratelimited! Sleeping for %s", remaining)
+            emit("ratelimit", limiter=self, wait=remaining)
+            await asyncio.sleep(remaining)
+
+
+class Ratelimit(BaseRatelimit):
+    """A fixed window ratelimit, allows `rate` calls in the `per` seconds following
+    the first call of the window."""
+
+    def __init__(self, rate: float, per: float, sleep: Optional[float] = None):
+        super().__init__(rate, per, sleep)
 
         self.last_called = datetime.datetime.min
         self.initial_call = datetime.datetime.min
@@ -104,31 +203,255 @@ class Ratelimit:
         self.initial_call = now
         self.call_count = 0
 
-    def call(self):
+    def _clock_set_back(self, now: datetime.datetime) -> bool:
+        # callers only reserve a window they are willing to sleep for, a window starting
+        # further away than that was reserved before the clock was set back
+        return (self.initial_call - now).total_seconds() > (self.sleep or 0)
+
+    def time_until_available(self) -> float:
+        now = datetime.datetime.now()
+        expiry = self.initial_call + datetime.timedelta(seconds=self.per)
+        if now > expiry or self._clock_set_back(now):
+            return 0.0
+
+        if self.call_count + 1 <= self.rate:
+            # the window may have been reserved by callers that are still sleeping
+            return max(0.0, (self.initial_call - now).total_seconds())
+
+        return (expiry - now).total_seconds()
+
+    def _reserve(self) -> float:
         now = datetime.datetime.now()
 
         expiry = self.initial_call + datetime.timedelta(seconds=self.per)
-        if now > expiry:
+        if now > expiry or self._clock_set_back(now):
             LOGGER.info("Resetting ratelimit")
             self.reset(now)
+            expiry = self.initial_call + datetime.timedelta(seconds=self.per)
 
         if self.call_count + 1 > self.rate:
             remaining = (expiry - now).total_seconds()
-            if self.sleep is not None and remaining <= self.sleep:
-                LOGGER.info("Ratelimited! Sleeping for %s", remaining)
-                time.sleep(remaining)
-                self.reset(now)
-            else:
-                raise Ratelimited(f"Ratelimited please try again in {remaining}", remaining)
+            self._check_wait(remaining)
+
+            # the call is made in the next window, once we are done sleeping
+            self.reset(expiry)
+            self.call_count = 1
+            return remaining
+
+        # the current window can start in the future if it was reserved by an earlier call,
+        # in which case this call has to wait for it as well
+        remaining = max(0.0, (self.initial_call - now).total_seconds())
+        if remaining > 0:
+            self._check_wait(remaining)
 
         self.call_count += 1
+        return remaining
+
+
+class TokenBucket(BaseRatelimit):
+    """A token bucket ratelimit, implemented as a generic cell rate algorithm. Instead of allowing
+    all the calls of a window at once, calls are spread out evenly: one call every `per / rate`
+    seconds, with up to `burst` calls allowed back to back after a period of inactivity.
+
+    Parameters
+    -----------
+    rate : float
+        The number of calls allowed
+    per : float
+        The period in seconds over which `rate` calls are allowed
+    sleep : Optional[float]
+        The maximum amount of seconds to sleep for when ratelimited, if the wait is longer
+        than this or if this is None then :class:`.Ratelimited` is raised instead.
+    burst : Optional[int]
+        How many calls can be made back to back, defaults to 1 which spreads
+        every call out evenly.
+    """
+
+    def __init__(self, rate: float, per: float, sleep: Optional[float] = None, *, burst: int = 1):
+        super().__init__(rate, per, sleep)
+        self.burst = burst
+        self.interval = per / rate
+
+        # theoretical arrival time of the next call
+        self.tat = 0.0
+
+    def reset(self):
+        self.tat = 0.0
+
+    def _now(self) -> float:
+        return time.monotonic()
+
+    def _wait(self, tat: float, now: float) -> float:
+        return max(0.0, max(tat, now) - (self.burst - 1) * self.interval - now)
+
+    def time_until_available(self) -> float:
+        return self._wait(self.tat, self._now())
+
+    def _advance(self, tat: float, now: float) -> Tuple[float, float]:
+        """Reserve a call given the current theoretical arrival time, returns how long to wait
+        and the new theoretical arrival time."""
+        remaining = self._wait(tat, now)
+        if remaining > 0:
+            self._check_wait(remaining)
+
+        return remaining, max(tat, now) + self.interval
+
+    def _reserve(self) -> float:
+        remaining, self.tat = self._advance(self.tat, self._now())
+        return remaining
+
+
+class SharedTokenBucket(TokenBucket):
+    """A :class:`TokenBucket` whose state is stored in a sqlite database so that every process
+    using the same database and key draws from the same budget. Useful when running several
+    workers on the same host, replace the global ratelimits in each of them:
+
+    .. code-block:: python3
+
+        moddb.utils.GLOBAL_LIMITER = SharedTokenBucket(40, 300, sleep=300, key="limiter")
+        moddb.utils.GLOBAL_THROTLE = SharedTokenBucket(5, 1, sleep=1, key="throtle")
+
+    Parameters
+    -----------
+    rate : float
+        The number of calls allowed
+    per : float
+        The period in seconds over which `rate` calls are allowed
+    sleep : Optional[float]
+        The maximum amount of seconds to sleep for when ratelimited, if the wait is longer
+        than this or if this is None then :class:`.Ratelimited` is raised instead.
+    burst : Optional[int]
+        How many calls can be made back to back, defaults to 1
+    path : Optional[str]
+        Path to the sqlite database, defaults to a file in the temporary directory
+    key : Optional[str]
+        Name of the budget within the database, defaults to one derived from the rate,
+        period and burst.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        per: float,
+        sleep: Optional[float] = None,
+        *,
+        burst: int = 1,
+        path: str = None,
+        key: str = None,
+    ):
+        super().__init__(rate, per, sleep, burst=burst)
+        self.path = path or os.path.join(tempfile.gettempdir(), "moddb-ratelimits.sqlite")
+        self.key = key or f"{rate}/{per}/{burst}"
+
+        self._connection = None
+        self._pid = None
+
+    # the database can be locked by another process for up to the connection timeout
+    _blocking_reserve = True
+
+    def _now(self) -> float:
+        # the clock has to be shared between processes
+        return time.time()
+
+    def _connect(self) -> sqlite3.Connection:
+        # connections cannot be shared with forked processes
+        if self._connection is None or self._pid != os.getpid():
+            connection = sqlite3.connect(
+                self.path, timeout=30, isolation_level=None, check_same_thread=False
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=OFF")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS ratelimits (key TEXT PRIMARY KEY, tat REAL NOT NULL)"
+            )
+            connection.execute(
+                "INSERT OR IGNORE INTO ratelimits (key, tat) VALUES (?, 0)", (self.key,)
+            )
+
+            self._connection = connection
+            self._pid = os.getpid()
+
+        return self._connection
+
+    def _read(self, connection: sqlite3.Connection) -> float:
+        return connection.execute(
+            "SELECT tat FROM ratelimits WHERE key = ?", (self.key,)
+        ).fetchone()[0]
+
+    def reset(self):
+        with self._lock:
+            self._connect().execute("UPDATE ratelimits SET tat = 0 WHERE key = ?", (self.key,))
+
+    def _clock_set_back(self, tat: float, now: float) -> bool:
+        # a call never moves the arrival time further ahead than the burst plus what callers
+        # are willing to sleep for, anything further was stored before the clock was set back
+        return tat - now > max(self.sleep or 0, self.per) + self.burst * self.interval
+
+    def _read_tat(self, connection: sqlite3.Connection, now: float) -> float:
+        tat = self._read(connection)
+        if self._clock_set_back(tat, now):
+            LOGGER.info("Resetting ratelimit")
+            return 0.0
+
+        return tat
+
+    def time_until_available(self) -> float:
+        now = self._now()
+        with self._lock:
+            tat = self._read_tat(self._connect(), now)
+
+        return self._wait(tat, now)
+
+    def _reserve(self) -> float:
+        connection = self._connect()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            now = self._now()
+            remaining, tat = self._advance(self._read_tat(connection, now), now)
+            connection.execute("UPDATE ratelimits SET tat = ? WHERE key = ?", (tat, self.key))
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+        connection.execute("COMMIT")
+        return remaining
+
+
+def _resolve_limiters(limiters: Sequence[Union[BaseRatelimit, str]]) -> List[BaseRatelimit]:
+    """Ratelimits given by name are looked up in this module at call time so that
+    they can be replaced."""
+    module = sys.modules[__name__]
+    return [getattr(module, x) if isinstance(x, str) else x for x in limiters]
 
 
-def ratelimit(*limiters: Ratelimit):
+def ratelimit(*limiters: Union[BaseRatelimit, str]):
+    """Decorator to ratelimit a function. Ratelimits can be passed either as objects or
+    as the name of one of the global ratelimits of this module (e.g. ``"GLOBAL_LIMITER"``),
+    in which case it is looked up every time the function is called. This allows replacing
+    ``moddb.utils.GLOBAL_LIMITER`` with another ratelimit at runtime. Coroutine functions
+    can also be decorated, in which case the ratelimits are awaited.
+
+    Parameters
+    -----------
+    limiters : Union[BaseRatelimit, str]
+        The ratelimits to apply, in order
+    """
+
     def decorator(func):
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                for limiter in _resolve_limiters(limiters):
+                    await limiter.acquire()
+
+                return await func(*args, **kwargs)
+
+            return async_wrapper
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            for limiter in limiters:
+            for limiter in _resolve_limiters(limiters):
                 limiter.call()
 
             return func(*args, **kwargs)
@@ -159,17 +482,7 @@ def get_date(d: str) -> datetime.datetime:
     datetime.datetime
         The datetime object for the given string
     """
-    try:
-        return datetime.datetime.strptime(d[:-3] + d[-2:], "%Y-%m-%dT%H:%M:%S%z")
-    except ValueError:
-        pass
-
-    try:
-        return datetime.datetime.strptime(d, "%Y-%m-%d")
-    except ValueError:
-        pass
-
-    return datetime.datetime.strptime(d, "%Y-%m")
+    return parse_date(d)
 
 
 def prepare_request(req: requests.Request, session: requests.Session):
@@ -210,7 +523,7 @@ def raise_for_status(response: requests.Response):
         )
 
 
-@ratelimit(LOGIN_LIMITER)
+@ratelimit("LOGIN_LIMITER")
 def generate_login_cookies(username: str, password: str, session: requests.Session = None):
     """Log a user in and return the `freeman` cookie containing the login hash"""
     if session is None:
@@ -253,9 +566,56 @@ def create_login_payload(username: str, password: str, session: requests.Session
     return data, resp
 
 
-@ratelimit(GLOBAL_THROTLE, GLOBAL_LIMITER)
+def _emit_request(
+    prepped: requests.PreparedRequest,
+    source: str,
+    start: float,
+    resp: Optional[requests.Response] = None,
+    error: Optional[Exception] = None,
+):
+    """Emit the ``request`` event of a request sent at ``start``, with its response if it got one"""
+    emit(
+        "request",
+        method=prepped.method,
+        url=prepped.url,
+        status=None if resp is None else resp.status_code,
+        size=0 if resp is None else len(resp.content),
+        duration=time.perf_counter() - start,
+        source=source,
+        error=error,
+    )
+
+
+def _timed_send(
+    session: requests.Session, prepped: requests.PreparedRequest, source: str, **kwargs
+) -> requests.Response:
+    """Send a request, emitting a ``request`` event if anything listens to it"""
+    if not has_hooks("request"):
+        return session.send(prepped, **kwargs)
+
+    start = time.perf_counter()
+    try:
+        resp = session.send(prepped, **kwargs)
+    except Exception as e:
+        _emit_request(prepped, source, start, error=e)
+        raise
+
+    _emit_request(prepped, source, start, resp)
+    return resp
+
+
+@ratelimit("GLOBAL_THROTLE", "GLOBAL_LIMITER")
+def _send(session: requests.Session, prepped: requests.PreparedRequest) -> requests.Response:
+    resp = _timed_send(session, prepped, "library")
+
+    raise_for_status(resp)
+    return resp
+
+
 def request(req: requests.Request):
-    """Helper function to make get/post requests with the current SESSION object.
+    """Helper function to make get/post requests with the current SESSION object. If
+    ``moddb.RESPONSE_CACHE`` is set, GET requests are served from it when possible and
+    expired responses are revalidated with a conditional request.
 
     Parameters
     -----------
@@ -270,13 +630,33 @@ def request(req: requests.Request):
     """
     session: requests.Session = sys.modules["moddb"].SESSION
     prepped = prepare_request(req, session)
-    resp = session.send(prepped)
 
-    raise_for_status(resp)
-    return resp
+    cache = sys.modules["moddb"].RESPONSE_CACHE
+    if cache is None or prepped.method != "GET":
+        return _send(session, prepped)
+
+    resp = cache._lookup(prepped)
+    emit("cache", url=prepped.url, hit=resp is not None)
+    if resp is not None:
+        return resp
+
+    return cache._store(prepped, _send(session, prepped))
+
+
+#: Text the trees built by soup were parsed from, keyed by the id of the tree. Kept out of the
+#: tree since bs4 resolves unknown attributes to tags, e.g. ``html.source``
+_SOURCES: Dict[int, Union[str, bytes]] = {}
 
 
-def soup(html: str) -> BeautifulSoup:
+def _drop_source(html: BeautifulSoup):
+    """Forget the text a tree was parsed from, :func:`get_source` serializes the tree instead
+    from then on."""
+    _SOURCES.pop(id(html), None)
+
+
+def soup(
+    html: str, *, parser: Optional[str] = None, parse_only: Optional[bs4.SoupStrainer] = None
+) -> BeautifulSoup:
     """Simple helper function that takes a string representation of an html page and
     returns a beautiful soup object
 
@@ -284,17 +664,82 @@ def soup(html: str) -> BeautifulSoup:
     -----------
     html : str
         The string representationg of the html to parse
+    parser : Optional[str]
+        The bs4 tree builder to use, defaults to ``moddb.utils.PARSER``. If it is not
+        installed the builtin ``html.parser`` is used instead.
+    parse_only : Optional[bs4.SoupStrainer]
+        Only build the tree for the parts of the page matching this strainer
 
     Returns
     --------
     bs4.BeautifulSoup
         The parsed html
     """
+    parser = parser or PARSER
+    start = time.perf_counter()
+    try:
+        tree = BeautifulSoup(html, parser, parse_only=parse_only)
+    except bs4.FeatureNotFound:
+        LOGGER.warning("Parser %s is not installed, falling back to html.parser", parser)
+        parser = "html.parser"
+        tree = BeautifulSoup(html, parser, parse_only=parse_only)
+
+    if has_hooks("soup"):
+        emit("soup", size=len(html), parser=parser, duration=time.perf_counter() - start)
+
+    # kept so that regex based extractors don't have to serialize the tree back to text, until
+    # a model is built from the tree or the tree is collected
+    _SOURCES[id(tree)] = html
+    weakref.finalize(tree, _SOURCES.pop, id(tree), None)
+    return tree
+
+
+def get_source(html: BeautifulSoup) -> str:
+    """Get the text a tree was parsed from. Trees that were not built by :func:`soup`, or that
+    a model was already built from, are serialized back to text instead, which is much slower.
+
+    Parameters
+    -----------
+    html : bs4.BeautifulSoup
+        The parsed html
+
+    Returns
+    --------
+    str
+        The html the tree was parsed from
+    """
+    source = _SOURCES.get(id(html))
+    if source is None:
+        return str(html)
+
+    if isinstance(source, bytes):
+        return source.decode("utf-8", "replace")
+
+    return source
 
-    return BeautifulSoup(html, "html.parser")
 
+def decompose(html: BeautifulSoup):
+    """Destroy an entire tree so that the strings taken from it no longer keep the rest of the
+    tree alive. ``BeautifulSoup.decompose`` only wipes the root of the tree, this decomposes
+    each of its children.
 
-def get_page(url: str, *, params: dict = {}, json: bool = False):
+    Parameters
+    -----------
+    html : bs4.BeautifulSoup
+        The tree to destroy, it cannot be used afterwards
+    """
+    _drop_source(html)
+    for element in list(html.contents):
+        element.decompose()
+
+
+def get_page(
+    url: str,
+    *,
+    params: dict = {},
+    json: bool = False,
+    parse_only: Optional[bs4.SoupStrainer] = None,
+):
     """A helper function that takes a url and returns a beautiful soup objects. This is used to center
     the request making section of the library. Can also be passed a set of paramaters, used for sorting
     and filtering in the search function.
@@ -307,17 +752,24 @@ def get_page(url: str, *, params: dict = {}, json: bool = False):
         A dictionnary of filters and sorting key-value pairs.
     json : Optional[bool]
         Whether the expected response is json, in which case it will not be soup'd
+    parse_only : Optional[bs4.SoupStrainer]
+        Only build the tree for the parts of the page matching this strainer
 
     Returns
     -------
     bs4.BeautifulSoup
         The parsed html
     """
+    start = time.perf_counter()
     resp = request(requests.Request("GET", url, params=params))
     if json:
         return resp.json()
 
-    return soup(resp.text)
+    html = soup(resp.text, parse_only=parse_only)
+    if has_hooks("page"):
+        emit("page", url=url, duration=time.perf_counter() - start)
+
+    return html
 
 
 def get_views(string: str) -> Tuple[int, int]:
@@ -334,11 +786,7 @@ def get_views(string: str) -> Tuple[int, int]:
     Tuple[int, int]
         Tuple contains the total views (first element) and the daily views (second element)
     """
-    matches = re.search(r"^([0-9,]*) \(([0-9,]*) today\)$", string)
-    views = int(matches.group(1).replace(",", ""))
-    today = int(matches.group(2).replace(",", ""))
-
-    return views, today
+    return parse_views(string)
 
 
 def join(path: str) -> str:
@@ -402,42 +850,6 @@ def get_media_type(img: Tag) -> MediaCategory:
         return MediaCategory.image
 
 
-def get_page_type(url: str) -> "ThumbnailType":
-    """Get the page type based on a url.
-
-    Parameters
-    -----------
-    url : str
-        The url to get
-
-    Return
-    -------
-    ThumbnailType
-        The type of the page
-    """
-    regex = r"\/((?!page|pages\b)\b\w+)\/"
-    type_mapping = {
-        "new": "article",
-        "feature": "article",
-        "tutorial": "article",
-        "download": "file",
-        "image": "media",
-        "audio": " media",
-        "video": "media",
-    }
-
-    matches = re.findall(regex, url)
-    match = matches[-1][0:-1] if matches[0].endswith("s") else matches[0]
-
-    try:
-        page_type = ThumbnailType[match]
-    except KeyError:
-        page_type = ThumbnailType[type_mapping[match]]
-
-    LOGGER.info("%s is type %s", url, page_type)
-    return page_type
-
-
 def ceildiv(a: int, b: int) -> int:
     "Like a // b but rounded up instead of down."
     return -(a // -b)
@@ -461,19 +873,17 @@ def get_list_stats(result_box: bs4.BeautifulSoup, per_page: int = 30) -> Tuple[i
         The stats in order of: number of current page (starting from 1),
         total number of pages (between 1 and X) and the total results.
     """
-    stats = re.match(
-        r".*\(([0-9,]*) - ([0-9,]*) of ([0-9,]*)\)",
+    stats = parse_list_stats(
         result_box.find("div", class_="normalcorner")
         .find("div", class_="title")
         .find("span", class_="heading")
-        .string,
+        .string
     )
 
     if not stats:  # less than a page
         return 1, 1, None
 
-    max_results = int(stats.group(2).replace(",", ""))
-    all_results = int(stats.group(3).replace(",", ""))
+    max_results, all_results = stats
     max_page = ceildiv(all_results, per_page)
     current_page = ceildiv(max_results, per_page)
 
@@ -533,6 +943,11 @@ def get(iterable: Sequence[D], **attrs) -> Optional[D]:
     If nothing is found that matches the attributes passed, then
     ``None`` is returned.
 
+    Looking up a single ``url``, ``name`` or ``id`` in a :class:`.ResultList` or
+    :class:`.CommentList` goes through an index of the list instead of checking every
+    element. Elements missing one of the attributes do not match. To run the same search
+    several times or to get every match, use a :class:`Query`.
+
     Examples
     ---------
 
@@ -562,18 +977,163 @@ def get(iterable: Sequence[D], **attrs) -> Optional[D]:
         Keyword arguments that denote attributes to search with.
     """
 
-    def predicate(elem):
-        for attr, val in attrs.items():
-            nested = attr.split("__")
-            obj = elem
-            for attribute in nested:
-                obj = getattr(obj, attribute)
+    return Query(**attrs).first(iterable)
+
+
+def _compile_getter(names: Sequence[str]):
+    """Get a function returning the tuple of the values of the ``x__y`` style attributes"""
+    if not names:
+        return lambda elem: ()
+
+    getter = operator.attrgetter(*(name.replace("__", ".") for name in names))
+    if len(names) == 1:
+        return lambda elem: (getter(elem),)
+
+    return getter
+
+
+class Query:
+    r"""The attributes passed to :func:`get`, compiled once so that they can be checked
+    against the elements of any number of lists. Uses the same ``x__y`` syntax for nested
+    attributes. Elements missing one of the attributes do not match.
+
+    .. code-block:: python3
+
+        query = moddb.utils.Query(author__name="SilverElf", karma=3)
+        comment = query.first(mod.get_comments())
+        comments = query.all(mod.get_comments(2))
+
+    Parameters
+    -----------
+    \*\*attrs
+        Keyword arguments that denote attributes to search with.
+    """
+
+    def __init__(self, **attrs):
+        self.attrs = attrs
+        self._getter = _compile_getter(list(attrs))
+        self._values = tuple(attrs.values())
+
+    def __call__(self, elem) -> bool:
+        try:
+            return self._getter(elem) == self._values
+        except AttributeError:
+            return False
+
+    def first(self, iterable: Sequence[D]) -> Optional[D]:
+        """Get the first element matching the query. Looking up a single ``url``, ``name``
+        or ``id`` in a :class:`.ResultList` or :class:`.CommentList` uses the index of the
+        list.
+
+        Parameters
+        -----------
+        iterable
+            An iterable to search through.
+
+        Returns
+        --------
+        Optional[Any]
+            The first element matching, None if there is none
+        """
+        if len(self.attrs) == 1 and hasattr(iterable, "_index"):
+            [(attr, val)] = self.attrs.items()
+            index = iterable._index(attr)
+            if index is not None:
+                try:
+                    return index.get(val)
+                except TypeError:
+                    # unhashable values cannot be in the index, compare them one by one
+                    pass
+
+        return find(self, iterable)
+
+    def all(self, iterable: Sequence[D]) -> List[D]:
+        """Get every element matching the query
+
+        Parameters
+        -----------
+        iterable
+            An iterable to search through.
+
+        Returns
+        --------
+        List[Any]
+            The elements matching, in order
+        """
+        return [elem for elem in iterable if self(elem)]
+
+    def __repr__(self):
+        return f"<Query {self.attrs}>"
+
+
+class QueryIndex:
+    r"""Groups the elements of a list by the values of some attributes, in order to run many
+    queries on those attributes without going through the list every time. The index does not
+    follow changes made to the list afterwards. The values of the attributes must be
+    hashable, elements missing one of them are left out.
+
+    .. code-block:: python3
+
+        index = moddb.utils.QueryIndex(comments, "author__name")
+        index.all(author__name="SilverElf")
+        index.first(author__name="Usually Dead")
+
+    Parameters
+    -----------
+    iterable
+        The elements to index
+    \*attrs : str
+        The attributes to index the elements by, using the same syntax as :class:`Query`
+    """
+
+    def __init__(self, iterable: Sequence[D], *attrs: str):
+        self.attrs = attrs
+        getter = _compile_getter(attrs)
+        self._groups = {}
+        for elem in iterable:
+            try:
+                key = getter(elem)
+            except AttributeError:
+                continue
 
-            if obj != val:
-                return False
-        return True
+            self._groups.setdefault(key, []).append(elem)
 
-    return find(predicate, iterable)
+    def _key(self, attrs: dict) -> tuple:
+        if attrs.keys() != set(self.attrs):
+            raise ValueError(f"This index can only be queried with exactly {self.attrs}")
+
+        return tuple(attrs[attr] for attr in self.attrs)
+
+    def first(self, **attrs) -> Optional[D]:
+        r"""Get the first element with these values
+
+        Parameters
+        -----------
+        \*\*attrs
+            A value for each of the indexed attributes
+
+        Returns
+        --------
+        Optional[Any]
+            The first element matching, None if there is none
+        """
+        group = self._groups.get(self._key(attrs))
+        return group[0] if group else None
+
+    def all(self, **attrs) -> List[D]:
+        r"""Get every element with these values
+
+        Parameters
+        -----------
+        \*\*attrs
+            A value for each of the indexed attributes
+
+        Returns
+        --------
+        List[Any]
+            The elements matching, in order
+        """
+        return list(self._groups.get(self._key(attrs), ()))
 
 
 def generate_hash():
@@ -596,13 +1156,5 @@ def get_siteareaid(key: str):
     return siteareaid_mapping.get(str(key), "none")
 
 
-number_mapping = {"k": 1_000, "m": 1_000_000}
-
-
 def unroll_number(string: str) -> int:
-    identifier = string[-1].lower()
-    if identifier.isdigit():
-        return int(string)
-
-    number = float(string[:-1]) * number_mapping[identifier]
-    return int(number)
+    return parse_abbreviated(string)
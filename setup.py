@@ -30,4 +30,5 @@ setup(
     long_description=readme,
     packages=find_packages(include=["moddb", "moddb.*"]),
     install_requires=install_requires,
+    extras_require={"lxml": ["lxml"], "replay": ["pyyaml"]},
 )
@@ -0,0 +1,104 @@
+import asyncio
+
+import pytest
+
+import moddb
+import moddb.aio
+
+EMPTY_PAGE = "<html><head></head><body></body></html>"
+
+
+class FakeCurlResponse:
+    def __init__(self, url, text=EMPTY_PAGE, status_code=200):
+        self.url = url
+        self.status_code = status_code
+        self.headers = {"Content-Type": "text/html"}
+        self.encoding = "utf-8"
+        self.reason = "OK"
+        self.content = text.encode("utf-8")
+
+
+class FakeAsyncSession:
+    def __init__(self):
+        self.calls = []
+
+    async def request(self, method, url, **kwargs):
+        self.calls.append((method, url))
+        return FakeCurlResponse(url)
+
+    async def close(self):
+        pass
+
+
+@pytest.fixture
+def session():
+    session = FakeAsyncSession()
+    moddb.aio.SESSION = session
+    yield session
+    moddb.aio.SESSION = None
+
+
+def test_search(session):
+    results = asyncio.run(moddb.aio.search(moddb.SearchCategory.mods, query="edain"))
+
+    assert isinstance(results, moddb.boxes.ResultList)
+    assert results.total_pages == 1
+    method, url = session.calls[0]
+    assert method == "GET"
+    assert url.startswith(f"{moddb.BASE_URL}/mods/page/1?") and "kw=edain" in url
+
+
+def test_parse_results(session):
+    results = asyncio.run(moddb.aio.parse_results(f"{moddb.BASE_URL}/tags/strategy"))
+
+    assert results._url == f"{moddb.BASE_URL}/tags/strategy"
+    assert len(results) == 0
+
+
+def test_to_page_out_of_range(session):
+    results = asyncio.run(moddb.aio.search(moddb.SearchCategory.games))
+
+    with pytest.raises(ValueError):
+        asyncio.run(moddb.aio.to_page(results, 2))
+
+    assert len(session.calls) == 1
+
+
+def test_close(session):
+    asyncio.run(moddb.aio.close())
+
+    assert moddb.aio.SESSION is None
+
+
+def test_response_cache_off_loop(session, tmp_path, monkeypatch):
+    cache = moddb.ResponseCache(str(tmp_path / "cache.sqlite"))
+    monkeypatch.setattr(moddb, "RESPONSE_CACHE", cache)
+    threads = []
+    to_thread = asyncio.to_thread
+
+    async def counted(func, *args):
+        threads.append(func.__name__)
+        return await to_thread(func, *args)
+
+    monkeypatch.setattr(asyncio, "to_thread", counted)
+    for _ in range(2):
+        asyncio.run(moddb.aio.get_page(f"{moddb.BASE_URL}/mods/edain-mod"))
+
+    cache.close()
+    assert len(session.calls) == 1
+    assert threads == ["_lookup", "_store", "_lookup"]
+
+
+def test_hook_events(session, tmp_path, monkeypatch):
+    cache = moddb.ResponseCache(str(tmp_path / "cache.sqlite"))
+    monkeypatch.setattr(moddb, "RESPONSE_CACHE", cache)
+    with moddb.MetricsRegistry() as metrics:
+        for _ in range(2):
+            asyncio.run(moddb.aio.get_page(f"{moddb.BASE_URL}/mods/edain-mod"))
+
+    cache.close()
+    labels = {"type": "mod", "method": "GET", "source": "library"}
+    assert metrics.counter("requests_total", status="200", **labels) == 1
+    assert metrics.counter("cache_lookups_total", result="miss") == 1
+    assert metrics.counter("cache_lookups_total", result="hit") == 1
+    assert metrics.histogram("page_duration_seconds", type="mod").count == 2
@@ -0,0 +1,205 @@
+import pytest
+import requests
+
+import moddb
+from moddb.cache import ModelCache, ResponseCache, normalize_url
+
+PAGE = "<html><head></head><body>{}</body></html>"
+
+
+def make_response(url, text="", status_code=200):
+    response = requests.Response()
+    response.status_code = status_code
+    response.url = url
+    response.encoding = "utf-8"
+    response.headers["Content-Type"] = "text/html"
+    response._content = PAGE.format(text).encode("utf-8")
+    return response
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ResponseCache(str(tmp_path / "cache.sqlite"))
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+def session(monkeypatch, cache):
+    calls = []
+
+    def send(prepped, **kwargs):
+        calls.append(prepped.url)
+        return make_response(prepped.url, str(len(calls)))
+
+    monkeypatch.setattr(moddb.SESSION, "send", send)
+    monkeypatch.setattr(moddb, "RESPONSE_CACHE", cache)
+    return calls
+
+
+def test_normalize_url():
+    assert normalize_url("HTTPS://www.ModDB.com/mods/edain/?b=2&a=1#top") == normalize_url(
+        "https://www.moddb.com/mods/edain?a=1&b=2"
+    )
+    assert normalize_url("https://www.moddb.com/mods?a=1") != normalize_url(
+        "https://www.moddb.com/mods?a=2"
+    )
+
+
+def test_get_page_uses_cache(session, cache):
+    first = moddb.get_page(f"{moddb.BASE_URL}/mods/edain-mod", params={"sort": "id-asc"})
+    second = moddb.get_page(f"{moddb.BASE_URL}/mods/edain-mod/", params={"sort": "id-asc"})
+    other = moddb.get_page(f"{moddb.BASE_URL}/mods/edain-mod", params={"sort": "id-desc"})
+
+    assert first.body.string == second.body.string == "1"
+    assert other.body.string == "2"
+    assert len(session) == 2
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 2, 2)
+
+
+def test_post_not_cached(session, cache):
+    moddb.request(requests.Request("POST", f"{moddb.BASE_URL}/members/login"))
+    moddb.request(requests.Request("POST", f"{moddb.BASE_URL}/members/login"))
+
+    assert len(session) == 2
+    assert cache.stats()["entries"] == 0
+
+
+def test_ttl(cache, freezer):
+    cache.ttls = {moddb.ThumbnailType.member: 10}
+    member = f"{moddb.BASE_URL}/members/usually-dead"
+    mod = f"{moddb.BASE_URL}/mods/edain-mod"
+    cache.set(member, make_response(member))
+    cache.set(mod, make_response(mod))
+
+    assert cache.ttl_for(member) == 10
+    assert cache.ttl_for(mod) == cache.ttl
+    assert cache.ttl_for(moddb.BASE_URL) == cache.ttl
+
+    freezer.tick(11)
+    assert cache.get(member) is None
+    assert cache.get(mod).text == PAGE.format("")
+
+
+def test_eviction(cache, freezer):
+    size = len(make_response("").content)
+    cache.max_size = size * 2
+    urls = [f"{moddb.BASE_URL}/mods/mod-{index}" for index in range(3)]
+
+    for url in urls[:2]:
+        cache.set(url, make_response(url))
+        freezer.tick(1)
+
+    cache.get(urls[0])
+    freezer.tick(1)
+    cache.set(urls[2], make_response(urls[2]))
+
+    assert cache.get(urls[1]) is None
+    assert cache.get(urls[0]) is not None
+    assert cache.get(urls[2]) is not None
+    assert cache.stats()["size"] == size * 2
+
+
+@pytest.fixture
+def models(monkeypatch):
+    cache = ModelCache(2)
+    monkeypatch.setattr(moddb, "MODEL_CACHE", cache)
+    return cache
+
+
+def test_model_cache_lru():
+    cache = ModelCache(2)
+    cache.set("https://www.moddb.com/mods/a", "a")
+    cache.set("https://www.moddb.com/mods/b", "b")
+    assert cache.get("https://www.moddb.com/mods/a/") == "a"
+
+    cache.set("https://www.moddb.com/mods/c", "c")
+    assert cache.get("https://www.moddb.com/mods/b") is None
+    assert cache.get("https://www.moddb.com/mods/c") == "c"
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"], stats["size"]) == (2, 1, 1, 2)
+
+
+def test_model_cache_ttl(freezer):
+    cache = ModelCache(ttl=10)
+    cache.set("https://www.moddb.com/mods/a", "a")
+
+    freezer.tick(5)
+    assert cache.get("https://www.moddb.com/mods/a") == "a"
+    freezer.tick(6)
+    assert cache.get("https://www.moddb.com/mods/a") is None
+    assert len(cache) == 0
+
+
+@pytest.fixture
+def pages(monkeypatch):
+    pages = []
+
+    def request(req):
+        pages.append(req)
+        if req.headers.get("If-None-Match") == '"v1"':
+            return make_response(req.url, status_code=304)
+
+        response = make_response(req.url, str(len(pages)))
+        response.headers["ETag"] = f'"v{len(pages)}"'
+        return response
+
+    monkeypatch.setattr(moddb.cache, "request", request)
+    monkeypatch.setattr(moddb.Member, "__init__", lambda self, html: setattr(self, "html", html))
+    return pages
+
+
+def test_parse_page_uses_model_cache(pages, models):
+    url = f"{moddb.BASE_URL}/members/usually-dead"
+    thumbnail = moddb.boxes.Thumbnail(url=url, name="Usually Dead", type=moddb.ThumbnailType.member)
+    member = thumbnail.parse()
+
+    assert isinstance(member, moddb.Member)
+    assert thumbnail.parse() is member
+    assert moddb.parse_page(url) is member
+    assert len(pages) == 1
+    assert models.stats()["hits"] == 2
+
+
+def test_model_revalidation(pages, models, freezer):
+    models.ttl = 10
+    url = f"{moddb.BASE_URL}/members/usually-dead"
+    member = moddb.parse_page(url)
+
+    freezer.tick(11)
+    assert moddb.parse_page(url) is member
+    assert pages[1].headers["If-None-Match"] == '"v1"'
+    assert models.revalidations == 1
+
+    freezer.tick(11)
+    models.set(url, member, {"If-None-Match": '"v0"'})
+    freezer.tick(11)
+    changed = moddb.parse_page(url)
+    assert changed is not member
+    assert changed.html.body.string == "3"
+
+
+def test_response_revalidation(session, cache, freezer, monkeypatch):
+    def send(prepped, **kwargs):
+        session.append(prepped)
+        if prepped.headers.get("If-None-Match") == '"v1"':
+            return make_response(prepped.url, status_code=304)
+
+        response = make_response(prepped.url, "fresh")
+        response.headers["ETag"] = '"v1"'
+        return response
+
+    monkeypatch.setattr(moddb.SESSION, "send", send)
+    url = f"{moddb.BASE_URL}/mods/edain-mod"
+    moddb.get_page(url)
+
+    freezer.tick(cache.ttl + 1)
+    assert cache.get(url) is None
+    assert cache.validators(url) == {"If-None-Match": '"v1"'}
+
+    html = moddb.get_page(url)
+    assert html.body.string == "fresh"
+    assert session[1].headers["If-None-Match"] == '"v1"'
+    assert cache.stats()["revalidations"] == 1
+    assert cache.get(url) is not None
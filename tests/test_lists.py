@@ -0,0 +1,199 @@
+import asyncio
+import pickle
+import random
+import time
+
+import moddb
+import moddb.aio
+from moddb.boxes import ResultList, Thumbnail, ThumbnailTable
+
+
+def make_page(page, total_pages=6, per_page=3):
+    return FakeResultList(
+        results=[
+            Thumbnail(
+                name=f"{page}-{index}", url=f"/mods/{page}-{index}", type=moddb.ThumbnailType.mod
+            )
+            for index in range(per_page)
+        ],
+        url=f"{moddb.BASE_URL}/mods",
+        current_page=page,
+        total_pages=total_pages,
+        total_results=total_pages * per_page,
+    )
+
+
+class FakeResultList(ResultList):
+    def _do_request(self, **kwargs):
+        page = kwargs["page"]
+        time.sleep(random.random() / 100)
+        return make_page(page, self.total_pages)
+
+
+def test_get_all_results_serial():
+    results = make_page(1).get_all_results()
+
+    assert [x.name for x in results] == [f"{p}-{i}" for p in range(1, 7) for i in range(3)]
+    assert results.current_page == 6
+
+
+def test_get_all_results_concurrent():
+    results = make_page(1).get_all_results(concurrency=4)
+
+    assert [x.name for x in results] == [f"{p}-{i}" for p in range(1, 7) for i in range(3)]
+    assert results.current_page == 6
+
+
+def test_get_all_results_single_page():
+    results = make_page(1, total_pages=1).get_all_results(concurrency=4)
+
+    assert len(results) == 3
+    assert results.current_page == 1
+
+
+def test_aio_get_all_results(monkeypatch):
+    async def to_page(results, page):
+        await asyncio.sleep(random.random() / 100)
+        return make_page(page, results.total_pages)
+
+    monkeypatch.setattr(moddb.aio.base, "to_page", to_page)
+    results = asyncio.run(moddb.aio.get_all_results(make_page(3), concurrency=2))
+
+    assert [x.name for x in results] == [f"{p}-{i}" for p in range(1, 7) for i in range(3)]
+
+
+LIST_PAGE = """<html><head><meta property="og:url" content="https://www.moddb.com/mods/edain-mod"></head>
+<body><div class="sidebar"><a href="/mods/other" title="Other">Other</a></div>
+<div class="normalbox browsebox"><div class="normalcorner"><div class="title">
+<span class="heading">Mods (31 - 60 of 75)</span></div></div><div class="inner"><div class="table">
+<div class="rowcontent"><a href="/mods/edain-mod" title="Edain Mod"><img src="edain.png"></a>
+<p>The Edain Mod</p></div></div></div></div></body></html>"""
+
+
+def test_list_pages_are_strained(monkeypatch):
+    strainers = []
+
+    def get_page(url, *, params={}, parse_only=None):
+        strainers.append(parse_only)
+        return moddb.soup(LIST_PAGE, parse_only=parse_only)
+
+    monkeypatch.setattr(moddb.boxes, "get_page", get_page)
+    first = ResultList(
+        results=[], url=f"{moddb.BASE_URL}/mods", current_page=1, total_pages=3, total_results=75
+    )
+    results = first.to_page(2)
+
+    assert strainers == [moddb.boxes._RESULTS_STRAINER]
+    assert [x.name for x in results] == ["Edain Mod"]
+    assert (results.current_page, results.total_pages, results.total_results) == (2, 3, 75)
+
+
+def test_strained_results_match_full_page():
+    full = moddb.boxes._parse_results(moddb.soup(LIST_PAGE))
+    strained_html = moddb.soup(LIST_PAGE, parse_only=moddb.boxes._RESULTS_STRAINER)
+
+    assert strained_html.find("div", class_="sidebar") is None
+    assert repr(moddb.boxes._parse_results(strained_html)) == repr(full)
+
+
+def test_slotted_thumbnails():
+    thumbnail = Thumbnail(name="Edain Mod", url="/mods/edain-mod", type=moddb.ThumbnailType.mod)
+    author = moddb.boxes.CommentAuthor(
+        name="Usually Dead", url="/members/usually-dead", type=moddb.ThumbnailType.member
+    )
+
+    assert not hasattr(thumbnail, "__dict__")
+    assert not hasattr(author, "__dict__")
+    copied = pickle.loads(pickle.dumps(author))
+    assert (copied.name, copied.url, copied.comment_count) == (author.name, author.url, 0)
+
+
+def test_thumbnail_table():
+    thumbnails = [
+        Thumbnail(
+            name="Edain Mod",
+            url="/mods/edain-mod",
+            type=moddb.ThumbnailType.mod,
+            date=moddb.utils.get_date("2020-01-02T10:00:00+01:00"),
+        ),
+        Thumbnail(
+            name="Age of the Ring",
+            url="/mods/age-of-the-ring",
+            type=moddb.ThumbnailType.mod,
+            summary="Not Edain",
+        ),
+        Thumbnail(
+            name="Patch",
+            url="/addons/patch",
+            type=moddb.ThumbnailType.addon,
+            date=moddb.utils.get_date("2019-05-01"),
+        ),
+    ]
+    table = ThumbnailTable(thumbnails)
+
+    assert len(table) == 3
+    assert repr(list(table)) == repr(thumbnails)
+    assert [x.date for x in table] == [x.date for x in thumbnails]
+    assert thumbnails[0] in table
+    assert table.of_type(moddb.ThumbnailType.addon).names == ["Patch"]
+    assert table.filter("summary", bool).names == ["Age of the Ring"]
+    assert table.sort("date").names == ["Patch", "Edain Mod", "Age of the Ring"]
+    assert table.sort("name", reverse=True)[0].name == "Patch"
+    assert table[1:].column("type") == [moddb.ThumbnailType.mod, moddb.ThumbnailType.addon]
+    assert thumbnails[0] not in table[1:]
+    assert thumbnails[2] in table.of_type(moddb.ThumbnailType.addon)
+
+
+def test_get_table():
+    table = make_page(1).get_table(concurrency=3)
+
+    assert isinstance(table, ThumbnailTable)
+    assert table.names == [f"{page}-{index}" for page in range(1, 7) for index in range(3)]
+
+
+def test_indexed_lookups():
+    results = make_page(1)
+
+    assert results.by_url("/mods/1-2") is results[2]
+    assert results.by_url(f"{moddb.BASE_URL}/mods/1-0") is results[0]
+    assert results.by_id(1) is None
+    assert moddb.utils.get(results, name="1-1") is results[1]
+    assert moddb.utils.get(results, name="1-1", url=results[1].url) is results[1]
+    assert results[1] in results
+
+    new = Thumbnail(name="new", url="/mods/new", type=moddb.ThumbnailType.mod)
+    assert new not in results
+    results.append(new)
+    assert new in results
+    del results[0]
+    assert results.by_url("/mods/1-0") is None
+    results[0] = new
+    assert moddb.utils.get(results, name="1-1") is None
+
+
+def make_comment(id):
+    comment = moddb.boxes.Comment.__new__(moddb.boxes.Comment)
+    comment.id = id
+    return comment
+
+
+def test_comment_list_contains():
+    comments = moddb.boxes.CommentList(
+        results=[make_comment(1), make_comment(2)],
+        url=f"{moddb.BASE_URL}/mods/edain-mod",
+        current_page=1,
+        total_pages=1,
+        total_results=2,
+    )
+
+    assert make_comment(2) in comments
+    assert make_comment(3) not in comments
+    assert comments.by_id(1) is comments[0]
+    assert moddb.utils.get(comments, id=2) is comments[1]
+
+
+def test_indexed_lookup_unhashable():
+    results = make_page(1)
+
+    assert moddb.utils.get(results, name=["1-1"]) is None
+    assert moddb.utils.get(list(results), name=["1-1"]) is None
@@ -0,0 +1,148 @@
+import logging
+
+import pytest
+import requests
+
+import moddb
+from moddb import hooks
+from moddb.errors import Ratelimited
+from moddb.metrics import Histogram, MetricsRegistry
+from moddb.replay import CassetteAdapter
+from moddb.utils import Ratelimit
+
+from .test_sections import PAGE, Model
+
+
+@pytest.fixture
+def metrics():
+    with MetricsRegistry() as metrics:
+        yield metrics
+
+
+@pytest.fixture
+def session(monkeypatch):
+    session = requests.Session()
+    adapter = CassetteAdapter()
+    adapter.add("GET", f"{moddb.BASE_URL}/mods/edain-mod", PAGE)
+    adapter.mount(session)
+    monkeypatch.setattr(moddb, "SESSION", session)
+    yield adapter
+    session.close()
+
+
+def test_hooks():
+    events = []
+
+    def hook(**data):
+        events.append(data)
+
+    hooks.add_hook("page", hook)
+    assert hooks.has_hooks("page")
+    hooks.emit("page", url="a", duration=1)
+    hooks.remove_hook("page", hook)
+    hooks.emit("page", url="b", duration=1)
+
+    assert events == [{"url": "a", "duration": 1}]
+    assert not hooks.has_hooks("page")
+    with pytest.raises(ValueError):
+        hooks.add_hook("unknown", hook)
+
+
+def test_failing_hook_is_logged(caplog):
+    def hook(**data):
+        raise RuntimeError
+
+    hooks.add_hook("cache", hook)
+    try:
+        with caplog.at_level(logging.ERROR, logger="moddb"):
+            hooks.emit("cache", url="a", hit=True)
+    finally:
+        hooks.remove_hook("cache", hook)
+
+    assert "failed on cache event" in caplog.text
+
+
+def test_histogram():
+    histogram = Histogram((1, 2, 4))
+    for value in (0.5, 1.5, 1.5, 3, 10):
+        histogram.observe(value)
+
+    assert list(histogram.cumulative()) == [(1, 1), (2, 3), (4, 4)]
+    assert histogram.count == 5
+    assert histogram.sum == 16.5
+    assert histogram.quantile(0.5) == pytest.approx(1.75)
+    assert histogram.quantile(1) == 4
+    assert Histogram().quantile(0.5) is None
+
+
+def test_request_metrics(metrics, session):
+    moddb.get_page(f"{moddb.BASE_URL}/mods/edain-mod")
+    with pytest.raises(requests.HTTPError):
+        moddb.get_page(f"{moddb.BASE_URL}/mods/missing")
+
+    labels = {"type": "mod", "method": "GET", "source": "library"}
+    assert metrics.counter("requests_total", status="200", **labels) == 1
+    assert metrics.counter("requests_total", status="404", **labels) == 1
+    assert metrics.counter("response_bytes_total", type="mod") == len(PAGE)
+    assert metrics.histogram("request_duration_seconds", **labels).count == 2
+    assert metrics.histogram("page_duration_seconds", type="mod").count == 1
+    assert metrics.counter("soup_bytes_total", parser=moddb.utils.PARSER) == len(PAGE)
+
+
+def test_parse_model_page_metrics(metrics, session):
+    model = moddb.cache._parse_model(f"{moddb.BASE_URL}/mods/edain-mod", Model)
+
+    assert model.id == 6320
+    assert metrics.histogram("page_duration_seconds", type="mod").count == 1
+    assert metrics.histogram("model_duration_seconds", model="Model").count == 1
+
+
+def test_cache_metrics(metrics, session, tmp_path, monkeypatch):
+    cache = moddb.ResponseCache(str(tmp_path / "cache.sqlite"))
+    monkeypatch.setattr(moddb, "RESPONSE_CACHE", cache)
+    for _ in range(3):
+        moddb.get_page(f"{moddb.BASE_URL}/mods/edain-mod")
+
+    cache.close()
+    assert metrics.counter("cache_lookups_total", result="miss") == 1
+    assert metrics.counter("cache_lookups_total", result="hit") == 2
+    assert session.served == 1
+
+
+def test_model_metrics(metrics):
+    Model(moddb.soup(PAGE))
+    with pytest.raises(TypeError):
+        Model(moddb.soup("<html></html>"))
+
+    assert metrics.histogram("model_duration_seconds", model="Model").count == 2
+    assert metrics.counter("model_errors_total", model="Model") == 1
+    assert (
+        metrics.histogram("section_duration_seconds", model="Model", section="summary").count == 1
+    )
+
+
+def test_ratelimit_metrics(metrics, monkeypatch):
+    limiter = Ratelimit(1, 0.1, sleep=1)
+    limiter.call()
+    limiter.call()
+
+    monkeypatch.setattr(moddb.utils, "COMMENT_LIMITER", Ratelimit(1, 60))
+    moddb.utils.COMMENT_LIMITER.call()
+    with pytest.raises(Ratelimited):
+        moddb.utils.COMMENT_LIMITER.call()
+
+    assert metrics.histogram("ratelimit_wait_seconds", limiter="Ratelimit").count == 1
+    assert metrics.counter("ratelimited_total", limiter="COMMENT_LIMITER") == 1
+
+    snapshot = metrics.snapshot()
+    assert {"name": "ratelimited_total", "labels": {"limiter": "COMMENT_LIMITER"}, "value": 1} in (
+        snapshot["counters"]
+    )
+
+
+def test_uninstall(session):
+    metrics = MetricsRegistry()
+    metrics.install()
+    metrics.uninstall()
+    moddb.get_page(f"{moddb.BASE_URL}/mods/edain-mod")
+    assert metrics.snapshot() == {"counters": [], "histograms": []}
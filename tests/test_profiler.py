@@ -0,0 +1,122 @@
+import os
+import time
+
+import pytest
+import requests
+
+import moddb
+from moddb.pages.base import section
+from moddb.profiler import OTHER, ParseProfiler
+from moddb.replay import CassetteAdapter
+
+from .test_sections import PAGE, Model
+
+CASSETTE = os.path.join(
+    os.path.dirname(__file__),
+    "cassettes",
+    "test_parse",
+    "TestParsers.test_parse_games[https---www.moddb.com-games-half-life].yaml",
+)
+
+
+class Outer(Model):
+    def __init__(self, html):
+        super().__init__(html)
+        self._parse_sections(html, "nested")
+
+    @section
+    def summary(self, html):
+        time.sleep(0.05)
+        return "slow"
+
+    @section
+    def nested(self, html):
+        return Model(html)
+
+
+class Broken(Model):
+    @section
+    def summary(self, html):
+        raise AttributeError("summary")
+
+
+def test_field_timings():
+    with ParseProfiler() as profiler:
+        Model(moddb.soup(PAGE))
+        model = Model(moddb.soup(PAGE), lazy=True)
+        model.summary
+
+    Model(moddb.soup(PAGE))
+    assert profiler.field("Model", "summary").histogram.count == 2
+    assert profiler.field("Model", "comments").histogram.count == 1
+    assert profiler.field("Model", OTHER).histogram.count == 2
+    assert profiler.field("Model", "unused") is None
+
+    rows = profiler.report()
+    assert {row["field"] for row in rows} == {"summary", "comments", OTHER}
+    assert sum(row["share"] for row in rows) == pytest.approx(1)
+    assert rows[0]["total"] >= rows[-1]["total"]
+    assert "summary" in profiler.format()
+
+    profiler.reset()
+    assert profiler.report() == []
+
+
+def test_section_errors():
+    with ParseProfiler() as profiler:
+        with pytest.raises(AttributeError):
+            Broken(moddb.soup(PAGE))
+
+        with pytest.raises(TypeError):
+            Model(moddb.soup("<html></html>"))
+
+    assert profiler.field("Broken", "summary").errors == 1
+    assert profiler.field("Broken", OTHER).errors == 0
+    assert profiler.field("Model", OTHER).errors == 1
+
+
+def test_nested_models(tmp_path):
+    with ParseProfiler(0, dump=str(tmp_path)) as profiler:
+        Outer(moddb.soup(PAGE))
+
+    assert profiler.field("Outer", "summary").histogram.sum >= 0.05
+    assert profiler.field("Outer", OTHER).histogram.sum < 0.025
+    assert profiler.field("Model", "summary").histogram.count == 1
+    assert profiler.field("Model", OTHER).histogram.count == 1
+
+    inner, outer = profiler.slow
+    assert (inner["model"], outer["model"]) == ("Model", "Outer")
+    assert set(outer["sections"]) == {"comments", "summary", "nested"}
+    assert outer["path"] is not None and outer["path"] != inner["path"]
+    with open(outer["path"]) as f:
+        assert f.read() == PAGE
+    assert not profiler._local.frames
+
+
+def test_budget_dump(tmp_path):
+    with ParseProfiler(0, dump=str(tmp_path / "slow")) as profiler:
+        Model(moddb.soup(PAGE))
+
+    (slow,) = profiler.slow
+    assert slow["model"] == "Model"
+    assert set(slow["sections"]) == {"comments", "summary"}
+    with open(slow["path"]) as f:
+        assert f.read() == PAGE
+
+    with ParseProfiler(60) as profiler:
+        Model(moddb.soup(PAGE))
+
+    assert profiler.slow == []
+
+
+def test_page_fields(monkeypatch):
+    session = requests.Session()
+    CassetteAdapter.from_cassettes(CASSETTE).mount(session)
+    monkeypatch.setattr(moddb, "SESSION", session)
+
+    with ParseProfiler() as profiler:
+        moddb.parse_page(f"{moddb.BASE_URL}/games/half-life")
+
+    session.close()
+    fields = {row["field"] for row in profiler.report() if row["model"] == "Game"}
+    assert {"profile", "stats", "style", "suggestions", "medias", "comments", OTHER} <= fields
@@ -0,0 +1,63 @@
+import requests
+
+import moddb
+from moddb import prometheus
+from moddb.metrics import MetricsRegistry
+
+
+def make_registry():
+    registry = MetricsRegistry(buckets=(0.1, 1))
+    registry.inc("requests_total", type="mod", method="GET", status="200", source="library")
+    registry.inc("ratelimited_total", limiter='GLOBAL_"LIMITER"')
+    registry.inc("cache_lookups_total", 3, result="hit")
+    registry.inc("cache_lookups_total", result="miss")
+    registry.observe("ratelimit_wait_seconds", 0.5, limiter="GLOBAL_THROTLE")
+    registry.observe("ratelimit_wait_seconds", 2, limiter="GLOBAL_THROTLE")
+    return registry
+
+
+def test_render():
+    lines = prometheus.render(make_registry()).splitlines()
+
+    assert "# TYPE moddb_requests_total counter" in lines
+    assert 'moddb_requests_total{method="GET",source="library",status="200",type="mod"} 1' in lines
+    assert 'moddb_ratelimited_total{limiter="GLOBAL_\\"LIMITER\\""} 1' in lines
+    assert "moddb_cache_hit_ratio 0.75" in lines
+
+    assert "# TYPE moddb_ratelimit_wait_seconds histogram" in lines
+    assert 'moddb_ratelimit_wait_seconds_bucket{limiter="GLOBAL_THROTLE",le="0.1"} 0' in lines
+    assert 'moddb_ratelimit_wait_seconds_bucket{limiter="GLOBAL_THROTLE",le="1.0"} 1' in lines
+    assert 'moddb_ratelimit_wait_seconds_bucket{limiter="GLOBAL_THROTLE",le="+Inf"} 2' in lines
+    assert 'moddb_ratelimit_wait_seconds_sum{limiter="GLOBAL_THROTLE"} 2.5' in lines
+    assert 'moddb_ratelimit_wait_seconds_count{limiter="GLOBAL_THROTLE"} 2' in lines
+
+
+def test_render_caches(monkeypatch):
+    cache = moddb.ModelCache(10)
+    cache.get("https://www.moddb.com/mods/edain-mod")
+    monkeypatch.setattr(moddb, "MODEL_CACHE", cache)
+
+    lines = prometheus.render(MetricsRegistry()).splitlines()
+    assert "moddb_model_cache_misses_total 1" in lines
+    assert "moddb_model_cache_capacity 10" in lines
+    assert "moddb_model_cache_hit_ratio 0.0" in lines
+
+
+def test_write(tmp_path):
+    path = tmp_path / "moddb.prom"
+    prometheus.write(make_registry(), str(path))
+    assert path.read_text() == prometheus.render(make_registry())
+
+
+def test_http_server():
+    server = prometheus.start_http_server(make_registry(), 0)
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}"
+        resp = requests.get(f"{url}/metrics")
+        assert resp.status_code == 200
+        assert resp.headers["Content-Type"] == prometheus.CONTENT_TYPE
+        assert "moddb_cache_hit_ratio 0.75" in resp.text
+        assert requests.get(f"{url}/other").status_code == 404
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -1,8 +1,10 @@
+import asyncio
+import concurrent.futures
 import time
 import pytest
 
 from moddb.errors import Ratelimited
-from moddb.utils import Ratelimit, ratelimit
+from moddb.utils import Ratelimit, SharedTokenBucket, TokenBucket, ratelimit
 
 
 @pytest.mark.parametrize(["rate", "per"], ((1, 5), (40, 300)))
@@ -61,3 +63,192 @@ def test_decorator():
 
     for _ in range(6):
         ratelimited_function()
+
+
+def test_token_bucket_spreads_calls():
+    limiter = TokenBucket(5, 1)
+    limiter.call()
+
+    assert 0 < limiter.time_until_available() <= 0.2
+    with pytest.raises(Ratelimited):
+        limiter.call()
+
+    time.sleep(limiter.time_until_available())
+    limiter.call()
+
+
+def test_token_bucket_burst():
+    limiter = TokenBucket(2, 10, burst=3)
+    for _ in range(3):
+        limiter.call()
+
+    with pytest.raises(Ratelimited) as e:
+        limiter.call()
+
+    assert 4.9 < e.value.remaining <= 5
+
+
+def test_token_bucket_sleep():
+    limiter = TokenBucket(10, 1, sleep=1)
+    start = time.monotonic()
+    for _ in range(6):
+        limiter.call()
+
+    assert time.monotonic() - start >= 0.5
+    assert limiter.time_until_available() > 0
+
+    limiter.reset()
+    assert limiter.time_until_available() == 0
+
+
+def test_ratelimit_time_until_available(freezer):
+    limiter = Ratelimit(2, 10)
+    limiter.call()
+    assert limiter.time_until_available() == 0
+
+    limiter.call()
+    freezer.tick(4)
+    assert limiter.time_until_available() == pytest.approx(6)
+
+    freezer.tick(7)
+    assert limiter.time_until_available() == 0
+
+
+def test_swap_global_limiter(monkeypatch):
+    import moddb.utils
+
+    limiter = TokenBucket(1, 60)
+
+    @ratelimit("GLOBAL_LIMITER")
+    def ratelimited_function():
+        return "test"
+
+    monkeypatch.setattr(moddb.utils, "GLOBAL_LIMITER", limiter)
+    assert ratelimited_function() == "test"
+
+    with pytest.raises(Ratelimited):
+        ratelimited_function()
+
+
+@pytest.mark.parametrize("limiter_class", (Ratelimit, TokenBucket))
+def test_threaded_calls_respect_rate(limiter_class):
+    if limiter_class is TokenBucket:
+        limiter = TokenBucket(1, 600, burst=100)
+    else:
+        limiter = Ratelimit(100, 600)
+
+    def call():
+        try:
+            limiter.call()
+            return True
+        except Ratelimited:
+            return False
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: call(), range(400)))
+
+    assert results.count(True) == 100
+
+
+def test_async_acquire_does_not_block():
+    limiter = TokenBucket(10, 1, sleep=1)
+
+    @ratelimit(limiter)
+    async def ratelimited_function():
+        return "test"
+
+    async def main():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        results = await asyncio.gather(*(ratelimited_function() for _ in range(5)))
+        task.cancel()
+        return results, ticks
+
+    results, ticks = asyncio.run(main())
+    assert results == ["test"] * 5
+    assert ticks > 10
+
+
+def _drain_shared(path):
+    limiter = SharedTokenBucket(1, 600, burst=10, path=path, key="test")
+    count = 0
+    for _ in range(10):
+        try:
+            limiter.call()
+            count += 1
+        except Ratelimited:
+            pass
+
+    return count
+
+
+def test_shared_token_bucket_across_processes(tmp_path):
+    path = str(tmp_path / "ratelimits.sqlite")
+    with concurrent.futures.ProcessPoolExecutor(max_workers=3) as executor:
+        counts = list(executor.map(_drain_shared, [path] * 3))
+
+    assert sum(counts) == 10
+
+    limiter = SharedTokenBucket(1, 600, burst=10, path=path, key="test")
+    assert limiter.time_until_available() > 0
+    limiter.reset()
+    assert limiter.time_until_available() == 0
+
+
+def test_threaded_sleeping_calls_respect_rate():
+    limiter = Ratelimit(2, 1, sleep=5)
+    start = time.monotonic()
+
+    def call(_):
+        limiter.call()
+        return time.monotonic() - start
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        times = sorted(executor.map(call, range(8)))
+
+    # fixed windows of one second, no more than two calls can start in any of them
+    assert all(later - earlier >= 0.95 for earlier, later in zip(times, times[2:]))
+    assert times[-1] < 4.5
+
+
+def test_async_acquire_shared_bucket_uses_thread(tmp_path, monkeypatch):
+    limiter = SharedTokenBucket(10, 1, sleep=1, path=str(tmp_path / "ratelimits.sqlite"))
+    threads = []
+
+    async def to_thread(func):
+        threads.append(func)
+        return func()
+
+    monkeypatch.setattr(asyncio, "to_thread", to_thread)
+    asyncio.run(limiter.acquire())
+    assert len(threads) == 1
+
+
+def test_ratelimit_clock_set_back(freezer):
+    limiter = Ratelimit(2, 10, sleep=1)
+    limiter.call()
+
+    freezer.tick(-3600)
+    assert limiter.time_until_available() == 0
+    limiter.call()
+    limiter.call()
+    assert limiter.call_count == 2
+
+
+def test_shared_token_bucket_clock_set_back(tmp_path, freezer):
+    limiter = SharedTokenBucket(1, 600, path=str(tmp_path / "ratelimits.sqlite"))
+    limiter.call()
+    assert limiter.time_until_available() > 0
+
+    freezer.tick(-3600)
+    assert limiter.time_until_available() == 0
+    limiter.call()
+    with pytest.raises(Ratelimited):
+        limiter.call()
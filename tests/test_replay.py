@@ -0,0 +1,134 @@
+import os
+
+import pytest
+import requests
+
+import moddb
+from moddb.replay import CassetteAdapter
+
+CASSETTES = os.path.join(os.path.dirname(__file__), "cassettes")
+PAGE = "<html><head></head><body>{}</body></html>"
+
+CASSETTE = """interactions:
+- request:
+    body: null
+    headers: {}
+    method: GET
+    uri: https://www.moddb.com/mods/edain-mod?b=2&a=1
+  response:
+    body:
+      string: '<html><body>first</body></html>'
+    headers:
+      Content-Type:
+      - text/html; charset=utf-8
+      Content-Encoding:
+      - gzip
+    status:
+      code: 200
+      message: OK
+- request:
+    body: null
+    headers: {}
+    method: GET
+    uri: https://www.moddb.com/mods/edain-mod?a=1&b=2
+  response:
+    body:
+      string: '<html><body>second</body></html>'
+    headers:
+      Content-Type:
+      - text/html; charset=utf-8
+    status:
+      code: 200
+      message: OK
+version: 1
+"""
+
+
+@pytest.fixture
+def session():
+    session = requests.Session()
+    yield session
+    session.close()
+
+
+def test_from_cassettes(tmp_path, session):
+    path = tmp_path / "cassette.yaml"
+    path.write_text(CASSETTE)
+    adapter = CassetteAdapter.from_cassettes(str(tmp_path))
+    adapter.mount(session)
+
+    url = f"{moddb.BASE_URL}/mods/edain-mod"
+    bodies = [session.get(url, params={"a": 1, "b": 2}).text for _ in range(3)]
+    assert bodies == [
+        "<html><body>first</body></html>",
+        "<html><body>second</body></html>",
+        "<html><body>first</body></html>",
+    ]
+
+    resp = session.get(url, params={"a": 1, "b": 2})
+    assert "Content-Encoding" not in resp.headers
+    assert resp.encoding == "utf-8"
+
+    missing = session.get(f"{moddb.BASE_URL}/mods/missing")
+    assert missing.status_code == 404
+    assert adapter.misses == [f"{moddb.BASE_URL}/mods/missing"]
+    assert adapter.served == 4
+
+
+def test_from_directory(tmp_path, session):
+    (tmp_path / "mods").mkdir()
+    (tmp_path / "mods" / "edain-mod.html").write_text(PAGE.format("edain"))
+    (tmp_path / "mods" / "index.html").write_text(PAGE.format("mods"))
+    CassetteAdapter.from_directory(str(tmp_path)).mount(session)
+
+    assert "edain" in session.get(f"{moddb.BASE_URL}/mods/edain-mod").text
+    assert "mods" in session.get(f"{moddb.BASE_URL}/mods/").text
+
+
+def test_injected_failures(session):
+    adapter = CassetteAdapter(error_rate=1)
+    adapter.add("GET", moddb.BASE_URL, PAGE.format("home"))
+    adapter.mount(session)
+    assert session.get(moddb.BASE_URL).status_code == 503
+
+    adapter.error_status = None
+    with pytest.raises(requests.ConnectionError):
+        session.get(moddb.BASE_URL)
+
+    assert adapter.errors == 2
+    assert adapter.served == 0
+
+    with pytest.raises(ValueError):
+        CassetteAdapter(error_rate=2)
+
+
+def test_latency(session):
+    adapter = CassetteAdapter(latency=(0.05, 0.1), seed=1)
+    adapter.add("GET", moddb.BASE_URL, PAGE.format("home"))
+    adapter.mount(session)
+
+    resp = session.get(moddb.BASE_URL)
+    assert resp.status_code == 200
+    assert resp.elapsed.total_seconds() >= 0.05
+
+
+def test_parse_page_end_to_end(monkeypatch, session):
+    cassette = "TestParsers.test_parse_games[https---www.moddb.com-games-half-life].yaml"
+    adapter = CassetteAdapter.from_cassettes(os.path.join(CASSETTES, "test_parse", cassette))
+    adapter.mount(session)
+    monkeypatch.setattr(moddb, "SESSION", session)
+
+    game = moddb.parse_page(f"{moddb.BASE_URL}/games/half-life")
+    assert game.name == "Half-Life"
+    assert not adapter.misses
+
+
+def test_streamed_download(session):
+    adapter = CassetteAdapter()
+    adapter.add("GET", f"{moddb.BASE_URL}/downloads/mirror/1", b"\x00" * 1000)
+    adapter.mount(session)
+
+    with session.get(f"{moddb.BASE_URL}/downloads/mirror/1", stream=True) as resp:
+        chunks = list(resp.iter_content(chunk_size=300))
+
+    assert [len(chunk) for chunk in chunks] == [300, 300, 300, 100]
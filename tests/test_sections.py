@@ -0,0 +1,173 @@
+import gc
+
+import pytest
+from bs4 import BeautifulSoup
+
+import moddb
+from moddb.pages.base import BaseMetaClass, section
+from moddb.utils import soup
+
+PAGE = """<html><head><meta property="og:url" content="https://www.moddb.com/mods/edain-mod"></head>
+<body><a itemprop="mainEntityOfPage" href="/mods/edain-mod">Edain Mod</a>
+<a class="reporticon" href="/reports/add?siteareaid=6320">Report</a>
+<div id="summary">The Edain Mod</div></body></html>"""
+
+
+class Response:
+    def __init__(self, text):
+        self.text = text
+        self.status_code = 200
+        self.headers = {}
+
+
+class Model(BaseMetaClass):
+    def __init__(self, html, *, lazy=False, fields=None):
+        self.calls = []
+        super().__init__(html, lazy=lazy, fields=fields)
+        self._parse_sections(html, "summary")
+
+    @section
+    def summary(self, html):
+        self.calls.append("summary")
+        return html.find("div", id="summary").string
+
+    @section
+    def unused(self, html):
+        return "never parsed"
+
+
+def test_eager_sections():
+    model = Model(soup(PAGE))
+
+    assert model.calls == ["summary"]
+    assert model.summary == "The Edain Mod"
+    assert len(model.comments) == 0
+    assert model.calls == ["summary"]
+    assert model.id == 6320
+
+
+def test_lazy_sections():
+    model = Model(soup(PAGE), lazy=True)
+
+    assert model.calls == []
+    assert model._pending == {"summary", "comments"}
+    assert model.summary == "The Edain Mod"
+    assert model.summary == "The Edain Mod"
+    assert model.calls == ["summary"]
+    assert model._pending == {"comments"}
+    assert len(model.comments) == 0
+    assert not model._pending
+
+
+@pytest.mark.parametrize("lazy", [True, False])
+def test_unparsed_section(lazy):
+    model = Model(soup(PAGE), lazy=lazy)
+
+    with pytest.raises(AttributeError):
+        model.unused
+
+    assert not hasattr(model, "unused")
+    assert isinstance(Model.summary, section)
+
+
+def test_fields():
+    model = Model(soup(PAGE), fields={"comments"})
+
+    assert model.calls == []
+    assert model._pending == {"summary"}
+    assert "comments" in vars(model)
+    assert model.summary == "The Edain Mod"
+
+
+def test_unknown_fields():
+    with pytest.raises(ValueError):
+        Model(soup(PAGE), fields={"summary", "id"})
+
+
+def test_parse_page_fields(monkeypatch):
+    monkeypatch.setattr(moddb.cache, "request", lambda req: Response(PAGE))
+    monkeypatch.setattr(moddb, "Mod", Model)
+
+    model = moddb.parse_page(f"{moddb.BASE_URL}/mods/edain-mod", fields=["summary"])
+    assert model.calls == ["summary"]
+    assert model._pending == {"comments"}
+
+    thumbnail = moddb.boxes.Thumbnail(
+        url=f"{moddb.BASE_URL}/mods/edain-mod", name="Edain Mod", type=moddb.ThumbnailType.mod
+    )
+    assert thumbnail.parse(fields=[])._pending == {"summary", "comments"}
+
+
+def test_release():
+    html = soup(PAGE)
+    model = Model(html)
+    name = html.find("a", itemprop="mainEntityOfPage").string
+    model.release()
+
+    assert model._html is None
+    assert name.decomposed
+    assert model.name == "Edain Mod"
+    assert model.summary == "The Edain Mod"
+
+
+def test_lean_refetch(monkeypatch):
+    pages = []
+
+    def get_page(url):
+        pages.append(url)
+        return soup(PAGE)
+
+    monkeypatch.setattr(moddb.cache, "request", lambda req: Response(PAGE))
+    monkeypatch.setattr(moddb.pages.base, "get_page", get_page)
+    monkeypatch.setattr(moddb, "Mod", Model)
+
+    model = moddb.parse_page(f"{moddb.BASE_URL}/mods/edain-mod", lean=True)
+    assert model._html is None
+    assert model.calls == ["summary"]
+    assert pages == []
+
+    model = moddb.parse_page(f"{moddb.BASE_URL}/mods/edain-mod", fields=[], lean=True)
+    assert model.summary == "The Edain Mod"
+    assert len(model.comments) == 0
+    assert pages == ["https://www.moddb.com/mods/edain-mod"]
+    assert not model._pending
+
+
+MEMBER_PAGE = """<html><head><meta property="og:title" content="Usually Dead">
+<meta property="og:url" content="https://www.moddb.com/members/usually-dead"></head><body>
+<div id="summary">Edain</div><script>var a = 1;</script>
+<script>x = "https://www.moddb.com/html/scripts/autocomplete.php?a=mentions&p=home&l=6&u=666";
+imagebox[0] = new Array(0, "/members/usually-dead/images/edain#imagebox", "https://media.moddb.com/e.jpg");
+</script></body></html>"""
+
+
+def test_regex_fallbacks_use_source(monkeypatch):
+    html = soup(MEMBER_PAGE)
+    assert moddb.utils.get_source(html) is MEMBER_PAGE
+    assert html.source is None
+
+    # the tree must not be serialized back to text while the model is built
+    with monkeypatch.context() as m:
+        m.setattr(type(html), "__str__", lambda self: pytest.fail("serialized"))
+        model = Model(html)
+
+    assert model.id == 666
+    assert moddb.utils.get_source(html) is not MEMBER_PAGE
+
+    for tree in (soup(MEMBER_PAGE), BeautifulSoup(MEMBER_PAGE, "html.parser")):
+        medias = model._get_media(tree)
+        assert [media.name for media in medias] == ["edain"]
+        assert medias[0].image == "https://media.moddb.com/e.jpg"
+
+
+def test_get_source_without_source():
+    html = soup(MEMBER_PAGE)
+    moddb.utils.decompose(html)
+    assert moddb.utils.get_source(html) is not MEMBER_PAGE
+
+    html = BeautifulSoup(MEMBER_PAGE, "html.parser")
+    assert "autocomplete.php" in moddb.utils.get_source(html)
+
+    key = id(soup(MEMBER_PAGE))
+    gc.collect()
+    assert key not in moddb.utils._SOURCES
@@ -0,0 +1,132 @@
+import datetime
+import logging
+
+import pytest
+
+import moddb
+from moddb import decoders
+from moddb.utils import Query, QueryIndex, soup
+
+PAGE = "<html><head><title>Edain</title></head><body><p class='a'>Mod<br>page</p></body></html>"
+
+
+@pytest.mark.parametrize("parser", ["html.parser", "lxml"])
+def test_soup_parser(parser):
+    if parser != "html.parser":
+        pytest.importorskip(parser)
+
+    html = soup(PAGE, parser=parser)
+    assert html.title.string == "Edain"
+    assert html.find("p", class_="a").get_text() == "Modpage"
+
+
+def test_soup_global_parser(monkeypatch):
+    pytest.importorskip("lxml")
+    monkeypatch.setattr(moddb.utils, "PARSER", "lxml")
+
+    assert soup(PAGE).builder.NAME == "lxml"
+    assert soup(PAGE, parser="html.parser").builder.NAME == "html.parser"
+
+
+def test_soup_missing_parser(caplog):
+    with caplog.at_level(logging.WARNING, logger="moddb"):
+        html = soup(PAGE, parser="not-a-parser")
+
+    assert html.builder.NAME == "html.parser"
+    assert "not-a-parser" in caplog.text
+
+
+def make_comments():
+    comments = [moddb.boxes.MissingComment(0)]
+    for index, (name, karma) in enumerate([("a", 1), ("b", 2), ("a", 2), ("a", 2)]):
+        comment = moddb.boxes.Comment.__new__(moddb.boxes.Comment)
+        comment.id = index
+        comment.karma = karma
+        comment.author = moddb.boxes.CommentAuthor(
+            name=name, url=f"/members/{name}", type=moddb.ThumbnailType.member
+        )
+        comments.append(comment)
+
+    return comments
+
+
+def test_query():
+    comments = make_comments()
+    query = Query(author__name="a", karma=2)
+
+    assert query.first(comments).id == 2
+    assert [x.id for x in query.all(comments)] == [2, 3]
+    assert Query(author__name="c").first(comments) is None
+    assert moddb.utils.get(comments, author__name="b").id == 1
+
+
+def test_query_index():
+    comments = make_comments()
+    index = QueryIndex(comments, "author__name", "karma")
+
+    assert [x.id for x in index.all(author__name="a", karma=2)] == [2, 3]
+    assert index.first(karma=1, author__name="a").id == 0
+    assert index.first(author__name="b", karma=1) is None
+    with pytest.raises(ValueError):
+        index.first(author__name="a")
+
+
+@pytest.mark.parametrize(
+    "url, page_type",
+    [
+        ("https://www.moddb.com/mods/edain-mod", moddb.ThumbnailType.mod),
+        ("https://www.moddb.com/mods/edain-mod/addons/patch", moddb.ThumbnailType.addon),
+        ("https://www.moddb.com/mods/edain-mod/news/release", moddb.ThumbnailType.article),
+        ("https://www.moddb.com/mods/edain-mod/audio/theme", moddb.ThumbnailType.media),
+        ("https://www.moddb.com/games/battle-for-middle-earth/page/2", moddb.ThumbnailType.game),
+        ("https://www.moddb.com/members/usually-dead", moddb.ThumbnailType.member),
+    ],
+)
+def test_get_page_type(url, page_type):
+    assert moddb.utils.get_page_type(url) is page_type
+    assert moddb.utils.get_page_type(url) is page_type
+
+
+def test_get_search_category():
+    category = moddb.utils.get_search_category
+    assert category("https://www.moddb.com/mods/edain-mod") is moddb.SearchCategory.mods
+    assert category("https://www.moddb.com/members/usually-dead") is moddb.SearchCategory.members
+
+
+def test_get_without_attributes():
+    comments = make_comments()
+
+    assert moddb.utils.get(comments) is comments[0]
+    assert Query().all(comments) == comments
+    assert moddb.utils.get([]) is None
+
+
+@pytest.mark.parametrize(
+    "string, expected",
+    [
+        (
+            "2020-01-02T10:00:00+01:00",
+            datetime.datetime(
+                2020, 1, 2, 10, tzinfo=datetime.timezone(datetime.timedelta(hours=1))
+            ),
+        ),
+        ("2020-01-02", datetime.datetime(2020, 1, 2)),
+        ("2020-01", datetime.datetime(2020, 1, 1)),
+    ],
+)
+def test_parse_date(string, expected):
+    assert decoders.parse_date(string) == expected
+    assert moddb.utils.get_date(string) == expected
+
+
+def test_parse_numbers():
+    assert decoders.parse_int("1,234") == 1234
+    assert decoders.parse_count("1,234 members") == 1234
+    assert decoders.parse_count(" 1 member ") == 1
+    assert decoders.parse_views("1,234 (5 today)") == (1234, 5)
+    assert decoders.parse_rank("12 of 1,234") == (12, 1234)
+    assert decoders.parse_abbreviated("1.2k") == 1200
+    assert decoders.parse_abbreviated("3M") == 3_000_000
+    assert decoders.parse_abbreviated("42") == 42
+    assert decoders.parse_list_stats("Mods (31 - 60 of 1,234)") == (60, 1234)
+    assert decoders.parse_list_stats("Mods") is None